@@ -1,7 +1,7 @@
 from django import forms
 from django.core.exceptions import ValidationError
 from .models import Producer, Farm, Culture
-from .utils import validate_cpf_cnpj
+from .utils import document_key, validate_cpf_cnpj
 
 class ProducerForm(forms.ModelForm):
     class Meta:
@@ -22,6 +22,14 @@ class ProducerForm(forms.ModelForm):
         cpf_cnpj = self.cleaned_data['cpf_cnpj']
         if not validate_cpf_cnpj(cpf_cnpj):
             raise ValidationError('CPF/CNPJ inválido')
+        # A unicidade está em (document_number, document_type), campos não
+        # editáveis que a validação do ModelForm ignora
+        document_number, document_type = document_key(cpf_cnpj)
+        duplicate = Producer.objects.filter(
+            document_number=document_number, document_type=document_type
+        ).exclude(pk=self.instance.pk)
+        if duplicate.exists():
+            raise ValidationError('CPF/CNPJ já cadastrado')
         return cpf_cnpj
 
 class FarmForm(forms.ModelForm):
@@ -38,6 +46,10 @@ class FarmForm(forms.ModelForm):
             'vegetation_area': forms.NumberInput(attrs={'class': 'form-control', 'step': '0.01'}),
         }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['producer'].queryset = Producer.objects.for_choices()
+    
     def clean(self):
         cleaned_data = super().clean()
         total_area = cleaned_data.get('total_area')
@@ -61,4 +73,8 @@ class CultureForm(forms.ModelForm):
                 'class': 'form-control',
                 'placeholder': 'Safra 2024'
             })
-        }
\ No newline at end of file
+        }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['farm'].queryset = Farm.objects.for_choices()
\ No newline at end of file
@@ -0,0 +1,83 @@
+from django.db import connections, models
+from django.db.models import BooleanField, Count, FloatField, Func, Sum, Value
+from django.db.models.functions import Lower
+from .utils import normalize_name
+
+class Unaccent(Func):
+    # f_unaccent existe no PostgreSQL pela migração 0006 da API e é
+    # registrada no SQLite em signals.register_sqlite_functions
+    function = 'f_unaccent'
+
+class WordSimilar(Func):
+    # termo <% nome: filtro do pg_trgm atendido pelo índice GIN ix_producers_name_trgm
+    template = '%(expressions)s'
+    arg_joiner = ' <%% '
+    output_field = BooleanField()
+
+class WordSimilarity(Func):
+    function = 'word_similarity'
+    output_field = FloatField()
+
+class ProducerQuerySet(models.QuerySet):
+    def with_farm_count(self):
+        return self.annotate(farm_count=Count('farms'))
+    
+    def for_list(self):
+        # Colunas exibidas em producer_list.html; farm_count vem no mesmo SELECT
+        return self.with_farm_count().only('id', 'name', 'cpf_cnpj', 'created_at')
+    
+    def for_choices(self):
+        # Selects de formulário: __str__ só usa o nome
+        return self.only('id', 'name')
+    
+    def search(self, query):
+        # Busca por nome sem acentos/maiúsculas, com a mesma expressão
+        # indexada na API; no SQLite cada palavra deve estar contida no nome
+        words = normalize_name(query).split()
+        if not words:
+            return self.none()
+        name = Unaccent(Lower('name'))
+        if connections[self.db].vendor == 'postgresql':
+            term = Unaccent(Lower(Value(query)))
+            return (
+                self.filter(WordSimilar(term, name))
+                .annotate(score=WordSimilarity(term, name))
+                .order_by('-score', 'name', 'id')
+            )
+        queryset = self.alias(search_name=name)
+        for word in words:
+            queryset = queryset.filter(search_name__contains=word)
+        return queryset.order_by('name', 'id')
+
+class FarmQuerySet(models.QuerySet):
+    def with_producer(self):
+        # Farm.__str__ usa producer.name; o JOIN evita uma consulta por fazenda
+        return self.select_related('producer')
+    
+    def for_list(self):
+        return self.with_producer().only(
+            'id', 'name', 'city', 'state', 'total_area', 'arable_area', 'vegetation_area',
+            'producer__id', 'producer__name'
+        )
+    
+    def for_choices(self):
+        return self.with_producer().only('id', 'name', 'producer__id', 'producer__name').order_by('name')
+    
+    def with_totals(self):
+        totals = self.aggregate(
+            total_farms=Count('id'),
+            total_area=Sum('total_area'),
+            total_arable=Sum('arable_area'),
+            total_vegetation=Sum('vegetation_area'),
+        )
+        return {key: value or 0 for key, value in totals.items()}
+    
+    def by_state(self):
+        return list(
+            self.values('state')
+            .annotate(count=Count('id'), total_area=Sum('total_area'))
+            .order_by('state')
+        )
+
+ProducerManager = models.Manager.from_queryset(ProducerQuerySet)
+FarmManager = models.Manager.from_queryset(FarmQuerySet)
@@ -1,25 +1,48 @@
-from django.db import models
+from django.db import models, transaction
+from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from decimal import Decimal
-import uuid
+from .managers import FarmManager, ProducerManager
+from .utils import document_key, uuid7
 
 class Producer(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     cpf_cnpj = models.CharField(
         max_length=18, 
-        unique=True,
-        validators=[RegexValidator(r'^\d{3}\.\d{3}\.\d{3}-\d{2}$|^\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})]
+        validators=[RegexValidator(r'^\d{3}\.\d{3}\.\d{3}-\d{2}$|^\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}$')]
     )
+    # Chave canônica, compartilhada com a API: a unicidade vale para o
+    # documento, independente da formatação de cpf_cnpj
+    document_number = models.BigIntegerField(editable=False)
+    document_type = models.CharField(max_length=4, editable=False)
     name = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ProducerManager()
+    
     def __str__(self):
         return self.name
     
+    def save(self, *args, **kwargs):
+        document = document_key(self.cpf_cnpj)
+        if document is None:
+            raise ValidationError('CPF/CNPJ inválido')
+        self.document_number, self.document_type = document
+        super().save(*args, **kwargs)
+    
     class Meta:
         db_table = 'producers'
         ordering = ['name']
+        # Mesmos índices de rural_producer_management/app/models
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='ix_producers_created_at_id'),
+            # ix_producers_name_trgm (GIN sobre f_unaccent(lower(name))) é
+            # criado pela migração 0006 da API, junto com f_unaccent
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['document_number', 'document_type'], name='uq_producers_document'),
+        ]
 
 class Farm(models.Model):
     STATES = [
@@ -32,8 +55,9 @@ class Farm(models.Model):
         ('SP', 'São Paulo'), ('SE', 'Sergipe'), ('TO', 'Tocantins')
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    producer = models.ForeignKey(Producer, on_delete=models.CASCADE, related_name='farms')
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # Índice da FK coberto por ix_farms_producer_id_state
+    producer = models.ForeignKey(Producer, on_delete=models.CASCADE, related_name='farms', db_index=False)
     name = models.CharField(max_length=255)
     city = models.CharField(max_length=100)
     state = models.CharField(max_length=2, choices=STATES)
@@ -43,6 +67,8 @@ class Farm(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = FarmManager()
+    
     def clean(self):
         if self.arable_area + self.vegetation_area > self.total_area:
             raise models.ValidationError('Soma das áreas não pode exceder área total')
@@ -50,8 +76,20 @@ class Farm(models.Model):
     def __str__(self):
         return f"{self.name} - {self.producer.name}"
     
+    def save(self, *args, **kwargs):
+        # Uma transação do pre_save ao post_save: o lock da leitura dos
+        # valores anteriores (signals.py) vale até dashboard_stats ser ajustado
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+    
     class Meta:
         db_table = 'farms'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='ix_farms_created_at_id'),
+            models.Index(fields=['producer', 'state'], name='ix_farms_producer_id_state'),
+            models.Index(fields=['state', 'created_at', 'id'], name='ix_farms_state_created_at_id'),
+            models.Index(fields=['state', 'city'], name='ix_farms_state_city', opclasses=['', 'varchar_pattern_ops']),
+        ]
 
 class Culture(models.Model):
     CULTURE_CHOICES = [
@@ -60,8 +98,9 @@ class Culture(models.Model):
         ('TRIGO', 'Trigo'), ('OUTROS', 'Outros')
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    farm = models.ForeignKey(Farm, on_delete=models.CASCADE, related_name='cultures')
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # Índice da FK coberto pelo unique_together (farm é a coluna líder)
+    farm = models.ForeignKey(Farm, on_delete=models.CASCADE, related_name='cultures', db_index=False)
     name = models.CharField(max_length=100, choices=CULTURE_CHOICES)
     harvest_year = models.CharField(max_length=9)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -69,6 +108,34 @@ class Culture(models.Model):
     def __str__(self):
         return f"{self.name} - {self.harvest_year}"
     
+    def save(self, *args, **kwargs):
+        # Ver Farm.save
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+    
     class Meta:
         db_table = 'cultures'
-        unique_together = ['farm', 'name', 'harvest_year']
\ No newline at end of file
+        unique_together = ['farm', 'name', 'harvest_year']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='ix_cultures_created_at_id'),
+            models.Index(fields=['name', 'harvest_year'], name='ix_cultures_name_harvest_year'),
+            models.Index(fields=['harvest_year', 'farm'], name='ix_cultures_harvest_farm_id'),
+        ]
+
+class DashboardStat(models.Model):
+    # Read model do dashboard, mantido pela API FastAPI e pelos signals
+    KIND_STATE = 'state'
+    KIND_CULTURE = 'culture'
+    
+    id = models.AutoField(primary_key=True)
+    kind = models.CharField(max_length=20)
+    key = models.CharField(max_length=100)
+    count = models.BigIntegerField(default=0)
+    total_area = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    arable_area = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    vegetation_area = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'dashboard_stats'
+        unique_together = ['kind', 'key']
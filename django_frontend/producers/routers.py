@@ -0,0 +1,77 @@
+import time
+from asgiref.local import Local
+from django.conf import settings
+
+REPLICA = 'replica'
+READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# Instante (epoch) até o qual as leituras do cliente vão para o primário
+PRIMARY_PIN_COOKIE = 'primary_pin'
+
+# Estado por requisição (thread ou task), como as conexões do Django
+_state = Local()
+
+def pin_to_primary(pinned=True):
+    _state.pinned = pinned
+
+def pinned_to_primary():
+    return getattr(_state, 'pinned', False)
+
+class PrimaryReplicaRouter:
+    # Com DATABASES['replica'] configurado, leituras do app producers vão
+    # para a réplica e escritas para o default. Depois da primeira escrita
+    # a requisição fica presa ao primário até o fim (read-your-writes).
+    app_labels = {'producers'}
+    
+    def __init__(self):
+        self.replica = REPLICA if REPLICA in settings.DATABASES else None
+    
+    def db_for_read(self, model, **hints):
+        if self.replica and model._meta.app_label in self.app_labels and not pinned_to_primary():
+            return self.replica
+        return None
+    
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label in self.app_labels:
+            pin_to_primary()
+            return 'default'
+        return None
+    
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplica e primário têm os mesmos dados
+        if {obj1._state.db, obj2._state.db} <= {'default', REPLICA}:
+            return True
+        return None
+    
+    def allow_migrate(self, db, app_label, **hints):
+        if db == REPLICA:
+            return False
+        return None
+
+def _pinned_by_cookie(request):
+    try:
+        return float(request.COOKIES.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+class ReadReplicaMiddleware:
+    # Só GET/HEAD/OPTIONS leem da réplica: num POST, a validação do
+    # formulário (unicidade) e os signals leem do primário desde o início.
+    # Uma escrita bem sucedida devolve o cookie PRIMARY_PIN_COOKIE, e as
+    # leituras seguintes do mesmo cliente (ex.: a listagem após o redirect)
+    # ficam no primário por REPLICA_PIN_SECONDS.
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        writing = request.method not in READ_METHODS
+        pin_to_primary(writing or _pinned_by_cookie(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            pin_to_primary(False)
+        if writing and response.status_code < 400 and REPLICA in settings.DATABASES:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE, f'{time.time() + settings.REPLICA_PIN_SECONDS:.3f}',
+                max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite='Lax'
+            )
+        return response
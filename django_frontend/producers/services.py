@@ -1,47 +1,89 @@
-from django.db.models import Sum, Count
-from .models import Producer, Farm, Culture
+import hashlib
+import json
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, DecimalField, IntegerField, Value
+from .models import Producer, DashboardStat
+
+DASHBOARD_CACHE_KEY = 'dashboard:snapshot'
+DASHBOARD_VERSION_KEY = 'dashboard:version'
+# Presente nos REPLICA_PIN_SECONDS após uma escrita: o snapshot é montado
+# a partir do primário, pois a réplica pode ainda não ter a escrita
+DASHBOARD_PRIMARY_KEY = 'dashboard:primary'
+
+KIND_PRODUCERS = 'producers'
+STAT_FIELDS = ('kind', 'key', 'count', 'total_area', 'arable_area', 'vegetation_area')
+
+def dashboard_version():
+    return cache.get_or_set(DASHBOARD_VERSION_KEY, 1, timeout=None)
+
+def bump_dashboard_version():
+    cache.set(DASHBOARD_PRIMARY_KEY, True, timeout=settings.REPLICA_PIN_SECONDS)
+    # Snapshots de versões anteriores deixam de ser lidos e expiram sozinhos
+    try:
+        cache.incr(DASHBOARD_VERSION_KEY)
+    except ValueError:
+        cache.set(DASHBOARD_VERSION_KEY, 2, timeout=None)
 
 class DashboardService:
-    def get_dashboard_data(self):
-        farms = Farm.objects.all()
-        cultures = Culture.objects.all()
-        
-        total_farms = farms.count()
-        total_hectares = farms.aggregate(Sum('total_area'))['total_area__sum'] or 0
-        
-        return {
-            'total_farms': total_farms,
-            'total_hectares': float(total_hectares),
-            'total_producers': Producer.objects.count(),
-            'total_cultures': cultures.count(),
-        }
+    def _stats(self):
+        # Read model dashboard_stats + total de produtores em uma única
+        # consulta (UNION ALL); a linha de produtores sempre existe, mesmo
+        # com a tabela vazia, pois o COUNT não tem GROUP BY
+        zero = Value(0, output_field=DecimalField(max_digits=14, decimal_places=2))
+        # None deixa a escolha com o router (réplica, se configurada)
+        using = 'default' if cache.get(DASHBOARD_PRIMARY_KEY) else None
+        producers = Producer.objects.using(using).order_by().values(
+            kind=Value(KIND_PRODUCERS), key=Value('')
+        ).annotate(
+            count=Count('id', output_field=IntegerField()),
+            total_area=zero, arable_area=zero, vegetation_area=zero
+        ).values(*STAT_FIELDS)
+        stats = DashboardStat.objects.using(using).filter(count__gt=0).order_by().values(*STAT_FIELDS)
+        return list(stats.union(producers, all=True).order_by('-count'))
     
-    def get_chart_data(self):
-        # Distribuição por estado
-        state_data = list(
-            Farm.objects.values('state')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-        
-        # Distribuição por cultura
-        culture_data = list(
-            Culture.objects.values('name')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
+    def _build_snapshot(self):
+        stats = self._stats()
+        state_stats = [s for s in stats if s['kind'] == DashboardStat.KIND_STATE]
+        culture_stats = [s for s in stats if s['kind'] == DashboardStat.KIND_CULTURE]
+        total_producers = next(s['count'] for s in stats if s['kind'] == KIND_PRODUCERS)
         
-        # Uso do solo
-        land_use_data = Farm.objects.aggregate(
-            arable=Sum('arable_area'),
-            vegetation=Sum('vegetation_area')
-        )
-        
-        return {
-            'states': state_data,
-            'cultures': culture_data,
+        dashboard = {
+            'total_farms': sum(s['count'] for s in state_stats),
+            'total_hectares': float(sum(s['total_area'] for s in state_stats)),
+            'total_producers': total_producers,
+            'total_cultures': sum(s['count'] for s in culture_stats),
+        }
+        chart = {
+            'states': [
+                {'state': s['key'], 'count': s['count']} for s in state_stats
+            ],
+            'cultures': [
+                {'name': s['key'], 'count': s['count']} for s in culture_stats
+            ],
             'land_use': [
-                {'name': 'Área Agricultável', 'value': float(land_use_data['arable'] or 0)},
-                {'name': 'Área de Vegetação', 'value': float(land_use_data['vegetation'] or 0)}
+                {'name': 'Área Agricultável', 'value': float(sum(s['arable_area'] for s in state_stats))},
+                {'name': 'Área de Vegetação', 'value': float(sum(s['vegetation_area'] for s in state_stats))}
             ]
-        }
\ No newline at end of file
+        }
+        payload = json.dumps(chart, sort_keys=True).encode()
+        return {'dashboard': dashboard, 'chart': chart, 'etag': hashlib.sha1(payload).hexdigest()}
+    
+    def get_snapshot(self):
+        # Página e /dashboard/data/ compartilham o mesmo snapshot; a chave
+        # é versionada e os signals trocam a versão a cada escrita
+        return cache.get_or_set(
+            DASHBOARD_CACHE_KEY,
+            self._build_snapshot,
+            timeout=settings.DASHBOARD_CACHE_TIMEOUT,
+            version=dashboard_version()
+        )
+    
+    def get_dashboard_data(self):
+        return self.get_snapshot()['dashboard']
+    
+    def get_chart_data(self):
+        return self.get_snapshot()['chart']
+    
+    def get_etag(self):
+        return self.get_snapshot()['etag']
@@ -0,0 +1,104 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.backends.signals import connection_created
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from .models import Producer, Farm, Culture, DashboardStat
+from .services import bump_dashboard_version
+from .utils import unaccent
+
+# Mantém dashboard_stats consistente com escritas feitas pelo Django
+# (incluindo exclusões em cascata a partir de Producer/Farm).
+
+def _increment(kind, key, **deltas):
+    # get_or_create trata a corrida entre dois INSERTs da mesma chave (o
+    # perdedor relê a linha criada pelo outro) e o UPDATE com F() soma no
+    # banco, sem perder incrementos concorrentes
+    with transaction.atomic():
+        stat, created = DashboardStat.objects.get_or_create(kind=kind, key=key, defaults=deltas)
+        if not created:
+            DashboardStat.objects.filter(pk=stat.pk).update(
+                **{field: F(field) + delta for field, delta in deltas.items()}
+            )
+
+def _apply_farm(values, sign):
+    _increment(
+        DashboardStat.KIND_STATE, values['state'],
+        count=sign,
+        total_area=sign * values['total_area'],
+        arable_area=sign * values['arable_area'],
+        vegetation_area=sign * values['vegetation_area'],
+    )
+
+def _farm_values(farm):
+    return {
+        'state': farm.state,
+        'total_area': farm.total_area,
+        'arable_area': farm.arable_area,
+        'vegetation_area': farm.vegetation_area,
+    }
+
+@receiver(pre_save, sender=Farm)
+def remember_previous_farm(sender, instance, **kwargs):
+    instance._previous_stats = None
+    if not instance._state.adding:
+        # FOR UPDATE (dentro da transação aberta por Farm.save): dois saves
+        # concorrentes da mesma fazenda leriam o mesmo valor anterior e o
+        # estado antigo seria descontado duas vezes
+        instance._previous_stats = (
+            Farm.objects.select_for_update().filter(pk=instance.pk)
+            .values('state', 'total_area', 'arable_area', 'vegetation_area')
+            .first()
+        )
+
+@receiver(post_save, sender=Farm)
+def update_farm_stats(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_stats', None)
+    if previous:
+        _apply_farm(previous, -1)
+    _apply_farm(_farm_values(instance), 1)
+
+@receiver(post_delete, sender=Farm)
+def remove_farm_stats(sender, instance, **kwargs):
+    _apply_farm(_farm_values(instance), -1)
+
+@receiver(pre_save, sender=Culture)
+def remember_previous_culture(sender, instance, **kwargs):
+    instance._previous_name = None
+    if not instance._state.adding:
+        # Ver remember_previous_farm
+        instance._previous_name = (
+            Culture.objects.select_for_update().filter(pk=instance.pk)
+            .values_list('name', flat=True).first()
+        )
+
+@receiver(post_save, sender=Culture)
+def update_culture_stats(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_name', None)
+    if previous:
+        _increment(DashboardStat.KIND_CULTURE, previous, count=-1)
+    _increment(DashboardStat.KIND_CULTURE, instance.name, count=1)
+
+@receiver(post_delete, sender=Culture)
+def remove_culture_stats(sender, instance, **kwargs):
+    _increment(DashboardStat.KIND_CULTURE, instance.name, count=-1)
+
+@receiver(post_save, sender=Producer)
+@receiver(post_save, sender=Farm)
+@receiver(post_save, sender=Culture)
+@receiver(post_delete, sender=Producer)
+@receiver(post_delete, sender=Farm)
+@receiver(post_delete, sender=Culture)
+def invalidate_dashboard_cache(sender, **kwargs):
+    # Só após o commit: antes disso outra requisição poderia gravar no
+    # cache, sob a nova versão, dados que ainda não incluem esta escrita
+    transaction.on_commit(bump_dashboard_version)
+
+@receiver(connection_created)
+def register_sqlite_functions(sender, connection, **kwargs):
+    # lower() do SQLite só trata ASCII ("Ã" continua maiúsculo), então
+    # f_unaccent também converte para minúsculas
+    if connection.vendor == 'sqlite':
+        connection.connection.create_function(
+            'f_unaccent', 1, lambda text: text if text is None else unaccent(text), deterministic=True
+        )
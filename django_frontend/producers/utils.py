@@ -0,0 +1,91 @@
+import os
+import re
+import threading
+import time
+import unicodedata
+import uuid
+from operator import mul
+
+# Mesmo algoritmo e tabelas de pesos de
+# rural_producer_management/app/utils/validators.py (caminho escalar)
+
+NON_DIGITS = re.compile(r'[^0-9]')
+NON_WORD = re.compile(r'[^0-9a-z]+')
+
+CPF = 'CPF'
+CNPJ = 'CNPJ'
+
+CPF_WEIGHTS = (tuple(range(10, 1, -1)), tuple(range(11, 1, -1)))
+CNPJ_WEIGHTS = ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+
+def normalize_document(document):
+    if document.isascii() and document.isdigit():
+        return document
+    return NON_DIGITS.sub('', document)
+
+def document_key(document):
+    # (número, tipo) canônico; None se não tiver 11 ou 14 dígitos
+    digits = normalize_document(document)
+    if len(digits) == 11:
+        return int(digits), CPF
+    if len(digits) == 14:
+        return int(digits), CNPJ
+    return None
+
+def _cpf_digits_valid(cpf):
+    if len(cpf) != 11 or cpf == cpf[0] * 11:
+        return False
+    digits = [ord(c) - 48 for c in cpf]
+    for i, weights in enumerate(CPF_WEIGHTS):
+        value = sum(map(mul, digits, weights))
+        if (value * 10) % 11 % 10 != digits[9 + i]:
+            return False
+    return True
+
+def _cnpj_digits_valid(cnpj):
+    if len(cnpj) != 14:
+        return False
+    digits = [ord(c) - 48 for c in cnpj]
+    for i, weights in enumerate(CNPJ_WEIGHTS):
+        remainder = sum(map(mul, digits, weights)) % 11
+        if (0 if remainder < 2 else 11 - remainder) != digits[12 + i]:
+            return False
+    return True
+
+def validate_cpf_cnpj(document):
+    document = normalize_document(document)
+    
+    if len(document) == 11:
+        return _cpf_digits_valid(document)
+    elif len(document) == 14:
+        return _cnpj_digits_valid(document)
+    
+    return False
+
+def unaccent(text):
+    # Minúsculas sem acentos, como f_unaccent(lower(...)) no PostgreSQL
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+def normalize_name(text):
+    # Igual a rural_producer_management/app/utils/text_search.py
+    return NON_WORD.sub(' ', unaccent(text)).strip()
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+def uuid7():
+    # UUIDv7 ordenado pelo tempo, igual às chaves geradas pela API
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms, _counter = now_ms, int.from_bytes(os.urandom(2), 'big') & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms, _counter = _last_ms + 1, 0
+        timestamp, counter = _last_ms, _counter
+    rand_b = int.from_bytes(os.urandom(8), 'big') & ((1 << 62) - 1)
+    return uuid.UUID(int=timestamp << 80 | 0x7 << 76 | counter << 64 | 0x2 << 62 | rand_b)
@@ -4,6 +4,7 @@ from django.http import JsonResponse
 from django.db.models import Sum, Count
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
+from django.views.decorators.http import condition
 from .models import Producer, Farm, Culture
 from .forms import ProducerForm, FarmForm, CultureForm
 from .services import DashboardService
@@ -13,6 +14,17 @@ class ProducerListView(ListView):
     template_name = 'producers/producer_list.html'
     context_object_name = 'producers'
     paginate_by = 20
+    
+    def get_queryset(self):
+        query = self.request.GET.get('q', '').strip()
+        if query:
+            return Producer.objects.for_list().search(query)
+        return Producer.objects.for_list().order_by('name', 'id')
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.request.GET.get('q', '').strip()
+        return context
 
 class ProducerCreateView(CreateView):
     model = Producer
@@ -48,14 +60,21 @@ class FarmListView(ListView):
     template_name = 'producers/farm_list.html'
     context_object_name = 'farms'
     paginate_by = 20
+    
+    def get_queryset(self):
+        return Farm.objects.for_list().order_by('name', 'id')
 
 def dashboard_view(request):
     dashboard_service = DashboardService()
     context = dashboard_service.get_dashboard_data()
     return render(request, 'producers/dashboard.html', context)
 
+def _dashboard_etag(request):
+    return DashboardService().get_etag()
+
+@condition(etag_func=_dashboard_etag)
 def dashboard_data(request):
     """API endpoint para dados dos gráficos"""
     dashboard_service = DashboardService()
     data = dashboard_service.get_chart_data()
-    return JsonResponse(data)
\ No newline at end of file
+    return JsonResponse(data)
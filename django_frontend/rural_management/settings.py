@@ -25,6 +25,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'producers.routers.ReadReplicaMiddleware',
 ]
 
 ROOT_URLCONF = 'rural_management.urls'
@@ -53,9 +54,42 @@ DATABASES = {
         'PASSWORD': 'password',
         'HOST': 'localhost',
         'PORT': '5432',
+        # Conexões persistentes, configuradas por ambiente como o pool da
+        # API (DB_POOL_*): reaproveitadas por até DB_CONN_MAX_AGE segundos
+        # (0 = uma conexão por requisição) e testadas antes do reuso, o
+        # que descarta conexões mortas após um failover
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true',
     }
 }
 
+# Réplica de leitura (opcional, mesmo banco em outro host): com
+# DB_REPLICA_HOST definido, as leituras do app producers em GET vão para
+# ela; escritas e o resto de uma requisição que já escreveu usam o default
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.environ['DB_REPLICA_HOST'],
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['producers.routers.PrimaryReplicaRouter']
+
+# Segundos, após uma escrita, em que o mesmo cliente (cookie) e a recarga do
+# dashboard ainda leem do primário, cobrindo o atraso de replicação
+REPLICA_PIN_SECONDS = int(os.environ.get('DB_REPLICA_PIN_SECONDS', 5))
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Teto de desatualização para escritas que não passam pelos signals
+# do Django (ex.: gravações feitas pela API FastAPI)
+DASHBOARD_CACHE_TIMEOUT = 300
+
 LANGUAGE_CODE = 'pt-br'
 TIME_ZONE = 'America/Sao_Paulo'
 USE_I18N = True
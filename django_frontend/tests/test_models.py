@@ -33,6 +33,11 @@ class TestProducerModel(TestCase):
                 name="Outro João"
             )
     
+    def test_producer_invalid_document_raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            Producer.objects.create(cpf_cnpj="123", name="João Silva")
+        assert not Producer.objects.exists()
+    
     def test_producer_str_representation(self):
         producer = Producer(name="Maria Santos")
         assert str(producer) == "Maria Santos"
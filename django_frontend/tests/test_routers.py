@@ -0,0 +1,66 @@
+import time
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from producers.models import Producer
+from producers.routers import (
+    PRIMARY_PIN_COOKIE, PrimaryReplicaRouter, ReadReplicaMiddleware, pin_to_primary, pinned_to_primary
+)
+
+class TestPrimaryReplicaRouter(SimpleTestCase):
+    def setUp(self):
+        pin_to_primary(False)
+        self.router = PrimaryReplicaRouter()
+        self.router.replica = 'replica'
+    
+    def tearDown(self):
+        pin_to_primary(False)
+    
+    def test_reads_go_to_replica(self):
+        assert self.router.db_for_read(Producer) == 'replica'
+    
+    def test_write_pins_reads_to_primary(self):
+        assert self.router.db_for_write(Producer) == 'default'
+        assert self.router.db_for_read(Producer) is None
+    
+    def test_without_replica_reads_use_default(self):
+        self.router.replica = None
+        assert self.router.db_for_read(Producer) is None
+    
+    def test_replica_is_never_migrated(self):
+        assert self.router.allow_migrate('replica', 'producers') is False
+        assert self.router.allow_migrate('default', 'producers') is None
+
+class TestReadReplicaMiddleware(SimpleTestCase):
+    def run_request(self, method, cookie=None, status=200):
+        seen = []
+        
+        def view(request):
+            seen.append(pinned_to_primary())
+            return HttpResponse(status=status)
+        
+        request = getattr(RequestFactory(), method)('/')
+        if cookie is not None:
+            request.COOKIES[PRIMARY_PIN_COOKIE] = cookie
+        self.response = ReadReplicaMiddleware(view)(request)
+        return seen[0]
+    
+    def test_get_reads_from_replica(self):
+        assert self.run_request('get') is False
+    
+    def test_post_is_pinned_from_start(self):
+        assert self.run_request('post') is True
+        # O estado não vaza para a próxima requisição da mesma thread
+        assert pinned_to_primary() is False
+    
+    def test_recent_write_cookie_pins_get(self):
+        assert self.run_request('get', cookie=str(time.time() + 5)) is True
+        assert self.run_request('get', cookie=str(time.time() - 1)) is False
+        assert self.run_request('get', cookie='lixo') is False
+    
+    def test_post_sets_pin_cookie_when_replica_configured(self):
+        with override_settings(DATABASES={'default': {}, 'replica': {}}):
+            self.run_request('post')
+            assert float(self.response.cookies[PRIMARY_PIN_COOKIE].value) > time.time()
+            
+            self.run_request('post', status=400)
+            assert PRIMARY_PIN_COOKIE not in self.response.cookies
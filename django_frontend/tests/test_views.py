@@ -0,0 +1,181 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from producers.forms import CultureForm, FarmForm
+from producers.models import Producer, Farm
+from producers.services import DashboardService
+
+CPFS = [
+    "111.444.777-35", "222.333.444-05", "123.456.789-09", "987.654.321-00", "529.982.247-25",
+    "168.995.350-09", "390.533.447-05", "071.853.310-01", "346.874.530-04", "853.513.468-93",
+]
+
+class QueryCountMixin:
+    def create_producers(self, count):
+        for i in range(count):
+            producer = Producer.objects.create(cpf_cnpj=CPFS[i], name=f"Produtor {i}")
+            for j in range(2):
+                Farm.objects.create(
+                    producer=producer, name=f"Fazenda {i}-{j}", city="Cidade", state="SP",
+                    total_area=100, arable_area=50, vegetation_area=50
+                )
+    
+    def count_queries(self, fn):
+        with CaptureQueriesContext(connection) as context:
+            fn()
+        return len(context.captured_queries)
+
+class TestListViewQueries(QueryCountMixin, TestCase):
+    def test_producer_list_constant_queries(self):
+        self.create_producers(1)
+        few = self.count_queries(lambda: self.client.get(reverse('producer_list')))
+        
+        for i in range(1, 10):
+            Producer.objects.create(cpf_cnpj=CPFS[i], name=f"Produtor {i}")
+        many = self.count_queries(lambda: self.client.get(reverse('producer_list')))
+        
+        assert few == many
+    
+    def test_producer_list_renders_farm_count(self):
+        self.create_producers(3)
+        
+        with self.assertNumQueries(2):  # COUNT da paginação + página com farm_count
+            response = self.client.get(reverse('producer_list'))
+        
+        assert response.status_code == 200
+        assert [p.farm_count for p in response.context['producers']] == [2, 2, 2]
+    
+    def test_farm_list_constant_queries(self):
+        self.create_producers(1)
+        few = self.count_queries(lambda: self.client.get(reverse('farm_list')))
+        
+        for i in range(1, 10):
+            producer = Producer.objects.create(cpf_cnpj=CPFS[i], name=f"Produtor {i}")
+            Farm.objects.create(
+                producer=producer, name=f"Fazenda {i}", city="Cidade", state="MG",
+                total_area=100, arable_area=50, vegetation_area=50
+            )
+        many = self.count_queries(lambda: self.client.get(reverse('farm_list')))
+        
+        assert few == many == 2
+
+class TestFormChoiceQueries(QueryCountMixin, TestCase):
+    def test_form_selects_render_in_one_query(self):
+        self.create_producers(5)
+        
+        # Um SELECT para produtores (FarmForm) e um JOIN fazenda+produtor (CultureForm)
+        with self.assertNumQueries(1):
+            str(FarmForm()['producer'])
+        with self.assertNumQueries(1):
+            str(CultureForm()['farm'])
+
+class TestDashboardCache(QueryCountMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+    
+    def test_dashboard_single_query_shared_with_chart_data(self):
+        self.create_producers(3)
+        
+        with self.assertNumQueries(1):
+            data = DashboardService().get_dashboard_data()
+            chart = DashboardService().get_chart_data()
+        
+        assert data == {'total_farms': 6, 'total_hectares': 600.0, 'total_producers': 3, 'total_cultures': 0}
+        assert chart['states'] == [{'state': 'SP', 'count': 6}]
+    
+    def test_dashboard_counts_producers_without_stats(self):
+        with self.assertNumQueries(1):
+            data = DashboardService().get_dashboard_data()
+        
+        assert data['total_producers'] == 0
+        assert data['total_farms'] == 0
+    
+    def test_write_bumps_cache_version(self):
+        self.create_producers(1)
+        assert DashboardService().get_dashboard_data()['total_producers'] == 1
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Producer.objects.create(cpf_cnpj=CPFS[5], name="Novo")
+        
+        assert DashboardService().get_dashboard_data()['total_producers'] == 2
+    
+    def test_dashboard_data_etag_not_modified(self):
+        self.create_producers(2)
+        response = self.client.get(reverse('dashboard_data'))
+        etag = response['ETag']
+        
+        with self.assertNumQueries(0):
+            cached = self.client.get(reverse('dashboard_data'), HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == 200
+        assert cached.status_code == 304
+    
+    def test_dashboard_data_etag_changes_after_write(self):
+        self.create_producers(1)
+        etag = self.client.get(reverse('dashboard_data'))['ETag']
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Farm.objects.create(
+                producer=Producer.objects.get(), name="Nova", city="Cidade", state="MG",
+                total_area=10, arable_area=5, vegetation_area=5
+            )
+        response = self.client.get(reverse('dashboard_data'), HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+        assert {'state': 'MG', 'count': 1} in response.json()['states']
+
+class TestProducerSearch(TestCase):
+    def setUp(self):
+        for cpf, name in zip(CPFS, ["João Silva", "JOANA SILVEIRA", "Maria Souza"]):
+            Producer.objects.create(cpf_cnpj=cpf, name=name)
+    
+    def test_search_ignores_accents_and_case(self):
+        response = self.client.get(reverse('producer_list'), {'q': 'joao SILVA'})
+        
+        assert [p.name for p in response.context['producers']] == ["João Silva"]
+        assert response.context['query'] == 'joao SILVA'
+    
+    def test_search_matches_every_word(self):
+        names = [p.name for p in Producer.objects.search('silv')]
+        
+        assert names == ["JOANA SILVEIRA", "João Silva"]
+        assert not Producer.objects.search('silva souza').exists()
+        assert not Producer.objects.search('!!').exists()
+    
+    def test_empty_query_lists_all(self):
+        response = self.client.get(reverse('producer_list'), {'q': ' '})
+        
+        assert len(response.context['producers']) == 3
+
+class TestProducerDuplicateDocument(TestCase):
+    def setUp(self):
+        self.producer = Producer.objects.create(cpf_cnpj=CPFS[0], name="João Silva")
+    
+    def test_create_with_registered_document_shows_form_error(self):
+        response = self.client.post(reverse('producer_create'), {'cpf_cnpj': CPFS[0], 'name': "Outro"})
+        
+        assert response.status_code == 200
+        assert response.context['form'].errors['cpf_cnpj'] == ['CPF/CNPJ já cadastrado']
+        assert Producer.objects.count() == 1
+    
+    def test_update_to_document_of_another_producer_shows_form_error(self):
+        other = Producer.objects.create(cpf_cnpj=CPFS[1], name="Maria Souza")
+        
+        response = self.client.post(
+            reverse('producer_update', args=[other.pk]), {'cpf_cnpj': CPFS[0], 'name': "Maria Souza"}
+        )
+        
+        assert response.status_code == 200
+        assert response.context['form'].errors['cpf_cnpj'] == ['CPF/CNPJ já cadastrado']
+    
+    def test_update_keeping_own_document_is_valid(self):
+        response = self.client.post(
+            reverse('producer_update', args=[self.producer.pk]), {'cpf_cnpj': CPFS[0], 'name': "João S."}
+        )
+        
+        assert response.status_code == 302
+        self.producer.refresh_from_db()
+        assert self.producer.name == "João S."
@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import sys
+from typing import List
+from app.database import SessionLocal, dispose_engine
+from app.repositories.producer_repository import ProducerRepository
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.culture_repository import CultureRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository
+from app.services.dashboard_service import DashboardService
+from app.services.import_service import ImportService
+from app.schemas.bulk_import import ImportReport
+from app.utils.bulk_import import iter_file_lines
+from app.utils.cache import shared_dashboard_cache
+from app.utils.logger import configure_logging
+
+async def _rebuild_dashboard_stats(check_only: bool) -> List[str]:
+    try:
+        async with SessionLocal(primary=True) as session:
+            service = DashboardService(
+                FarmRepository(session),
+                CultureRepository(session),
+                DashboardStatsRepository(session),
+                shared_dashboard_cache()
+            )
+            return await service.rebuild_stats(check_only=check_only)
+    finally:
+        await dispose_engine()
+
+def rebuild_dashboard_stats(args: argparse.Namespace) -> int:
+    drift = asyncio.run(_rebuild_dashboard_stats(args.check))
+    
+    for entry in drift:
+        print(entry)
+    print(f"{len(drift)} divergência(s) encontrada(s)")
+    # Em modo --check, divergências resultam em código de saída 1
+    return 1 if args.check and drift else 0
+
+async def _import_file(entity: str, path: str, format: str) -> ImportReport:
+    try:
+        async with SessionLocal(primary=True) as session:
+            service = ImportService(
+                ProducerRepository(session),
+                FarmRepository(session),
+                CultureRepository(session),
+                DashboardStatsRepository(session),
+                shared_dashboard_cache()
+            )
+            with open(path, encoding="utf-8") as lines:
+                return await service.import_lines(entity, iter_file_lines(lines), format)
+    finally:
+        await dispose_engine()
+
+def import_file(args: argparse.Namespace) -> int:
+    format = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    report = asyncio.run(_import_file(args.entity, args.path, format))
+    
+    for error in report.errors:
+        print(f"linha {error.line}: {'; '.join(error.errors)}")
+    print(", ".join(f"{count} {kind}" for kind, count in report.inserted.items()) + " importado(s)")
+    print(f"{len(report.errors)} linha(s) rejeitada(s)")
+    return 1 if report.errors else 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    rebuild = subparsers.add_parser(
+        "rebuild-dashboard-stats",
+        help="Recalcula a tabela dashboard_stats a partir de farms/cultures"
+    )
+    rebuild.add_argument("--check", action="store_true", help="Apenas detecta divergências, sem regravar")
+    rebuild.set_defaults(func=rebuild_dashboard_stats)
+    
+    bulk = subparsers.add_parser("import", help="Importa produtores, fazendas ou culturas de um CSV/NDJSON")
+    bulk.add_argument("entity", choices=["producers", "farms", "cultures"])
+    bulk.add_argument("path")
+    bulk.add_argument("--format", choices=["ndjson", "csv"], help="Padrão: pela extensão do arquivo")
+    bulk.set_defaults(func=import_file)
+    
+    args = parser.parse_args(argv)
+    configure_logging()
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
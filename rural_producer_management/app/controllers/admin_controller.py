@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Dict, Optional
+from app.utils.slow_query_log import SlowQueryLog
+from app.dependencies import get_slow_query_log
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+@router.get("/slow-queries", response_model=Dict)
+async def get_slow_queries(log: Optional[SlowQueryLog] = Depends(get_slow_query_log)):
+    if log is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Log de consultas lentas desativado (SLOW_QUERY_THRESHOLD_MS)"
+        )
+    return {
+        "threshold_ms": log.threshold_ms,
+        "explain": log.explain,
+        "entries": log.entries(),
+    }
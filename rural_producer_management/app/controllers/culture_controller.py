@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from app.services.culture_service import CultureService
+from app.schemas.culture import CultureCreate, CultureUpdate, CultureResponse
+from app.schemas.pagination import Page
+from app.utils.pagination import InvalidCursorError
+from app.utils.profiling import ProfiledJSONResponse
+from app.config import settings
+from app.dependencies import get_culture_service
+
+router = APIRouter(prefix="/cultures", tags=["cultures"])
+
+@router.post("/", response_model=CultureResponse, status_code=status.HTTP_201_CREATED)
+async def create_culture(
+    data: CultureCreate,
+    service: CultureService = Depends(get_culture_service)
+):
+    try:
+        culture = await service.create(data)
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Cultura já cadastrada para esta fazenda e safra")
+    if not culture:
+        raise HTTPException(status_code=404, detail="Farm not found")
+    return culture
+
+@router.get("/{culture_id}", response_model=CultureResponse)
+async def get_culture(
+    culture_id: str,
+    service: CultureService = Depends(get_culture_service)
+):
+    culture = await service.get_by_id(culture_id)
+    if not culture:
+        raise HTTPException(status_code=404, detail="Culture not found")
+    return culture
+
+@router.get("/", response_model=Page[CultureResponse])
+async def list_cultures(
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    service: CultureService = Depends(get_culture_service)
+):
+    # Devolver a Response direto evita a revalidação pelo response_model,
+    # que continua documentando o formato no OpenAPI
+    try:
+        return ProfiledJSONResponse(await service.get_page(limit, cursor))
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.put("/{culture_id}", response_model=CultureResponse)
+async def update_culture(
+    culture_id: str,
+    data: CultureUpdate,
+    service: CultureService = Depends(get_culture_service)
+):
+    try:
+        culture = await service.update(culture_id, data)
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Cultura já cadastrada para esta fazenda e safra")
+    if not culture:
+        raise HTTPException(status_code=404, detail="Culture not found")
+    return culture
+
+@router.delete("/{culture_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_culture(
+    culture_id: str,
+    service: CultureService = Depends(get_culture_service)
+):
+    if not await service.delete(culture_id):
+        raise HTTPException(status_code=404, detail="Culture not found")
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends
+from typing import Dict
+from app.services.dashboard_service import DashboardService
+from app.utils.cache import CoalescingCache
+from app.dependencies import get_dashboard_service, get_dashboard_cache
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+@router.get("/", response_model=Dict)
+async def get_dashboard(service: DashboardService = Depends(get_dashboard_service)):
+    return await service.get_dashboard_data()
+
+@router.get("/cache-stats", response_model=Dict[str, int])
+async def get_dashboard_cache_stats(cache: CoalescingCache = Depends(get_dashboard_cache)):
+    return cache.stats()
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.services.export_service import ExportService
+from app.utils.export import ndjson_chunks, csv_chunks
+from app.dependencies import get_export_service
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+@router.get("/{entity}")
+async def export_entity(
+    entity: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    state: Optional[str] = None,
+    harvest_year: Optional[str] = None,
+    nested: bool = False,
+    service: ExportService = Depends(get_export_service)
+):
+    if not service.supports(entity):
+        raise HTTPException(status_code=404, detail="Entidade não exportável")
+    if nested and format == "csv":
+        raise HTTPException(status_code=400, detail="nested só é suportado em NDJSON")
+    
+    batches = service.stream(entity, state, harvest_year, nested)
+    if format == "csv":
+        return StreamingResponse(
+            csv_chunks(batches, service.columns(entity)),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{entity}.csv"'}
+        )
+    return StreamingResponse(ndjson_chunks(batches), media_type="application/x-ndjson")
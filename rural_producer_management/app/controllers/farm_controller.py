@@ -0,0 +1,101 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+from app.services.farm_service import FarmService
+from app.schemas.farm import FarmCreate, FarmUpdate, FarmResponse, FarmSearchFilters, FarmSearchPage
+from app.schemas.pagination import Page
+from app.utils.pagination import InvalidCursorError
+from app.utils.profiling import ProfiledJSONResponse
+from app.config import settings
+from app.dependencies import get_farm_service
+
+router = APIRouter(prefix="/farms", tags=["farms"])
+
+@router.post("/", response_model=FarmResponse, status_code=status.HTTP_201_CREATED)
+async def create_farm(
+    data: FarmCreate,
+    service: FarmService = Depends(get_farm_service)
+):
+    farm = await service.create(data)
+    if not farm:
+        raise HTTPException(status_code=404, detail="Producer not found")
+    return farm
+
+def search_filters(
+    state: Optional[str] = Query(None, min_length=2, max_length=2),
+    city: Optional[str] = Query(None, min_length=1, description="Prefixo do nome da cidade"),
+    min_total_area: Optional[Decimal] = Query(None, ge=0),
+    max_total_area: Optional[Decimal] = Query(None, ge=0),
+    min_arable_area: Optional[Decimal] = Query(None, ge=0),
+    max_arable_area: Optional[Decimal] = Query(None, ge=0),
+    culture: Optional[str] = None,
+    harvest_year: Optional[str] = None,
+    producer_id: Optional[UUID] = None
+) -> FarmSearchFilters:
+    return FarmSearchFilters(
+        state=state,
+        city=city,
+        min_total_area=min_total_area,
+        max_total_area=max_total_area,
+        min_arable_area=min_arable_area,
+        max_arable_area=max_arable_area,
+        culture=culture,
+        harvest_year=harvest_year,
+        producer_id=producer_id
+    )
+
+@router.get("/search", response_model=FarmSearchPage)
+async def search_farms(
+    filters: FarmSearchFilters = Depends(search_filters),
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    facets: bool = False,
+    service: FarmService = Depends(get_farm_service)
+):
+    try:
+        return await service.search(filters, limit, cursor, facets)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.get("/{farm_id}", response_model=FarmResponse)
+async def get_farm(
+    farm_id: str,
+    service: FarmService = Depends(get_farm_service)
+):
+    farm = await service.get_by_id(farm_id)
+    if not farm:
+        raise HTTPException(status_code=404, detail="Farm not found")
+    return farm
+
+@router.get("/", response_model=Page[FarmResponse])
+async def list_farms(
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    service: FarmService = Depends(get_farm_service)
+):
+    # Devolver a Response direto evita a revalidação pelo response_model,
+    # que continua documentando o formato no OpenAPI
+    try:
+        return ProfiledJSONResponse(await service.get_page(limit, cursor))
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.put("/{farm_id}", response_model=FarmResponse)
+async def update_farm(
+    farm_id: str,
+    data: FarmUpdate,
+    service: FarmService = Depends(get_farm_service)
+):
+    farm = await service.update(farm_id, data)
+    if not farm:
+        raise HTTPException(status_code=404, detail="Farm not found")
+    return farm
+
+@router.delete("/{farm_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_farm(
+    farm_id: str,
+    service: FarmService = Depends(get_farm_service)
+):
+    if not await service.delete(farm_id):
+        raise HTTPException(status_code=404, detail="Farm not found")
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from app.services.import_service import ImportService
+from app.schemas.bulk_import import ImportReport
+from app.utils.bulk_import import aiter_lines
+from app.dependencies import get_import_service
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+@router.post("/{entity}", response_model=ImportReport)
+async def import_entity(
+    entity: str,
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    service: ImportService = Depends(get_import_service)
+):
+    # O corpo é lido em streaming (curl --data-binary @arquivo)
+    if not service.supports(entity):
+        raise HTTPException(status_code=404, detail="Entidade não importável")
+    return await service.import_lines(entity, aiter_lines(request.stream()), format)
@@ -1,7 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
 from app.services.producer_service import ProducerService
-from app.schemas.producer import ProducerCreate, ProducerUpdate, ProducerResponse
+from app.schemas.producer import (
+    ProducerBulkUpsertResult, ProducerCreate, ProducerDetailResponse, ProducerUpdate, ProducerResponse, ProducerSearchResult
+)
+from app.schemas.pagination import Page
+from app.utils.pagination import InvalidCursorError
+from app.utils.profiling import ProfiledJSONResponse
+from app.utils.validators import document_key
+from app.config import settings
 from app.dependencies import get_producer_service
 
 router = APIRouter(prefix="/producers", tags=["producers"])
@@ -11,7 +19,34 @@ async def create_producer(
     data: ProducerCreate,
     service: ProducerService = Depends(get_producer_service)
 ):
-    return await service.create(data)
+    try:
+        return await service.create(data)
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="CPF/CNPJ já cadastrado")
+
+@router.get("/by-document/{document:path}", response_model=ProducerResponse)
+async def get_producer_by_document(
+    document: str,
+    service: ProducerService = Depends(get_producer_service)
+):
+    # Aceita o documento com ou sem formatação ("/" do CNPJ incluída)
+    key = document_key(document)
+    if key is None:
+        raise HTTPException(status_code=400, detail="CPF/CNPJ deve ter 11 ou 14 dígitos")
+    producer = await service.get_by_document(*key)
+    if not producer:
+        raise HTTPException(status_code=404, detail="Producer not found")
+    return producer
+
+@router.get("/search", response_model=List[ProducerSearchResult])
+async def search_producers(
+    q: str = Query(..., min_length=2, max_length=255),
+    limit: int = Query(20, ge=1, le=100),
+    service: ProducerService = Depends(get_producer_service)
+):
+    # Busca por nome sem diferenciar acentos e maiúsculas, tolerante a
+    # erros de digitação; resultados ordenados por similaridade
+    return await service.search(q, limit)
 
 @router.get("/{producer_id}", response_model=ProducerResponse)
 async def get_producer(
@@ -23,9 +58,38 @@ async def get_producer(
         raise HTTPException(status_code=404, detail="Producer not found")
     return producer
 
-@router.get("/", response_model=List[ProducerResponse])
-async def list_producers(service: ProducerService = Depends(get_producer_service)):
-    return await service.get_all()
+@router.get("/{producer_id}/full", response_model=ProducerDetailResponse)
+async def get_producer_full(
+    producer_id: str,
+    service: ProducerService = Depends(get_producer_service)
+):
+    # Produtor, fazendas, culturas e totais de área em uma só chamada
+    producer = await service.get_full(producer_id)
+    if not producer:
+        raise HTTPException(status_code=404, detail="Producer not found")
+    return producer
+
+@router.get("/", response_model=Page[ProducerResponse])
+async def list_producers(
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = None,
+    service: ProducerService = Depends(get_producer_service)
+):
+    # Devolver a Response direto evita a revalidação pelo response_model,
+    # que continua documentando o formato no OpenAPI
+    try:
+        return ProfiledJSONResponse(await service.get_page(limit, cursor))
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.put("/bulk", response_model=ProducerBulkUpsertResult)
+async def bulk_upsert_producers(
+    items: List[ProducerCreate] = Body(..., max_length=settings.bulk_upsert_max_items),
+    service: ProducerService = Depends(get_producer_service)
+):
+    # Insere ou atualiza pelo CPF/CNPJ; declarada antes de PUT
+    # /{producer_id} para "bulk" não ser lido como id
+    return await service.bulk_upsert(items)
 
 @router.put("/{producer_id}", response_model=ProducerResponse)
 async def update_producer(
@@ -33,7 +97,10 @@ async def update_producer(
     data: ProducerUpdate,
     service: ProducerService = Depends(get_producer_service)
 ):
-    producer = await service.update(producer_id, data)
+    try:
+        producer = await service.update(producer_id, data)
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="CPF/CNPJ já cadastrado")
     if not producer:
         raise HTTPException(status_code=404, detail="Producer not found")
     return producer
@@ -1,16 +1,196 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import re
+import time
+import uuid
+from typing import Any, Dict, Optional
+from sqlalchemy import DateTime, LargeBinary, make_url
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base
+from starlette.requests import Request
 from app.config import settings
+from app.utils.pool_metrics import MeteredAsyncQueuePool
+from app.utils.slow_query_log import shared_slow_query_log
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Criados no startup (lifespan da aplicação) ou no primeiro uso pela CLI,
+# não na importação: importar modelos e schemas não carrega o driver nem
+# toca no banco. O schema é gerenciado só pelas migrações do Alembic.
+_engine: Optional[AsyncEngine] = None
+_read_engine: Optional[AsyncEngine] = None
+_sessionmaker: Optional[async_sessionmaker] = None
+
+# Chaves em Session.info usadas pelo roteamento primário/réplica
+REPLICA_BIND = "replica_bind"
+PINNED_TO_PRIMARY = "pinned_to_primary"
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Instante (epoch) até o qual as leituras do cliente vão para o primário
+PRIMARY_PIN_COOKIE = "primary_pin"
+
+class RoutingSession(Session):
+    # SELECTs vão para a réplica; flush, INSERT/UPDATE/DELETE, SELECT ...
+    # FOR UPDATE e session.connection() vão para o primário. A primeira
+    # escrita prende a sessão (uma por requisição) ao primário, então o
+    # resto da requisição lê o que acabou de gravar, sem depender do atraso
+    # de replicação (read-your-writes).
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        replica = self.info.get(REPLICA_BIND)
+        if (
+            replica is not None
+            and not self.info.get(PINNED_TO_PRIMARY)
+            and not self._flushing
+            and getattr(clause, "is_select", False)
+            and getattr(clause, "_for_update_arg", None) is None
+        ):
+            return replica
+        self.info[PINNED_TO_PRIMARY] = True
+        return super().get_bind(mapper, clause=clause, **kw)
+
+def use_primary(session: AsyncSession) -> None:
+    # Para fluxos de leitura-seguida-de-escrita (update, delete, importação):
+    # as leituras também vão para o primário desde o início
+    session.info[PINNED_TO_PRIMARY] = True
+
+def engine_options(database_url: str) -> Dict[str, Any]:
+    # SQLite em memória usa StaticPool (uma conexão só), sem dimensionamento
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": MeteredAsyncQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+def _create_engine(database_url: str) -> AsyncEngine:
+    engine = create_async_engine(database_url, **engine_options(database_url))
+    slow_query_log = shared_slow_query_log()
+    if slow_query_log is not None:
+        slow_query_log.install(engine.sync_engine)
+    return engine
+
+def make_sessionmaker(engine: AsyncEngine, read_engine: Optional[AsyncEngine] = None) -> async_sessionmaker:
+    options: Dict[str, Any] = {}
+    if read_engine is not None:
+        options = {"sync_session_class": RoutingSession, "info": {REPLICA_BIND: read_engine.sync_engine}}
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, **options)
+
+def init_engine() -> AsyncEngine:
+    global _engine, _read_engine, _sessionmaker
+    if _engine is None:
+        _engine = _create_engine(settings.database_url)
+        if settings.read_database_url:
+            _read_engine = _create_engine(settings.read_database_url)
+        _sessionmaker = make_sessionmaker(_engine, _read_engine)
+    return _engine
+
+def read_engine() -> Optional[AsyncEngine]:
+    init_engine()
+    return _read_engine
+
+async def dispose_engine() -> None:
+    global _engine, _read_engine, _sessionmaker
+    for engine in (_engine, _read_engine):
+        if engine is not None:
+            await engine.dispose()
+    _engine = _read_engine = _sessionmaker = None
+
+def SessionLocal(primary: bool = False) -> AsyncSession:
+    init_engine()
+    session = _sessionmaker()
+    if primary:
+        use_primary(session)
+    return session
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+# No SQLite, CURRENT_TIMESTAMP é gravado sem microssegundos; usar o mesmo
+# formato nos parâmetros mantém comparações como (created_at, id) > cursor
+# consistentes entre valores gerados pelo banco e valores enviados
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
+class UUIDType(TypeDecorator):
+    # uuid nativo no PostgreSQL; 16 bytes (BLOB) nos demais bancos, em vez
+    # dos 36 caracteres do texto. Aceita UUID ou texto nos parâmetros e
+    # sempre devolve uuid.UUID.
+    impl = LargeBinary(16)
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value if dialect.name == "postgresql" else value.bytes
+    
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(bytes=bytes(value))
+
+LIKE_SPECIAL = re.compile(r"[/%_]")
+GLOB_SPECIAL = re.compile(r"[*?\[]")
+
+def prefix_match(column, prefix: str, dialect_name: str):
+    # Padrão montado em Python (e não "LIKE :p || '%'") para o banco poder
+    # usar o índice da coluna. No SQLite, LIKE ignora maiúsculas e não usa
+    # índice; GLOB é sensível a maiúsculas como o LIKE do PostgreSQL.
+    if dialect_name == "sqlite":
+        return column.op("GLOB")(GLOB_SPECIAL.sub(r"[\g<0>]", prefix) + "*")
+    return column.like(LIKE_SPECIAL.sub(r"/\g<0>", prefix) + "%", escape="/")
+
+def wants_primary(request: Request) -> bool:
+    # Só GET/HEAD/OPTIONS leem da réplica, e só se o cliente não escreveu
+    # nos últimos replica_pin_seconds
+    if request.method not in READ_METHODS:
+        return True
     try:
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+async def get_db(request: Request):
+    # Nas mutações (ou logo depois delas) a sessão já nasce presa ao primário
+    async with SessionLocal(primary=wants_primary(request)) as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+class PrimaryPinMiddleware:
+    # Read-your-writes entre requisições: a resposta de uma mutação bem
+    # sucedida leva o cookie PRIMARY_PIN_COOKIE, e o GET seguinte do mesmo
+    # cliente lê do primário até a réplica ter tido tempo de alcançá-la.
+    # Só é instalado com read_database_url configurado.
+    def __init__(self, app, pin_seconds: Optional[int] = None):
+        self.app = app
+        self._pin_seconds = settings.replica_pin_seconds if pin_seconds is None else pin_seconds
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in READ_METHODS:
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_pin(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = (
+                    f"{PRIMARY_PIN_COOKIE}={time.time() + self._pin_seconds:.3f}; "
+                    f"Max-Age={self._pin_seconds}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"set-cookie", cookie.encode("latin-1"))
+                ]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_pin)
@@ -0,0 +1,59 @@
+from typing import Optional
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db
+from app.repositories.producer_repository import ProducerRepository
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.culture_repository import CultureRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository
+from app.services.producer_service import ProducerService
+from app.services.farm_service import FarmService
+from app.services.culture_service import CultureService
+from app.services.dashboard_service import DashboardService
+from app.services.export_service import ExportService
+from app.services.import_service import ImportService
+from app.utils.cache import CoalescingCache, shared_dashboard_cache
+from app.utils.slow_query_log import SlowQueryLog, shared_slow_query_log
+
+def get_dashboard_cache() -> CoalescingCache:
+    return shared_dashboard_cache()
+
+def get_slow_query_log() -> Optional[SlowQueryLog]:
+    return shared_slow_query_log()
+
+def get_producer_service(
+    db: AsyncSession = Depends(get_db),
+    cache: CoalescingCache = Depends(get_dashboard_cache)
+) -> ProducerService:
+    return ProducerService(ProducerRepository(db), cache)
+
+def get_farm_service(
+    db: AsyncSession = Depends(get_db),
+    cache: CoalescingCache = Depends(get_dashboard_cache)
+) -> FarmService:
+    return FarmService(FarmRepository(db), ProducerRepository(db), cache)
+
+def get_culture_service(
+    db: AsyncSession = Depends(get_db),
+    cache: CoalescingCache = Depends(get_dashboard_cache)
+) -> CultureService:
+    return CultureService(CultureRepository(db), FarmRepository(db), cache)
+
+def get_dashboard_service(
+    db: AsyncSession = Depends(get_db),
+    cache: CoalescingCache = Depends(get_dashboard_cache)
+) -> DashboardService:
+    return DashboardService(
+        FarmRepository(db), CultureRepository(db), DashboardStatsRepository(db), cache
+    )
+
+def get_export_service(db: AsyncSession = Depends(get_db)) -> ExportService:
+    return ExportService(ProducerRepository(db), FarmRepository(db), CultureRepository(db))
+
+def get_import_service(
+    db: AsyncSession = Depends(get_db),
+    cache: CoalescingCache = Depends(get_dashboard_cache)
+) -> ImportService:
+    return ImportService(
+        ProducerRepository(db), FarmRepository(db), CultureRepository(db), DashboardStatsRepository(db), cache
+    )
@@ -1,20 +1,65 @@
+from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI
-from app.controllers import producer_controller, farm_controller, culture_controller, dashboard_controller
-from app.database import engine, Base
+from app.config import settings
+from app.controllers import producer_controller, farm_controller, culture_controller, dashboard_controller, export_controller, import_controller, admin_controller
+from app.database import PrimaryPinMiddleware, dispose_engine, init_engine, read_engine
+from app.utils.logger import RequestLoggingMiddleware, configure_logging
+from app.utils.pool_metrics import pool_status
+from app.utils.profiling import ProfiledJSONResponse, enable_profiling
 
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(
-    title="Rural Producer Management System",
-    description="Sistema de gerenciamento de produtores rurais",
-    version="1.0.0"
+ROUTERS = (
+    producer_controller.router,
+    farm_controller.router,
+    culture_controller.router,
+    dashboard_controller.router,
+    export_controller.router,
+    import_controller.router,
+    admin_controller.router,
 )
 
-app.include_router(producer_controller.router)
-app.include_router(farm_controller.router)
-app.include_router(culture_controller.router)
-app.include_router(dashboard_controller.router)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sem create_all: o schema vem de "alembic upgrade head". Criar o engine
+    # não abre conexões; a primeira é aberta pela primeira requisição. O
+    # thread de escrita dos logs também só nasce aqui, não na importação.
+    configure_logging()
+    init_engine()
+    yield
+    await dispose_engine()
 
-@app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+async def pool_health_check():
+    # Conexões em uso/ociosas e tempo de checkout; não abre conexão
+    status = {"status": "healthy", "database_pool": pool_status(init_engine().sync_engine.pool)}
+    replica = read_engine()
+    if replica is not None:
+        status["read_database_pool"] = pool_status(replica.sync_engine.pool)
+    return status
+
+def create_app(profiling: Optional[bool] = None) -> FastAPI:
+    if profiling is None:
+        profiling = settings.profiling_enabled
+    app = FastAPI(
+        title="Rural Producer Management System",
+        description="Sistema de gerenciamento de produtores rurais",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ProfiledJSONResponse
+    )
+    
+    for router in ROUTERS:
+        app.include_router(router)
+    app.get("/health")(health_check)
+    app.get("/health/pool")(pool_health_check)
+    app.add_middleware(RequestLoggingMiddleware)
+    if settings.read_database_url:
+        app.add_middleware(PrimaryPinMiddleware)
+    
+    if profiling:
+        enable_profiling(app)
+    return app
+
+app = create_app()
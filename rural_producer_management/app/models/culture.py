@@ -1,15 +1,26 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, func
+from sqlalchemy import Column, Index, String, ForeignKey, UniqueConstraint, func
 from sqlalchemy.orm import relationship
-from app.database import Base
-import uuid
+from app.database import Base, Timestamp, UUIDType
+from app.utils.ids import uuid7
 
 class Culture(Base):
     __tablename__ = "cultures"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    farm_id = Column(String, ForeignKey("farms.id"), nullable=False)
+    id = Column(UUIDType, primary_key=True, default=uuid7)
+    farm_id = Column(UUIDType, ForeignKey("farms.id"), nullable=False)
     name = Column(String(100), nullable=False)
     harvest_year = Column(String(9), nullable=False)  # "Safra 2024"
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
     
-    farm = relationship("Farm", back_populates="cultures")
\ No newline at end of file
+    farm = relationship("Farm", back_populates="cultures")
+    
+    __table_args__ = (
+        # Paginação por cursor: ORDER BY created_at, id
+        Index("ix_cultures_created_at_id", "created_at", "id"),
+        # Também serve de índice da FK farm_id (coluna líder)
+        UniqueConstraint("farm_id", "name", "harvest_year", name="uq_cultures_farm_name_harvest"),
+        # Distribuição por cultura (GROUP BY name) e filtro por safra
+        Index("ix_cultures_name_harvest_year", "name", "harvest_year"),
+        # EXISTS (... harvest_year = ? AND farm_id = farms.id) das exportações
+        Index("ix_cultures_harvest_farm_id", "harvest_year", "farm_id"),
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, BigInteger, String, Numeric, DateTime, UniqueConstraint, func
+from app.database import Base
+
+class DashboardStat(Base):
+    __tablename__ = "dashboard_stats"
+    
+    # kind = "state" (key = UF) ou "culture" (key = nome da cultura)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(20), nullable=False)
+    key = Column(String(100), nullable=False)
+    count = Column(BigInteger, nullable=False, default=0)
+    total_area = Column(Numeric(14, 2), nullable=False, default=0)
+    arable_area = Column(Numeric(14, 2), nullable=False, default=0)
+    vegetation_area = Column(Numeric(14, 2), nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint("kind", "key", name="uq_dashboard_stats_kind_key"),
+    )
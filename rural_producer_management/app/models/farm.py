@@ -1,21 +1,35 @@
-from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, func
+from sqlalchemy import Column, Index, String, Numeric, ForeignKey, func
 from sqlalchemy.orm import relationship
-from app.database import Base
-import uuid
+from app.database import Base, Timestamp, UUIDType
+from app.utils.ids import uuid7
 
 class Farm(Base):
     __tablename__ = "farms"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    producer_id = Column(String, ForeignKey("producers.id"), nullable=False)
+    id = Column(UUIDType, primary_key=True, default=uuid7)
+    producer_id = Column(UUIDType, ForeignKey("producers.id"), nullable=False)
     name = Column(String(255), nullable=False)
     city = Column(String(100), nullable=False)
     state = Column(String(2), nullable=False)
     total_area = Column(Numeric(10, 2), nullable=False)
     arable_area = Column(Numeric(10, 2), nullable=False)
     vegetation_area = Column(Numeric(10, 2), nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now())
     
     producer = relationship("Producer", back_populates="farms")
-    cultures = relationship("Culture", back_populates="farm", cascade="all, delete-orphan")
\ No newline at end of file
+    cultures = relationship("Culture", back_populates="farm", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Paginação por cursor: ORDER BY created_at, id
+        Index("ix_farms_created_at_id", "created_at", "id"),
+        # FK: fazendas de um produtor, cascade delete e selectinload; o
+        # state na segunda coluna cobre o GROUP BY state por produtor
+        Index("ix_farms_producer_id_state", "producer_id", "state"),
+        # Filtro e GROUP BY por estado; created_at, id mantém a exportação
+        # filtrada por estado na ordem do cursor sem ordenação extra
+        Index("ix_farms_state_created_at_id", "state", "created_at", "id"),
+        # Busca por estado + prefixo de cidade; varchar_pattern_ops permite
+        # o LIKE 'prefixo%' usar o índice em bancos com collation não-C
+        Index("ix_farms_state_city", "state", "city", postgresql_ops={"city": "varchar_pattern_ops"}),
+    )
@@ -1,15 +1,38 @@
-from sqlalchemy import Column, String, DateTime, func
-from sqlalchemy.orm import relationship
-from app.database import Base
-import uuid
+from sqlalchemy import BigInteger, Column, Index, String, func
+from sqlalchemy.orm import relationship, validates
+from app.database import Base, Timestamp, UUIDType
+from app.utils.ids import uuid7
+from app.utils.validators import document_key
 
 class Producer(Base):
     __tablename__ = "producers"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    cpf_cnpj = Column(String(18), unique=True, nullable=False, index=True)
+    id = Column(UUIDType, primary_key=True, default=uuid7)
+    # cpf_cnpj guarda o valor como foi enviado; unicidade e buscas usam a
+    # chave canônica (document_number, document_type)
+    cpf_cnpj = Column(String(18), nullable=False)
+    document_number = Column(BigInteger, nullable=False)
+    document_type = Column(String(4), nullable=False)
     name = Column(String(255), nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now())
     
-    farms = relationship("Farm", back_populates="producer", cascade="all, delete-orphan")
\ No newline at end of file
+    farms = relationship("Farm", back_populates="producer", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Paginação por cursor: ORDER BY created_at, id
+        Index("ix_producers_created_at_id", "created_at", "id"),
+        Index("uq_producers_document", "document_number", "document_type", unique=True),
+        # Busca por nome: o índice GIN ix_producers_name_trgm sobre
+        # f_unaccent(lower(name)) existe só no PostgreSQL (migração 0006)
+    )
+    
+    @validates("cpf_cnpj")
+    def _set_document_key(self, key, value):
+        # Os schemas já validam; aqui só evita o TypeError do unpack quando
+        # o modelo é criado direto com um documento sem 11 ou 14 dígitos
+        document = document_key(value)
+        if document is None:
+            raise ValueError('CPF/CNPJ inválido')
+        self.document_number, self.document_type = document
+        return value
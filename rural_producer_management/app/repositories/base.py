@@ -0,0 +1,154 @@
+from datetime import datetime
+from uuid import UUID
+from typing import AsyncIterator, Generic, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+from sqlalchemy import Select, insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import Base, use_primary
+from app.utils.ids import parse_uuid
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+class BaseRepository(Generic[ModelType]):
+    model: Type[ModelType]
+    
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def create(self, data: dict) -> ModelType:
+        instance = self.model(**data)
+        self._session.add(instance)
+        try:
+            await self._after_create(instance)
+            await self._session.commit()
+        except IntegrityError:
+            await self._session.rollback()
+            raise
+        await self._session.refresh(instance)
+        return instance
+    
+    async def get_by_id(self, id, for_update: bool = False) -> Optional[ModelType]:
+        # Ids malformados simplesmente não existem (404, não erro de banco)
+        id = parse_uuid(id)
+        if id is None:
+            return None
+        query = select(self.model).where(self.model.id == id)
+        if for_update:
+            # populate_existing: um objeto já carregado na sessão recebe os
+            # valores lidos sob o lock, não os que estavam em memória
+            query = query.with_for_update().execution_options(populate_existing=True)
+        result = await self._session.execute(query)
+        return result.scalars().first()
+    
+    async def get_all(self) -> List[ModelType]:
+        result = await self._session.execute(select(self.model))
+        return list(result.scalars().all())
+    
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        *criteria,
+        columns: Optional[List[str]] = None
+    ) -> List:
+        # Keyset: o predicado usa o índice (created_at, id), então o custo
+        # de qualquer página é o mesmo da primeira (ao contrário de OFFSET).
+        # Com columns, devolve linhas (Row) só com essas colunas, sem
+        # materializar objetos do ORM.
+        entities = [getattr(self.model, name) for name in columns] if columns else [self.model]
+        query = select(*entities).where(*criteria).order_by(self.model.created_at, self.model.id)
+        if after is not None:
+            key = tuple_(self.model.created_at, self.model.id)
+            query = query.where(key > tuple_(*after, types=[c.type for c in key.clauses]))
+        result = await self._session.execute(query.limit(limit))
+        return list(result.all() if columns else result.scalars().all())
+    
+    async def stream(self, query: Select, batch_size: int) -> AsyncIterator[List[ModelType]]:
+        # Cursor no servidor: só um lote de objetos fica em memória por vez
+        result = await self._session.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.scalars().partitions():
+            yield partition
+    
+    async def existing_ids(self, ids: Iterable) -> Set[UUID]:
+        ids = {parse_uuid(id) for id in ids} - {None}
+        if not ids:
+            return set()
+        result = await self._session.execute(select(self.model.id).where(self.model.id.in_(ids)))
+        return set(result.scalars().all())
+    
+    async def bulk_insert(self, rows: List[dict]) -> None:
+        # Sem commit, sem refresh e sem hooks: quem chama atualiza o
+        # dashboard_stats e faz o commit do lote inteiro
+        if not rows:
+            return
+        connection = await self._session.connection()
+        if connection.dialect.name == "postgresql" and connection.dialect.driver == "asyncpg":
+            # COPY binário; a transação já foi aberta pelas consultas de
+            # validação do lote, então o COPY participa dela
+            from asyncpg.exceptions import IntegrityConstraintViolationError
+            
+            columns = list(rows[0])
+            raw = await connection.get_raw_connection()
+            try:
+                await raw.driver_connection.copy_records_to_table(
+                    self.model.__tablename__,
+                    records=[tuple(row[column] for column in columns) for row in rows],
+                    columns=columns
+                )
+            except IntegrityConstraintViolationError as exc:
+                # Na conexão crua o SQLAlchemy não converte o erro do driver;
+                # quem chama trata IntegrityError como no caminho do INSERT
+                raise IntegrityError(f"COPY {self.model.__tablename__}", None, exc) from exc
+        else:
+            # INSERT ... VALUES (...), (...) em lotes (insertmanyvalues); o
+            # insert na Table evita o processamento de bulk insert do ORM
+            await self._session.execute(insert(self.model.__table__), rows)
+    
+    async def update(self, id, data: dict) -> Optional[ModelType]:
+        # A leitura que precede a escrita não pode vir de uma réplica atrasada,
+        # e a linha fica travada até o commit: os hooks de dashboard_stats
+        # descontam os valores antigos sem concorrer com outra atualização
+        use_primary(self._session)
+        instance = await self.get_by_id(id, for_update=True)
+        if not instance:
+            return None
+        await self._before_update(instance)
+        for field, value in data.items():
+            setattr(instance, field, value)
+        await self._after_update(instance)
+        try:
+            await self._session.commit()
+        except IntegrityError:
+            await self._session.rollback()
+            raise
+        await self._session.refresh(instance)
+        return instance
+    
+    async def delete(self, id) -> bool:
+        use_primary(self._session)
+        instance = await self.get_by_id(id, for_update=True)
+        if not instance:
+            return False
+        await self._before_delete(instance)
+        await self._session.delete(instance)
+        await self._session.commit()
+        return True
+    
+    async def commit(self) -> None:
+        await self._session.commit()
+    
+    async def rollback(self) -> None:
+        await self._session.rollback()
+    
+    # Hooks executados antes do commit, dentro da mesma transação
+    async def _after_create(self, instance: ModelType) -> None:
+        pass
+    
+    async def _before_update(self, instance: ModelType) -> None:
+        pass
+    
+    async def _after_update(self, instance: ModelType) -> None:
+        pass
+    
+    async def _before_delete(self, instance: ModelType) -> None:
+        pass
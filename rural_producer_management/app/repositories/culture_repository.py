@@ -0,0 +1,56 @@
+from typing import Dict, Iterable, Optional, Set, Tuple
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.culture import Culture
+from app.models.farm import Farm
+from app.repositories.base import BaseRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository
+
+class CultureRepository(BaseRepository[Culture]):
+    model = Culture
+    
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+        self._stats = DashboardStatsRepository(session)
+    
+    async def count_by_name(self) -> Dict[str, int]:
+        # COUNT(*) (id é NOT NULL) é respondido só por ix_cultures_name_harvest_year
+        result = await self._session.execute(
+            select(Culture.name, func.count()).group_by(Culture.name)
+        )
+        return {name: count for name, count in result.all()}
+    
+    async def existing_keys(self, keys: Iterable[Tuple[str, str, str]]) -> Set[Tuple[str, str, str]]:
+        # Chaves (farm_id, name, harvest_year) já cadastradas
+        keys = set(keys)
+        if not keys:
+            return set()
+        columns = (Culture.farm_id, Culture.name, Culture.harvest_year)
+        result = await self._session.execute(select(*columns).where(tuple_(*columns).in_(keys)))
+        return {tuple(row) for row in result.all()}
+    
+    def export_query(
+        self,
+        state: Optional[str] = None,
+        harvest_year: Optional[str] = None,
+        nested: bool = False
+    ) -> Select:
+        # Culturas não têm filhos; nested é ignorado
+        query = select(Culture).order_by(Culture.created_at, Culture.id)
+        if state:
+            query = query.where(Culture.farm.has(Farm.state == state))
+        if harvest_year:
+            query = query.where(Culture.harvest_year == harvest_year)
+        return query
+    
+    async def _after_create(self, culture: Culture) -> None:
+        await self._stats.add_culture(culture.name)
+    
+    async def _before_update(self, culture: Culture) -> None:
+        await self._stats.add_culture(culture.name, -1)
+    
+    async def _after_update(self, culture: Culture) -> None:
+        await self._stats.add_culture(culture.name)
+    
+    async def _before_delete(self, culture: Culture) -> None:
+        await self._stats.add_culture(culture.name, -1)
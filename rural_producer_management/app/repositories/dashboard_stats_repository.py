@@ -0,0 +1,95 @@
+from decimal import Decimal
+from typing import Dict, List, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import use_primary
+from app.models.dashboard_stats import DashboardStat
+
+STATE = "state"
+CULTURE = "culture"
+
+StatKey = Tuple[str, str]
+
+def _decimal(value) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+# Read model do dashboard: contadores por estado e por cultura. As escritas
+# são aplicadas na sessão recebida, sem commit, para fazerem parte da mesma
+# transação da escrita em farms/cultures.
+class DashboardStatsRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    def use_primary(self) -> None:
+        use_primary(self._session)
+    
+    async def add_state(self, state: str, count: int, total_area, arable_area, vegetation_area) -> None:
+        await self._increment(
+            STATE, state,
+            count=count,
+            total_area=_decimal(total_area),
+            arable_area=_decimal(arable_area),
+            vegetation_area=_decimal(vegetation_area),
+        )
+    
+    async def add_farm(self, farm, sign: int = 1) -> None:
+        await self.add_state(
+            farm.state, sign,
+            sign * _decimal(farm.total_area),
+            sign * _decimal(farm.arable_area),
+            sign * _decimal(farm.vegetation_area),
+        )
+    
+    async def add_culture(self, name: str, count: int = 1) -> None:
+        await self._increment(CULTURE, name, count=count)
+    
+    async def _increment(self, kind: str, key: str, **deltas) -> None:
+        # Um único INSERT ... ON CONFLICT DO UPDATE SET col = col + delta:
+        # duas transações criando o mesmo (kind, key) não colidem e
+        # nenhuma atualização concorrente se perde
+        connection = await self._session.connection()
+        dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(DashboardStat).values(kind=kind, key=key, **deltas)
+        statement = statement.on_conflict_do_update(
+            index_elements=[DashboardStat.kind, DashboardStat.key],
+            set_={
+                **{
+                    field: getattr(DashboardStat, field) + getattr(statement.excluded, field)
+                    for field in deltas
+                },
+                "updated_at": func.now(),
+            }
+        )
+        await self._session.execute(statement)
+    
+    async def get_all(self) -> List[DashboardStat]:
+        result = await self._session.execute(
+            select(DashboardStat).where(DashboardStat.count > 0)
+        )
+        return list(result.scalars().all())
+    
+    async def get_snapshot(self) -> Dict[StatKey, Tuple]:
+        result = await self._session.execute(
+            select(DashboardStat).where(DashboardStat.count != 0)
+        )
+        return {
+            (stat.kind, stat.key): (
+                stat.count,
+                _decimal(stat.total_area),
+                _decimal(stat.arable_area),
+                _decimal(stat.vegetation_area),
+            )
+            for stat in result.scalars().all()
+        }
+    
+    async def replace_all(self, snapshot: Dict[StatKey, Tuple]) -> None:
+        await self._session.execute(delete(DashboardStat))
+        self._session.add_all([
+            DashboardStat(
+                kind=kind, key=key, count=count,
+                total_area=total_area, arable_area=arable_area, vegetation_area=vegetation_area,
+            )
+            for (kind, key), (count, total_area, arable_area, vegetation_area) in snapshot.items()
+        ])
+        await self._session.commit()
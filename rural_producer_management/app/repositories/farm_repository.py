@@ -0,0 +1,144 @@
+from typing import Dict, List, Optional
+from sqlalchemy import Select, and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.database import prefix_match
+from app.models.farm import Farm
+from app.models.culture import Culture
+from app.repositories.base import BaseRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository, STATE, CULTURE
+from app.schemas.farm import FarmSearchFilters
+
+class FarmRepository(BaseRepository[Farm]):
+    model = Farm
+    
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+        self._stats = DashboardStatsRepository(session)
+    
+    async def get_area_totals(self) -> Dict:
+        # Uma única linha agregada, independente do número de fazendas
+        result = await self._session.execute(
+            select(
+                func.count(Farm.id),
+                func.coalesce(func.sum(Farm.total_area), 0),
+                func.coalesce(func.sum(Farm.arable_area), 0),
+                func.coalesce(func.sum(Farm.vegetation_area), 0),
+            )
+        )
+        total_farms, total_area, arable_area, vegetation_area = result.one()
+        
+        return {
+            "total_farms": total_farms,
+            "total_area": float(total_area),
+            "arable_area": float(arable_area),
+            "vegetation_area": float(vegetation_area),
+        }
+    
+    async def count_by_state(self) -> Dict[str, int]:
+        result = await self._session.execute(
+            select(Farm.state, func.count(Farm.id)).group_by(Farm.state)
+        )
+        return {state: count for state, count in result.all()}
+    
+    async def aggregate_by_state(self) -> Dict[str, tuple]:
+        result = await self._session.execute(
+            select(
+                Farm.state,
+                func.count(Farm.id),
+                func.sum(Farm.total_area),
+                func.sum(Farm.arable_area),
+                func.sum(Farm.vegetation_area),
+            ).group_by(Farm.state)
+        )
+        return {state: tuple(values) for state, *values in result.all()}
+    
+    def export_query(
+        self,
+        state: Optional[str] = None,
+        harvest_year: Optional[str] = None,
+        nested: bool = False
+    ) -> Select:
+        query = select(Farm).order_by(Farm.created_at, Farm.id)
+        if state:
+            query = query.where(Farm.state == state)
+        if harvest_year:
+            query = query.where(Farm.cultures.any(Culture.harvest_year == harvest_year))
+        if nested:
+            cultures = Farm.cultures.and_(Culture.harvest_year == harvest_year) if harvest_year else Farm.cultures
+            query = query.options(selectinload(cultures))
+        return query
+    
+    def search_criteria(self, filters: FarmSearchFilters) -> List:
+        criteria = []
+        if filters.state:
+            criteria.append(Farm.state == filters.state)
+        if filters.city:
+            criteria.append(prefix_match(Farm.city, filters.city, self._session.bind.dialect.name))
+        if filters.min_total_area is not None:
+            criteria.append(Farm.total_area >= filters.min_total_area)
+        if filters.max_total_area is not None:
+            criteria.append(Farm.total_area <= filters.max_total_area)
+        if filters.min_arable_area is not None:
+            criteria.append(Farm.arable_area >= filters.min_arable_area)
+        if filters.max_arable_area is not None:
+            criteria.append(Farm.arable_area <= filters.max_arable_area)
+        if filters.producer_id:
+            criteria.append(Farm.producer_id == filters.producer_id)
+        
+        # Cultura e safra valem para a mesma linha de cultures: um único
+        # EXISTS, respondido por ix_cultures_harvest_farm_id ou pela unique
+        culture_criteria = []
+        if filters.culture:
+            culture_criteria.append(Culture.name == filters.culture)
+        if filters.harvest_year:
+            culture_criteria.append(Culture.harvest_year == filters.harvest_year)
+        if culture_criteria:
+            criteria.append(Farm.cultures.any(and_(*culture_criteria)))
+        return criteria
+    
+    async def search_facets(self, criteria: List) -> Dict[str, Dict[str, int]]:
+        # Contagens para o mesmo filtro da busca: fazendas por estado e
+        # culturas plantadas por nome (mesma métrica do dashboard)
+        if not criteria:
+            # Sem filtro, o read model já tem as contagens: O(estados + culturas)
+            stats = await self._stats.get_all()
+            return {
+                "states": {s.key: s.count for s in stats if s.kind == STATE},
+                "cultures": {s.key: s.count for s in stats if s.kind == CULTURE},
+            }
+        
+        states = await self._session.execute(
+            select(Farm.state, func.count()).where(*criteria).group_by(Farm.state)
+        )
+        cultures = await self._session.execute(
+            select(Culture.name, func.count())
+            .select_from(Farm)
+            .join(Culture, Culture.farm_id == Farm.id)
+            .where(*criteria)
+            .group_by(Culture.name)
+        )
+        return {
+            "states": {state: count for state, count in states.all()},
+            "cultures": {name: count for name, count in cultures.all()},
+        }
+    
+    async def _after_create(self, farm: Farm) -> None:
+        await self._stats.add_farm(farm)
+    
+    async def _before_update(self, farm: Farm) -> None:
+        await self._stats.add_farm(farm, sign=-1)
+    
+    async def _after_update(self, farm: Farm) -> None:
+        await self._stats.add_farm(farm)
+    
+    async def _before_delete(self, farm: Farm) -> None:
+        # As culturas são removidas em cascata junto com a fazenda
+        await self._stats.add_farm(farm, sign=-1)
+        result = await self._session.execute(
+            select(Culture.name, func.count(Culture.id))
+            .where(Culture.farm_id == farm.id)
+            .group_by(Culture.name)
+        )
+        for name, count in result.all():
+            await self._stats.add_culture(name, -count)
@@ -0,0 +1,215 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import Select, func, literal, or_, select, true, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from app.models.producer import Producer
+from app.models.farm import Farm
+from app.models.culture import Culture
+from app.repositories.base import BaseRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository
+from app.utils.ids import parse_uuid
+from app.utils.text_search import TrigramIndex
+
+# Fallback da busca por nome sem pg_trgm: um índice por processo,
+# reconstruído quando a assinatura da tabela muda
+name_index = TrigramIndex()
+
+class ProducerRepository(BaseRepository[Producer]):
+    model = Producer
+    
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+        self._stats = DashboardStatsRepository(session)
+    
+    async def get_by_document(self, document_number: int, document_type: str) -> Optional[Producer]:
+        result = await self._session.execute(
+            select(Producer).where(
+                Producer.document_number == document_number,
+                Producer.document_type == document_type
+            )
+        )
+        return result.scalars().first()
+    
+    async def existing_documents(self, keys: Iterable[Tuple[int, str]]) -> Set[Tuple[int, str]]:
+        # Chaves (document_number, document_type) já cadastradas
+        keys = set(keys)
+        if not keys:
+            return set()
+        columns = (Producer.document_number, Producer.document_type)
+        result = await self._session.execute(select(*columns).where(tuple_(*columns).in_(keys)))
+        return {tuple(row) for row in result.all()}
+    
+    async def get_full(self, id) -> Optional[Tuple[Producer, Dict]]:
+        # Duas consultas, qualquer que seja o número de fazendas e culturas:
+        # 1) o produtor com as fazendas (joinedload: um só produtor, então o
+        #    JOIN não repete linhas além das fazendas) e os totais de área,
+        #    agregados em uma subconsulta filtrada pelo mesmo id;
+        # 2) as culturas de todas as fazendas (selectinload, IN (...)).
+        id = parse_uuid(id)
+        if id is None:
+            return None
+        totals = (
+            select(
+                Farm.producer_id,
+                func.count(Farm.id).label("total_farms"),
+                func.sum(Farm.total_area).label("total_area"),
+                func.sum(Farm.arable_area).label("arable_area"),
+                func.sum(Farm.vegetation_area).label("vegetation_area"),
+            )
+            .where(Farm.producer_id == id)
+            .group_by(Farm.producer_id)
+            .subquery()
+        )
+        result = await self._session.execute(
+            select(
+                Producer,
+                func.coalesce(totals.c.total_farms, 0),
+                func.coalesce(totals.c.total_area, 0),
+                func.coalesce(totals.c.arable_area, 0),
+                func.coalesce(totals.c.vegetation_area, 0),
+            )
+            .outerjoin(totals, totals.c.producer_id == Producer.id)
+            .where(Producer.id == id)
+            .options(joinedload(Producer.farms).selectinload(Farm.cultures))
+        )
+        row = result.unique().first()
+        if row is None:
+            return None
+        producer, total_farms, total_area, arable_area, vegetation_area = row
+        return producer, {
+            "total_farms": total_farms,
+            "total_area": total_area,
+            "arable_area": arable_area,
+            "vegetation_area": vegetation_area,
+        }
+    
+    async def current_contents(self, keys: Iterable[Tuple[int, str]]) -> Dict[Tuple[int, str], Tuple[str, str]]:
+        # (cpf_cnpj, name) atuais por chave, para o upsert comparar conteúdos
+        keys = set(keys)
+        if not keys:
+            return {}
+        columns = (Producer.document_number, Producer.document_type)
+        result = await self._session.execute(
+            select(*columns, Producer.cpf_cnpj, Producer.name).where(tuple_(*columns).in_(keys))
+        )
+        return {(number, kind): (cpf_cnpj, name) for number, kind, cpf_cnpj, name in result.all()}
+    
+    async def upsert_many(self, rows: List[dict]) -> Set[Tuple[int, str]]:
+        # INSERT ... ON CONFLICT (document_number, document_type) DO UPDATE
+        # em um único comando (PostgreSQL e SQLite têm a mesma sintaxe). O
+        # WHERE do DO UPDATE pula linhas iguais, o que mantém o comando
+        # idempotente mesmo contra escritas concorrentes. Devolve as chaves
+        # inseridas ou alteradas; sem commit.
+        if not rows:
+            return set()
+        dialect = self._session.bind.dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = insert(Producer).values(rows)
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[Producer.document_number, Producer.document_type],
+            set_={"cpf_cnpj": excluded.cpf_cnpj, "name": excluded.name, "updated_at": func.now()},
+            where=or_(
+                Producer.cpf_cnpj.is_distinct_from(excluded.cpf_cnpj),
+                Producer.name.is_distinct_from(excluded.name),
+            )
+        ).returning(Producer.document_number, Producer.document_type)
+        result = await self._session.execute(statement)
+        written = {tuple(row) for row in result.all()}
+        if written:
+            name_index.invalidate()
+        return written
+    
+    async def search_by_name(self, query: str, limit: int) -> List[Tuple[Producer, float]]:
+        if self._session.bind.dialect.name == "postgresql":
+            return await self._search_trigram(query, limit)
+        return await self._search_fallback(query, limit)
+    
+    async def _search_trigram(self, query: str, limit: int) -> List[Tuple[Producer, float]]:
+        # <% usa o índice GIN ix_producers_name_trgm, criado sobre a mesma
+        # expressão f_unaccent(lower(name))
+        name = func.f_unaccent(func.lower(Producer.name))
+        term = func.f_unaccent(func.lower(literal(query)))
+        score = func.word_similarity(term, name)
+        result = await self._session.execute(
+            select(Producer, score)
+            .where(term.op("<%")(name))
+            .order_by(score.desc(), func.similarity(term, name).desc(), Producer.name)
+            .limit(limit)
+        )
+        return [(producer, float(value)) for producer, value in result.all()]
+    
+    async def _search_fallback(self, query: str, limit: int) -> List[Tuple[Producer, float]]:
+        # Inserções em lote, exclusões e escritas de outros processos mudam
+        # a assinatura; escritas deste processo invalidam pelos hooks
+        signature = tuple((await self._session.execute(
+            select(func.count(), func.max(Producer.id), func.max(Producer.updated_at))
+        )).one())
+        if name_index.signature != signature:
+            rows = await self._session.execute(select(Producer.id, Producer.name))
+            name_index.rebuild(rows.all(), signature)
+        
+        hits = name_index.search(query, limit)
+        if not hits:
+            return []
+        result = await self._session.execute(select(Producer).where(Producer.id.in_([key for key, _ in hits])))
+        producers = {producer.id: producer for producer in result.scalars().all()}
+        return [(producers[key], score) for key, score in hits if key in producers]
+    
+    def export_query(
+        self,
+        state: Optional[str] = None,
+        harvest_year: Optional[str] = None,
+        nested: bool = False
+    ) -> Select:
+        farm_filter = true()
+        if state:
+            farm_filter = farm_filter & (Farm.state == state)
+        if harvest_year:
+            farm_filter = farm_filter & Farm.cultures.any(Culture.harvest_year == harvest_year)
+        
+        query = select(Producer).order_by(Producer.created_at, Producer.id)
+        if state or harvest_year:
+            query = query.where(Producer.farms.any(farm_filter))
+        if nested:
+            # selectinload roda uma consulta IN (...) por lote de produtores,
+            # em vez de uma consulta por produtor
+            culture_filter = Culture.harvest_year == harvest_year if harvest_year else true()
+            query = query.options(
+                selectinload(Producer.farms.and_(farm_filter))
+                .selectinload(Farm.cultures.and_(culture_filter))
+            )
+        return query
+    
+    async def _after_create(self, producer: Producer) -> None:
+        name_index.invalidate()
+    
+    async def _after_update(self, producer: Producer) -> None:
+        name_index.invalidate()
+    
+    async def _before_delete(self, producer: Producer) -> None:
+        name_index.invalidate()
+        # Fazendas e culturas do produtor são removidas em cascata
+        farm_rows = await self._session.execute(
+            select(
+                Farm.state,
+                func.count(Farm.id),
+                func.sum(Farm.total_area),
+                func.sum(Farm.arable_area),
+                func.sum(Farm.vegetation_area),
+            )
+            .where(Farm.producer_id == producer.id)
+            .group_by(Farm.state)
+        )
+        for state, count, total_area, arable_area, vegetation_area in farm_rows.all():
+            await self._stats.add_state(state, -count, -total_area, -arable_area, -vegetation_area)
+        
+        culture_rows = await self._session.execute(
+            select(Culture.name, func.count(Culture.id))
+            .join(Farm, Culture.farm_id == Farm.id)
+            .where(Farm.producer_id == producer.id)
+            .group_by(Culture.name)
+        )
+        for name, count in culture_rows.all():
+            await self._stats.add_culture(name, -count)
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List
+
+class ProducerImportRow(BaseModel):
+    # Mesmos campos de ProducerCreate; o CPF/CNPJ é validado em lote
+    # (validate_many) para o lote inteiro antes da validação por linha
+    cpf_cnpj: str
+    name: str
+
+class ImportRowError(BaseModel):
+    line: int
+    errors: List[str]
+
+class ImportReport(BaseModel):
+    inserted: Dict[str, int] = Field(
+        default_factory=lambda: {"producers": 0, "farms": 0, "cultures": 0}
+    )
+    errors: List[ImportRowError] = Field(default_factory=list)
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from uuid import UUID
+
+class CultureBase(BaseModel):
+    name: str
+    harvest_year: str
+
+class CultureCreate(CultureBase):
+    farm_id: str
+
+class CultureUpdate(CultureBase):
+    pass
+
+class CultureResponse(CultureBase):
+    id: UUID
+    farm_id: UUID
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,10 @@
-from pydantic import BaseModel, validator
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from typing import Dict, List, Optional
 from datetime import datetime
+from uuid import UUID
 from decimal import Decimal
+from app.schemas.culture import CultureResponse
+from app.schemas.pagination import Page
 
 class FarmBase(BaseModel):
     name: str
@@ -11,18 +14,20 @@ class FarmBase(BaseModel):
     arable_area: Decimal
     vegetation_area: Decimal
     
-    @validator('state')
-    def validate_state(cls, v):
+    @field_validator('state')
+    @classmethod
+    def validate_state(cls, v: str) -> str:
         if len(v) != 2 or not v.isupper():
             raise ValueError('Estado deve ter 2 caracteres maiúsculos')
         return v
     
-    @validator('vegetation_area')
-    def validate_area_sum(cls, v, values):
-        if 'arable_area' in values and 'total_area' in values:
-            if v + values['arable_area'] > values['total_area']:
-                raise ValueError('Soma das áreas não pode exceder área total')
-        return v
+    @model_validator(mode='after')
+    def validate_area_sum(self) -> 'FarmBase':
+        # Roda depois de todos os campos validados, sem depender da ordem
+        # de declaração; se algum campo falhou, não chega a ser chamado
+        if self.arable_area + self.vegetation_area > self.total_area:
+            raise ValueError('Soma das áreas não pode exceder área total')
+        return self
 
 class FarmCreate(FarmBase):
     producer_id: str
@@ -31,10 +36,31 @@ class FarmUpdate(FarmBase):
     pass
 
 class FarmResponse(FarmBase):
-    id: str
-    producer_id: str
+    id: UUID
+    producer_id: UUID
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class FarmDetailResponse(FarmResponse):
+    cultures: List[CultureResponse]
+
+class FarmSearchFilters(BaseModel):
+    state: Optional[str] = None
+    city: Optional[str] = None  # prefixo
+    min_total_area: Optional[Decimal] = None
+    max_total_area: Optional[Decimal] = None
+    min_arable_area: Optional[Decimal] = None
+    max_arable_area: Optional[Decimal] = None
+    culture: Optional[str] = None
+    harvest_year: Optional[str] = None
+    producer_id: Optional[UUID] = None
+
+class FarmFacets(BaseModel):
+    states: Dict[str, int]
+    cultures: Dict[str, int]
+
+class FarmSearchPage(Page[FarmResponse]):
+    facets: Optional[FarmFacets] = None
+
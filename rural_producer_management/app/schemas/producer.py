@@ -1,14 +1,18 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import List, Optional
 from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+from app.schemas.farm import FarmDetailResponse
 from app.utils.validators import validate_cpf_cnpj
 
 class ProducerBase(BaseModel):
     cpf_cnpj: str
     name: str
     
-    @validator('cpf_cnpj')
-    def validate_cpf_cnpj_format(cls, v):
+    @field_validator('cpf_cnpj')
+    @classmethod
+    def validate_cpf_cnpj_format(cls, v: str) -> str:
         if not validate_cpf_cnpj(v):
             raise ValueError('CPF/CNPJ inválido')
         return v
@@ -20,9 +24,29 @@ class ProducerUpdate(ProducerBase):
     pass
 
 class ProducerResponse(ProducerBase):
-    id: str
+    id: UUID
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class ProducerSearchResult(ProducerResponse):
+    # Similaridade entre a busca e o nome (0 a 1), usada na ordenação
+    score: float
+
+class ProducerBulkUpsertResult(BaseModel):
+    # Contagens por CPF/CNPJ distinto; repetições no lote contam uma vez
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+class ProducerAreaTotals(BaseModel):
+    total_farms: int
+    total_area: Decimal
+    arable_area: Decimal
+    vegetation_area: Decimal
+
+class ProducerDetailResponse(ProducerResponse):
+    # GET /producers/{id}/full: fazendas com culturas e totais de área
+    farms: List[FarmDetailResponse]
+    totals: ProducerAreaTotals
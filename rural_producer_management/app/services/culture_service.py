@@ -0,0 +1,64 @@
+from typing import Dict, List, Optional
+from app.repositories.culture_repository import CultureRepository
+from app.repositories.farm_repository import FarmRepository
+from app.schemas.culture import CultureCreate, CultureUpdate, CultureResponse
+from app.utils.cache import CoalescingCache, DASHBOARD_CACHE_KEY
+from app.utils.logger import get_logger
+from app.utils.pagination import paginate
+from app.utils.serialization import rows_to_dicts
+
+logger = get_logger(__name__)
+
+RESPONSE_COLUMNS = list(CultureResponse.model_fields)
+
+class CultureService:
+    def __init__(
+        self,
+        repository: CultureRepository,
+        farm_repository: FarmRepository,
+        cache: Optional[CoalescingCache] = None
+    ):
+        self._repository = repository
+        self._farm_repository = farm_repository
+        self._cache = cache
+    
+    async def create(self, data: CultureCreate) -> Optional[CultureResponse]:
+        if not await self._farm_repository.get_by_id(data.farm_id):
+            return None
+        logger.info("Creating culture: %s", data.name, extra={"farm_id": data.farm_id})
+        culture = await self._repository.create(data.model_dump())
+        logger.info("Culture created: %s", culture.id, extra={"culture_id": culture.id})
+        await self._invalidate_dashboard()
+        return CultureResponse.model_validate(culture)
+    
+    async def get_by_id(self, culture_id: str) -> Optional[CultureResponse]:
+        culture = await self._repository.get_by_id(culture_id)
+        return CultureResponse.model_validate(culture) if culture else None
+    
+    async def get_all(self) -> List[CultureResponse]:
+        cultures = await self._repository.get_all()
+        return [CultureResponse.model_validate(c) for c in cultures]
+    
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> Dict:
+        # Caminho rápido da listagem: só as colunas do CultureResponse, em
+        # dicts serializados direto pelo orjson, sem model_validate por linha
+        rows, next_cursor = await paginate(self._repository, limit, cursor, columns=RESPONSE_COLUMNS)
+        return {"items": rows_to_dicts(rows), "next_cursor": next_cursor}
+    
+    async def update(self, culture_id: str, data: CultureUpdate) -> Optional[CultureResponse]:
+        logger.info("Updating culture: %s", culture_id, extra={"culture_id": culture_id})
+        culture = await self._repository.update(culture_id, data.model_dump())
+        if culture:
+            await self._invalidate_dashboard()
+        return CultureResponse.model_validate(culture) if culture else None
+    
+    async def delete(self, culture_id: str) -> bool:
+        logger.info("Deleting culture: %s", culture_id, extra={"culture_id": culture_id})
+        deleted = await self._repository.delete(culture_id)
+        if deleted:
+            await self._invalidate_dashboard()
+        return deleted
+    
+    async def _invalidate_dashboard(self) -> None:
+        if self._cache is not None:
+            await self._cache.invalidate(DASHBOARD_CACHE_KEY)
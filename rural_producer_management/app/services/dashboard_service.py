@@ -1,41 +1,93 @@
-from typing import Dict, List
+from decimal import Decimal
+from typing import Dict, List, Optional
 from app.repositories.farm_repository import FarmRepository
 from app.repositories.culture_repository import CultureRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository, STATE, CULTURE
+from app.utils.cache import CoalescingCache, DASHBOARD_CACHE_KEY
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+ZERO = Decimal("0")
+
 class DashboardService:
-    def __init__(self, farm_repo: FarmRepository, culture_repo: CultureRepository):
+    def __init__(
+        self,
+        farm_repo: FarmRepository,
+        culture_repo: CultureRepository,
+        stats_repo: DashboardStatsRepository,
+        cache: Optional[CoalescingCache] = None
+    ):
         self._farm_repo = farm_repo
         self._culture_repo = culture_repo
+        self._stats_repo = stats_repo
+        self._cache = cache
     
     async def get_dashboard_data(self) -> Dict:
+        if self._cache is None:
+            return await self._compute_dashboard_data()
+        return await self._cache.get_or_load(DASHBOARD_CACHE_KEY, self._compute_dashboard_data)
+    
+    async def _compute_dashboard_data(self) -> Dict:
         logger.info("Generating dashboard data")
         
-        farms = await self._farm_repo.get_all()
-        cultures = await self._culture_repo.get_all()
+        # Recarga logo após uma invalidação: a réplica pode não ter a escrita
+        # ainda, e o valor lido ficaria no cache por cache_timeout
+        if self._cache is not None and await self._cache.recently_invalidated(DASHBOARD_CACHE_KEY):
+            self._stats_repo.use_primary()
         
-        total_farms = len(farms)
-        total_hectares = sum(float(farm.total_area) for farm in farms)
+        # Leitura do read model: O(estados + culturas)
+        stats = await self._stats_repo.get_all()
         
+        total_farms = 0
+        total_hectares = arable = vegetation = 0.0
         state_distribution = {}
-        for farm in farms:
-            state_distribution[farm.state] = state_distribution.get(farm.state, 0) + 1
-        
         culture_distribution = {}
-        for culture in cultures:
-            culture_distribution[culture.name] = culture_distribution.get(culture.name, 0) + 1
         
-        land_use = {
-            "arable": sum(float(farm.arable_area) for farm in farms),
-            "vegetation": sum(float(farm.vegetation_area) for farm in farms)
-        }
+        for stat in stats:
+            if stat.kind == STATE:
+                state_distribution[stat.key] = stat.count
+                total_farms += stat.count
+                total_hectares += float(stat.total_area)
+                arable += float(stat.arable_area)
+                vegetation += float(stat.vegetation_area)
+            elif stat.kind == CULTURE:
+                culture_distribution[stat.key] = stat.count
         
         return {
             "total_farms": total_farms,
             "total_hectares": total_hectares,
             "state_distribution": state_distribution,
             "culture_distribution": culture_distribution,
-            "land_use": land_use
-        }
\ No newline at end of file
+            "land_use": {"arable": arable, "vegetation": vegetation}
+        }
+    
+    async def rebuild_stats(self, check_only: bool = False) -> List[str]:
+        logger.info("Rebuilding dashboard stats")
+        
+        # Recalcula do zero a partir de farms/cultures
+        expected = {}
+        for state, (count, total_area, arable_area, vegetation_area) in (
+            await self._farm_repo.aggregate_by_state()
+        ).items():
+            expected[(STATE, state)] = (
+                count, Decimal(total_area), Decimal(arable_area), Decimal(vegetation_area)
+            )
+        for name, count in (await self._culture_repo.count_by_name()).items():
+            expected[(CULTURE, name)] = (count, ZERO, ZERO, ZERO)
+        
+        current = await self._stats_repo.get_snapshot()
+        drift = sorted(
+            f"{kind}:{key} expected={expected.get((kind, key))} found={current.get((kind, key))}"
+            for kind, key in expected.keys() | current.keys()
+            if expected.get((kind, key)) != current.get((kind, key))
+        )
+        
+        if drift:
+            logger.warning("Dashboard stats drift detected: %d entries", len(drift))
+        if not check_only:
+            await self._stats_repo.replace_all(expected)
+            if self._cache is not None:
+                await self._cache.invalidate(DASHBOARD_CACHE_KEY)
+        
+        return drift
@@ -0,0 +1,62 @@
+from typing import AsyncIterator, Dict, List, Optional
+from app.config import settings
+from app.repositories.producer_repository import ProducerRepository
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.culture_repository import CultureRepository
+from app.utils.export import to_dict
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Colunas exportadas por entidade (e tabela): as mesmas das respostas da
+# API; colunas internas, como document_number/document_type, ficam de fora
+EXPORT_COLUMNS = {
+    "producers": ["id", "cpf_cnpj", "name", "created_at", "updated_at"],
+    "farms": [
+        "id", "producer_id", "name", "city", "state",
+        "total_area", "arable_area", "vegetation_area", "created_at", "updated_at",
+    ],
+    "cultures": ["id", "farm_id", "name", "harvest_year", "created_at"],
+}
+
+# Relações incluídas em cada entidade quando nested=True
+NESTED_RELATIONS = {
+    "producers": {"farms": {"cultures": {}}},
+    "farms": {"cultures": {}},
+    "cultures": {},
+}
+
+class ExportService:
+    def __init__(
+        self,
+        producer_repository: ProducerRepository,
+        farm_repository: FarmRepository,
+        culture_repository: CultureRepository,
+        batch_size: Optional[int] = None
+    ):
+        self._repositories = {
+            "producers": producer_repository,
+            "farms": farm_repository,
+            "cultures": culture_repository,
+        }
+        self._batch_size = batch_size or settings.export_batch_size
+    
+    def supports(self, entity: str) -> bool:
+        return entity in self._repositories
+    
+    def columns(self, entity: str) -> List[str]:
+        return EXPORT_COLUMNS[entity]
+    
+    async def stream(
+        self,
+        entity: str,
+        state: Optional[str] = None,
+        harvest_year: Optional[str] = None,
+        nested: bool = False
+    ) -> AsyncIterator[List[Dict]]:
+        logger.info("Exporting %s (state=%s, harvest_year=%s, nested=%s)", entity, state, harvest_year, nested)
+        repository = self._repositories[entity]
+        query = repository.export_query(state, harvest_year, nested)
+        relations = NESTED_RELATIONS[entity] if nested else {}
+        async for batch in repository.stream(query, self._batch_size):
+            yield [to_dict(instance, EXPORT_COLUMNS, relations) for instance in batch]
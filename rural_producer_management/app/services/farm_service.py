@@ -0,0 +1,79 @@
+from typing import Dict, List, Optional
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.producer_repository import ProducerRepository
+from app.schemas.farm import FarmCreate, FarmUpdate, FarmResponse, FarmFacets, FarmSearchFilters, FarmSearchPage
+from app.utils.cache import CoalescingCache, DASHBOARD_CACHE_KEY
+from app.utils.logger import get_logger
+from app.utils.pagination import paginate
+from app.utils.serialization import rows_to_dicts
+
+logger = get_logger(__name__)
+
+RESPONSE_COLUMNS = list(FarmResponse.model_fields)
+
+class FarmService:
+    def __init__(
+        self,
+        repository: FarmRepository,
+        producer_repository: ProducerRepository,
+        cache: Optional[CoalescingCache] = None
+    ):
+        self._repository = repository
+        self._producer_repository = producer_repository
+        self._cache = cache
+    
+    async def create(self, data: FarmCreate) -> Optional[FarmResponse]:
+        if not await self._producer_repository.get_by_id(data.producer_id):
+            return None
+        logger.info("Creating farm: %s", data.name, extra={"producer_id": data.producer_id})
+        farm = await self._repository.create(data.model_dump())
+        logger.info("Farm created: %s", farm.id, extra={"farm_id": farm.id})
+        await self._invalidate_dashboard()
+        return FarmResponse.model_validate(farm)
+    
+    async def get_by_id(self, farm_id: str) -> Optional[FarmResponse]:
+        farm = await self._repository.get_by_id(farm_id)
+        return FarmResponse.model_validate(farm) if farm else None
+    
+    async def get_all(self) -> List[FarmResponse]:
+        farms = await self._repository.get_all()
+        return [FarmResponse.model_validate(f) for f in farms]
+    
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> Dict:
+        # Caminho rápido da listagem: só as colunas do FarmResponse, em
+        # dicts serializados direto pelo orjson, sem model_validate por linha
+        rows, next_cursor = await paginate(self._repository, limit, cursor, columns=RESPONSE_COLUMNS)
+        return {"items": rows_to_dicts(rows), "next_cursor": next_cursor}
+    
+    async def search(
+        self,
+        filters: FarmSearchFilters,
+        limit: int,
+        cursor: Optional[str] = None,
+        facets: bool = False
+    ) -> FarmSearchPage:
+        criteria = self._repository.search_criteria(filters)
+        farms, next_cursor = await paginate(self._repository, limit, cursor, *criteria)
+        return FarmSearchPage(
+            items=[FarmResponse.model_validate(item) for item in farms],
+            next_cursor=next_cursor,
+            facets=FarmFacets(**await self._repository.search_facets(criteria)) if facets else None
+        )
+    
+    async def update(self, farm_id: str, data: FarmUpdate) -> Optional[FarmResponse]:
+        logger.info("Updating farm: %s", farm_id, extra={"farm_id": farm_id})
+        farm = await self._repository.update(farm_id, data.model_dump())
+        if farm:
+            await self._invalidate_dashboard()
+        return FarmResponse.model_validate(farm) if farm else None
+    
+    async def delete(self, farm_id: str) -> bool:
+        logger.info("Deleting farm: %s", farm_id, extra={"farm_id": farm_id})
+        deleted = await self._repository.delete(farm_id)
+        if deleted:
+            await self._invalidate_dashboard()
+        return deleted
+    
+    async def _invalidate_dashboard(self) -> None:
+        if self._cache is not None:
+            await self._cache.invalidate(DASHBOARD_CACHE_KEY)
@@ -0,0 +1,243 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import AsyncIterable, Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from app.config import settings
+from app.repositories.producer_repository import ProducerRepository
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.culture_repository import CultureRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository
+from app.schemas.farm import FarmCreate
+from app.schemas.culture import CultureCreate
+from app.schemas.bulk_import import ImportReport, ImportRowError, ProducerImportRow
+from app.utils.bulk_import import Line, RowDecoder, achunked, csv_records
+from app.utils.cache import CoalescingCache, DASHBOARD_CACHE_KEY
+from app.utils.ids import parse_uuid, uuid7
+from app.utils.logger import get_logger
+from app.utils.validators import document_key, validate_many
+
+logger = get_logger(__name__)
+
+ENTITIES = ("producers", "farms", "cultures")
+
+# Registros validados de uma linha do arquivo: (entidade, valores)
+Records = List[Tuple[str, Dict]]
+
+def _messages(exc: ValidationError) -> List[str]:
+    # Erros de model_validator (checagens entre campos) não têm loc
+    return [
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" if error['loc'] else error['msg']
+        for error in exc.errors()
+    ]
+
+class ImportService:
+    # Importação em lote: cada lote de linhas é validado com os mesmos
+    # schemas da API, checado contra o banco com poucas consultas IN (...)
+    # e gravado com INSERT multi-linha (ou COPY no PostgreSQL) em uma
+    # única transação. Uma linha é atômica: se um filho aninhado é
+    # inválido, a linha inteira é rejeitada.
+    def __init__(
+        self,
+        producer_repository: ProducerRepository,
+        farm_repository: FarmRepository,
+        culture_repository: CultureRepository,
+        stats_repository: DashboardStatsRepository,
+        cache: Optional[CoalescingCache] = None,
+        chunk_size: Optional[int] = None
+    ):
+        self._repositories = {
+            "producers": producer_repository,
+            "farms": farm_repository,
+            "cultures": culture_repository,
+        }
+        self._stats_repository = stats_repository
+        self._cache = cache
+        self._chunk_size = chunk_size or settings.import_chunk_size
+    
+    def supports(self, entity: str) -> bool:
+        return entity in self._repositories
+    
+    async def import_lines(
+        self,
+        entity: str,
+        lines: AsyncIterable[Line],
+        format: str = "ndjson"
+    ) -> ImportReport:
+        report = ImportReport()
+        decoder = RowDecoder(format)
+        if format == "csv":
+            lines = csv_records(lines)
+        async for chunk in achunked(self._decode(decoder, lines), self._chunk_size):
+            await self._import_chunk(entity, chunk, report)
+        report.errors.sort(key=lambda error: error.line)
+        
+        logger.info("Import %s: inserted=%s errors=%d", entity, report.inserted, len(report.errors))
+        if self._cache and any(report.inserted.values()):
+            await self._cache.invalidate(DASHBOARD_CACHE_KEY)
+        return report
+    
+    async def _decode(self, decoder: RowDecoder, lines: AsyncIterable[Line]):
+        async for number, line in lines:
+            if isinstance(line, ValueError):
+                yield number, line
+                continue
+            if not line.strip() or decoder.is_header(line):
+                continue
+            try:
+                yield number, decoder.decode(line)
+            except ValueError as exc:
+                yield number, exc
+    
+    async def _import_chunk(self, entity: str, chunk: List, report: ImportReport) -> None:
+        validated: Dict[int, Records] = {}
+        valid_documents = self._validate_documents(entity, chunk)
+        for number, row in chunk:
+            if isinstance(row, Exception):
+                report.errors.append(ImportRowError(line=number, errors=[str(row)]))
+                continue
+            try:
+                validated[number] = self._validate(entity, row, valid_documents.get(number, False))
+            except ValidationError as exc:
+                report.errors.append(ImportRowError(line=number, errors=_messages(exc)))
+            except ValueError as exc:
+                report.errors.append(ImportRowError(line=number, errors=[str(exc)]))
+        
+        accepted = await self._check_integrity(validated, report)
+        rows = defaultdict(list)
+        for records in accepted.values():
+            for kind, values in records:
+                rows[kind].append(values)
+        if not rows:
+            return
+        
+        try:
+            for kind in ENTITIES:
+                await self._repositories[kind].bulk_insert(rows[kind])
+            await self._apply_stats(rows["farms"], rows["cultures"])
+            await self._repositories["producers"].commit()
+        except IntegrityError:
+            # Conflito com uma escrita concorrente: o lote inteiro é descartado
+            await self._repositories["producers"].rollback()
+            for number in accepted:
+                report.errors.append(ImportRowError(line=number, errors=["Conflito de integridade ao gravar o lote"]))
+            return
+        for kind in ENTITIES:
+            report.inserted[kind] += len(rows[kind])
+    
+    def _validate_documents(self, entity: str, chunk: List) -> Dict[int, bool]:
+        # Todos os CPF/CNPJ do lote em uma única chamada vetorizada
+        if entity != "producers":
+            return {}
+        numbers, documents = [], []
+        for number, row in chunk:
+            if isinstance(row, dict) and isinstance(row.get("cpf_cnpj"), str):
+                numbers.append(number)
+                documents.append(row["cpf_cnpj"])
+        return dict(zip(numbers, validate_many(documents).tolist()))
+    
+    def _validate(self, entity: str, row: Dict, document_valid: bool) -> Records:
+        if entity == "producers":
+            return self._producer_records(row, document_valid)
+        if entity == "farms":
+            return self._farm_records(row)
+        return [self._culture_record(row)]
+    
+    def _producer_records(self, row: Dict, document_valid: bool) -> Records:
+        farms = row.pop("farms", None) or []
+        producer = ProducerImportRow.model_validate(row).model_dump()
+        if not document_valid:
+            raise ValueError("cpf_cnpj: CPF/CNPJ inválido")
+        # O insert em lote não passa pelo @validates do modelo
+        producer["document_number"], producer["document_type"] = document_key(producer["cpf_cnpj"])
+        producer["id"] = uuid7()
+        records = [("producers", producer)]
+        for farm in farms:
+            records += self._farm_records({**farm, "producer_id": str(producer["id"])})
+        return records
+    
+    def _farm_records(self, row: Dict) -> Records:
+        cultures = row.pop("cultures", None) or []
+        farm = FarmCreate.model_validate(row).model_dump()
+        # Ids malformados viram None e são rejeitados como inexistentes
+        farm["producer_id"] = parse_uuid(farm["producer_id"])
+        farm["id"] = uuid7()
+        records = [("farms", farm)]
+        for culture in cultures:
+            records.append(self._culture_record({**culture, "farm_id": str(farm["id"])}))
+        return records
+    
+    def _culture_record(self, row: Dict) -> Tuple[str, Dict]:
+        culture = CultureCreate.model_validate(row).model_dump()
+        culture["farm_id"] = parse_uuid(culture["farm_id"])
+        culture["id"] = uuid7()
+        return "cultures", culture
+    
+    async def _check_integrity(self, validated: Dict[int, Records], report: ImportReport) -> Dict[int, Records]:
+        # Uma consulta por tipo de checagem para o lote inteiro
+        new_ids = {values["id"] for records in validated.values() for _, values in records}
+        documents, producer_ids, farm_ids, culture_keys = set(), set(), set(), set()
+        for records in validated.values():
+            for kind, values in records:
+                if kind == "producers":
+                    documents.add((values["document_number"], values["document_type"]))
+                elif kind == "farms" and values["producer_id"] not in new_ids:
+                    producer_ids.add(values["producer_id"])
+                elif kind == "cultures" and values["farm_id"] is not None and values["farm_id"] not in new_ids:
+                    farm_ids.add(values["farm_id"])
+                    culture_keys.add((values["farm_id"], values["name"], values["harvest_year"]))
+        
+        taken_documents = await self._repositories["producers"].existing_documents(documents)
+        known_producers = await self._repositories["producers"].existing_ids(producer_ids)
+        known_farms = await self._repositories["farms"].existing_ids(farm_ids)
+        taken_keys = await self._repositories["cultures"].existing_keys(culture_keys)
+        
+        known_producers |= new_ids
+        known_farms |= new_ids
+        accepted: Dict[int, Records] = {}
+        for number, records in validated.items():
+            # Chaves da própria linha entram nos conjuntos já durante a
+            # checagem: uma cultura repetida na mesma linha é erro da linha,
+            # não um IntegrityError que descartaria o lote inteiro
+            row_documents, row_keys, errors = set(), set(), []
+            for kind, values in records:
+                if kind == "producers":
+                    document = (values["document_number"], values["document_type"])
+                    if document in taken_documents or document in row_documents:
+                        errors.append("CPF/CNPJ já cadastrado")
+                    row_documents.add(document)
+                elif kind == "farms" and values["producer_id"] not in known_producers:
+                    errors.append("Produtor não encontrado")
+                elif kind == "cultures":
+                    key = (values["farm_id"], values["name"], values["harvest_year"])
+                    if values["farm_id"] not in known_farms:
+                        errors.append("Fazenda não encontrada")
+                    elif key in taken_keys or key in row_keys:
+                        errors.append("Cultura já cadastrada para a fazenda nesta safra")
+                    row_keys.add(key)
+            if errors:
+                report.errors.append(ImportRowError(line=number, errors=errors))
+                continue
+            # Duplicatas dentro do próprio arquivo: a primeira ocorrência vence
+            taken_documents |= row_documents
+            taken_keys |= row_keys
+            accepted[number] = records
+        return accepted
+    
+    async def _apply_stats(self, farms: List[Dict], cultures: List[Dict]) -> None:
+        # Um incremento por estado/cultura do lote, não por linha
+        states = defaultdict(lambda: [0, Decimal(0), Decimal(0), Decimal(0)])
+        for farm in farms:
+            totals = states[farm["state"]]
+            totals[0] += 1
+            totals[1] += farm["total_area"]
+            totals[2] += farm["arable_area"]
+            totals[3] += farm["vegetation_area"]
+        for state, totals in states.items():
+            await self._stats_repository.add_state(state, *totals)
+        
+        counts = defaultdict(int)
+        for culture in cultures:
+            counts[culture["name"]] += 1
+        for name, count in counts.items():
+            await self._stats_repository.add_culture(name, count)
@@ -1,33 +1,140 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from app.config import settings
 from app.repositories.producer_repository import ProducerRepository
-from app.schemas.producer import ProducerCreate, ProducerUpdate, ProducerResponse
+from app.schemas.farm import FarmDetailResponse, FarmResponse
+from app.schemas.producer import (
+    ProducerBulkUpsertResult, ProducerCreate, ProducerDetailResponse, ProducerUpdate, ProducerResponse, ProducerSearchResult
+)
+from app.utils.cache import CoalescingCache, DASHBOARD_CACHE_KEY
+from app.utils.ids import uuid7
 from app.utils.logger import get_logger
+from app.utils.pagination import paginate
+from app.utils.serialization import rows_to_dicts
+from app.utils.validators import document_key
 
 logger = get_logger(__name__)
 
+RESPONSE_COLUMNS = list(ProducerResponse.model_fields)
+FARM_COLUMNS = list(FarmResponse.model_fields)
+
 class ProducerService:
-    def __init__(self, repository: ProducerRepository):
+    def __init__(self, repository: ProducerRepository, cache: Optional[CoalescingCache] = None):
         self._repository = repository
+        self._cache = cache
     
     async def create(self, data: ProducerCreate) -> ProducerResponse:
-        logger.info(f"Creating producer: {data.name}")
-        producer = await self._repository.create(data.dict())
-        logger.info(f"Producer created: {producer.id}")
-        return ProducerResponse.from_orm(producer)
+        logger.info("Creating producer: %s", data.name)
+        producer = await self._repository.create(data.model_dump())
+        logger.info("Producer created: %s", producer.id, extra={"producer_id": producer.id})
+        await self._invalidate_dashboard()
+        return ProducerResponse.model_validate(producer)
     
     async def get_by_id(self, producer_id: str) -> Optional[ProducerResponse]:
         producer = await self._repository.get_by_id(producer_id)
-        return ProducerResponse.from_orm(producer) if producer else None
+        return ProducerResponse.model_validate(producer) if producer else None
+    
+    async def get_full(self, producer_id: str) -> Optional[ProducerDetailResponse]:
+        loaded = await self._repository.get_full(producer_id)
+        if loaded is None:
+            return None
+        producer, totals = loaded
+        # Fazendas e culturas na ordem de cadastro, como nas listagens; as
+        # coleções carregadas no ORM não são reordenadas
+        by_creation = lambda instance: (instance.created_at, instance.id)
+        farms = [
+            FarmDetailResponse(
+                **{name: getattr(farm, name) for name in FARM_COLUMNS},
+                cultures=sorted(farm.cultures, key=by_creation)
+            )
+            for farm in sorted(producer.farms, key=by_creation)
+        ]
+        return ProducerDetailResponse(
+            **{name: getattr(producer, name) for name in RESPONSE_COLUMNS}, farms=farms, totals=totals
+        )
+    
+    async def get_by_document(self, document_number: int, document_type: str) -> Optional[ProducerResponse]:
+        producer = await self._repository.get_by_document(document_number, document_type)
+        return ProducerResponse.model_validate(producer) if producer else None
     
     async def get_all(self) -> List[ProducerResponse]:
         producers = await self._repository.get_all()
-        return [ProducerResponse.from_orm(p) for p in producers]
+        return [ProducerResponse.model_validate(p) for p in producers]
+    
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> Dict:
+        # Caminho rápido da listagem: só as colunas do ProducerResponse, em
+        # dicts serializados direto pelo orjson, sem model_validate por linha
+        rows, next_cursor = await paginate(self._repository, limit, cursor, columns=RESPONSE_COLUMNS)
+        return {"items": rows_to_dicts(rows), "next_cursor": next_cursor}
+    
+    async def search(self, query: str, limit: int) -> List[ProducerSearchResult]:
+        results = await self._repository.search_by_name(query, limit)
+        return [
+            ProducerSearchResult(**{name: getattr(producer, name) for name in RESPONSE_COLUMNS}, score=round(score, 4))
+            for producer, score in results
+        ]
     
     async def update(self, producer_id: str, data: ProducerUpdate) -> Optional[ProducerResponse]:
-        logger.info(f"Updating producer: {producer_id}")
-        producer = await self._repository.update(producer_id, data.dict())
-        return ProducerResponse.from_orm(producer) if producer else None
+        logger.info("Updating producer: %s", producer_id, extra={"producer_id": producer_id})
+        producer = await self._repository.update(producer_id, data.model_dump())
+        if producer:
+            await self._invalidate_dashboard()
+        return ProducerResponse.model_validate(producer) if producer else None
     
     async def delete(self, producer_id: str) -> bool:
-        logger.info(f"Deleting producer: {producer_id}")
-        return await self._repository.delete(producer_id)
\ No newline at end of file
+        logger.info("Deleting producer: %s", producer_id, extra={"producer_id": producer_id})
+        deleted = await self._repository.delete(producer_id)
+        if deleted:
+            await self._invalidate_dashboard()
+        return deleted
+    
+    async def bulk_upsert(
+        self,
+        items: List[ProducerCreate],
+        chunk_size: Optional[int] = None
+    ) -> ProducerBulkUpsertResult:
+        # Sincronização idempotente: reenviar a mesma lista não grava nada.
+        # Por lote, uma consulta traz o conteúdo atual das chaves; só linhas
+        # novas ou com (cpf_cnpj, name) diferente vão para o upsert.
+        # Repetições do mesmo documento no lote: a última ocorrência vence.
+        chunk_size = chunk_size or settings.bulk_upsert_chunk_size
+        latest: Dict[Tuple[int, str], ProducerCreate] = {}
+        for item in items:
+            latest[document_key(item.cpf_cnpj)] = item
+        keys = list(latest)
+        result = ProducerBulkUpsertResult()
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            current = await self._repository.current_contents(chunk)
+            rows = []
+            for key in chunk:
+                item = latest[key]
+                stored = current.get(key)
+                if stored == (item.cpf_cnpj, item.name):
+                    continue
+                rows.append({
+                    "id": uuid7(),
+                    "cpf_cnpj": item.cpf_cnpj,
+                    "document_number": key[0],
+                    "document_type": key[1],
+                    "name": item.name,
+                })
+            written = await self._repository.upsert_many(rows)
+            await self._repository.commit()
+            
+            inserted = sum(1 for key in written if key not in current)
+            result.inserted += inserted
+            result.updated += len(written) - inserted
+            result.unchanged += len(chunk) - len(written)
+        
+        logger.info(
+            "Bulk upsert: inserted=%d updated=%d unchanged=%d",
+            result.inserted, result.updated, result.unchanged,
+            extra={"inserted": result.inserted, "updated": result.updated, "unchanged": result.unchanged}
+        )
+        if result.inserted or result.updated:
+            await self._invalidate_dashboard()
+        return result
+    
+    async def _invalidate_dashboard(self) -> None:
+        if self._cache is not None:
+            await self._cache.invalidate(DASHBOARD_CACHE_KEY)
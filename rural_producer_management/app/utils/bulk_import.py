@@ -0,0 +1,95 @@
+import csv
+import json
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Tuple, Union
+
+# Leitura incremental de CSV/NDJSON para a importação em lote
+
+FORMATS = ("ndjson", "csv")
+
+# Item de uma linha: o texto ou o erro que impediu de lê-la
+Line = Tuple[int, Union[str, ValueError]]
+
+def _decode_line(line: bytes) -> Union[str, ValueError]:
+    try:
+        return line.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError:
+        return ValueError("Linha com bytes inválidos: o arquivo deve estar em UTF-8")
+
+async def aiter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[Line]:
+    # Quebra um stream de bytes em linhas numeradas (a partir de 1). Só o
+    # chunk recebido é dividido: uma linha longa que chega em muitos chunks
+    # é acumulada em um bytearray, sem recopiar o que já foi lido.
+    pending = bytearray()
+    number = 0
+    async for chunk in chunks:
+        first, *rest = chunk.split(b"\n")
+        pending += first
+        for line in rest:
+            number += 1
+            yield number, _decode_line(bytes(pending))
+            pending = bytearray(line)
+    if pending:
+        yield number + 1, _decode_line(bytes(pending))
+
+async def csv_records(lines: AsyncIterable[Line]) -> AsyncIterator[Line]:
+    # Junta as linhas de um registro CSV com campo entre aspas que contém
+    # quebra de linha: o registro termina quando o número de aspas é par
+    # ("" escapado conta duas). O texto do registro, com as quebras, é
+    # interpretado pelo csv.reader; o número é o da primeira linha.
+    record: List[str] = []
+    start = quotes = 0
+    async for number, line in lines:
+        if isinstance(line, ValueError):
+            # Um registro incompleto é perdido junto com a linha ilegível
+            yield (start if record else number), line
+            record, quotes = [], 0
+            continue
+        if not record:
+            start = number
+        record.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield start, "\n".join(record)
+            record, quotes = [], 0
+    if record:
+        yield start, "\n".join(record)
+
+async def iter_file_lines(lines: Iterable[str]) -> AsyncIterator[Line]:
+    for number, line in enumerate(lines, start=1):
+        yield number, line.rstrip("\r\n")
+
+class RowDecoder:
+    # NDJSON: um objeto por linha. CSV: a primeira linha é o cabeçalho e
+    # campos vazios viram None.
+    def __init__(self, format: str):
+        if format not in FORMATS:
+            raise ValueError(f"Formato não suportado: {format}")
+        self._format = format
+        self._header: List[str] = []
+    
+    def is_header(self, line: str) -> bool:
+        if self._format == "csv" and not self._header:
+            self._header = next(csv.reader([line]))
+            return True
+        return False
+    
+    def decode(self, line: str) -> Dict:
+        if self._format == "ndjson":
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError("Cada linha deve ser um objeto JSON")
+            return row
+        values = next(csv.reader([line]))
+        if len(values) != len(self._header):
+            raise ValueError(f"Esperadas {len(self._header)} colunas, encontradas {len(values)}")
+        return {key: value if value != "" else None for key, value in zip(self._header, values)}
+
+async def achunked(items: AsyncIterable, size: int) -> AsyncIterator[List]:
+    chunk = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
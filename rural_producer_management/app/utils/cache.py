@@ -0,0 +1,155 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DASHBOARD_CACHE_KEY = "dashboard:data"
+
+# Marca gravada no backend por invalidate(); some sozinha após pin_seconds
+INVALIDATED_SUFFIX = ":invalidated"
+
+class CacheBackend:
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        raise NotImplementedError
+    
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+class InMemoryCache(CacheBackend):
+    # LRU em processo com expiração por entrada
+    def __init__(self, max_entries: int = 128, clock: Callable[[], float] = time.monotonic):
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._max_entries = max_entries
+        self._clock = clock
+    
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+    
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+class RedisCache(CacheBackend):
+    # Aceita qualquer cliente com a interface de redis.asyncio (get/set/delete)
+    def __init__(self, client, prefix: str = "rural:"):
+        self._client = client
+        self._prefix = prefix
+    
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCache":
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:
+            raise RuntimeError("CACHE_BACKEND=redis requer o pacote 'redis'") from exc
+        return cls(redis_asyncio.from_url(url))
+    
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(self._prefix + key)
+        return json.loads(raw) if raw is not None else None
+    
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self._client.set(self._prefix + key, json.dumps(value), ex=ttl)
+    
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._prefix + key)
+
+class CoalescingCache:
+    # Cache com TTL que agrupa misses concorrentes da mesma chave em um
+    # único carregamento; invalidações durante o carregamento descartam
+    # o resultado para não gravar um valor desatualizado.
+    def __init__(self, backend: CacheBackend, ttl: int, pin_seconds: int = 0):
+        self._backend = backend
+        self._ttl = ttl
+        self._pin_seconds = pin_seconds
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+        self._counters = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+    
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await self._backend.get(key)
+        if value is not None:
+            self._counters["hits"] += 1
+            return value
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._counters["coalesced"] += 1
+            return await asyncio.shield(inflight)
+        
+        self._counters["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generations.get(key, 0)
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Evita "exception was never retrieved" quando não há aguardando
+            future.exception()
+            raise
+        else:
+            if self._generations.get(key, 0) == generation:
+                await self._backend.set(key, value, self._ttl)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+    
+    async def invalidate(self, key: str) -> None:
+        self._counters["invalidations"] += 1
+        self._generations[key] = self._generations.get(key, 0) + 1
+        await self._backend.delete(key)
+        if self._pin_seconds:
+            # No backend, e não em memória: com Redis, o processo que recarrega
+            # a chave não é necessariamente o que a invalidou
+            await self._backend.set(key + INVALIDATED_SUFFIX, 1, self._pin_seconds)
+    
+    async def recently_invalidated(self, key: str) -> bool:
+        # Verdadeiro nos pin_seconds após invalidate(): a réplica pode ainda
+        # não ter a escrita que causou a invalidação
+        if not self._pin_seconds:
+            return False
+        return await self._backend.get(key + INVALIDATED_SUFFIX) is not None
+    
+    def stats(self) -> Dict[str, int]:
+        return dict(self._counters)
+
+def build_cache() -> CoalescingCache:
+    if settings.cache_backend == "redis":
+        backend = RedisCache.from_url(settings.redis_url)
+    else:
+        backend = InMemoryCache(max_entries=settings.cache_max_entries)
+    logger.info("Dashboard cache backend: %s", settings.cache_backend)
+    pin_seconds = settings.replica_pin_seconds if settings.read_database_url else 0
+    return CoalescingCache(backend, ttl=settings.cache_timeout, pin_seconds=pin_seconds)
+
+@lru_cache(maxsize=None)
+def shared_dashboard_cache() -> CoalescingCache:
+    # Uma instância por processo, criada no primeiro uso (o cliente Redis
+    # não é criado só por importar o módulo)
+    return build_cache()
@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List
+from uuid import UUID
+
+# Serialização linha a linha para as exportações em streaming
+
+def _default(value: Any) -> Any:
+    # Mesma representação da API: Decimal e UUID como string
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Tipo não serializável: {type(value).__name__}")
+
+def _value(value: Any) -> Any:
+    # Datas em ISO 8601 já aqui, para CSV e NDJSON saírem iguais à API
+    return value.isoformat() if isinstance(value, datetime) else value
+
+def to_dict(instance, columns: Dict[str, List[str]], nested: Dict[str, Any] = None) -> Dict[str, Any]:
+    # columns: colunas exportadas por tabela; nested: {"farms": {"cultures": {}}}
+    # inclui relações já carregadas
+    row = {key: _value(getattr(instance, key)) for key in columns[instance.__tablename__]}
+    for relation, children in (nested or {}).items():
+        row[relation] = [to_dict(child, columns, children) for child in getattr(instance, relation)]
+    return row
+
+async def ndjson_chunks(batches: AsyncIterator[List[Dict]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield "".join(json.dumps(row, default=_default) + "\n" for row in batch).encode()
+
+async def csv_chunks(batches: AsyncIterator[List[Dict]], columns: List[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    async for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
@@ -0,0 +1,37 @@
+import os
+import threading
+import time
+import uuid
+from typing import Any, Optional
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+def uuid7() -> uuid.UUID:
+    # UUIDv7 (RFC 9562): timestamp em ms nos 48 bits altos, então chaves
+    # geradas em sequência são crescentes e as inserções vão para o fim do
+    # índice B-tree. Dentro do mesmo ms, os 12 bits de rand_a funcionam como
+    # contador para manter a ordem.
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms, _counter = now_ms, int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # Contador esgotado: avança o timestamp lógico
+                _last_ms, _counter = _last_ms + 1, 0
+        timestamp, counter = _last_ms, _counter
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return uuid.UUID(int=timestamp << 80 | 0x7 << 76 | counter << 64 | 0x2 << 62 | rand_b)
+
+def parse_uuid(value: Any) -> Optional[uuid.UUID]:
+    # Ids recebidos como texto; None se não for um UUID válido
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
@@ -1,17 +1,169 @@
+import atexit
 import logging
+import queue
+import random
 import sys
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
+import orjson
 from app.config import settings
+from app.utils.routes import route_template
+from app.utils.serialization import OPTIONS
 
-def get_logger(name: str) -> logging.Logger:
-    logger = logging.getLogger(name)
+ROOT_LOGGER = "app"
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Atributos de todo LogRecord; o resto veio de extra={...} (ids de entidades)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+# request_id, scope ASGI e decisão de amostragem da requisição corrente
+_request_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar("log_request_context", default=None)
+
+_listener: Optional[QueueListener] = None
+
+class JsonFormatter(logging.Formatter):
+    # Uma linha JSON por registro; roda no thread do QueueListener
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        # default=str: um extra não serializável não pode derrubar o log
+        return orjson.dumps(entry, default=str, option=OPTIONS).decode()
+
+class NonBlockingQueueHandler(QueueHandler):
+    # No thread de quem loga fica só o que não pode esperar: a mensagem com
+    # os argumentos (que podem mudar depois), o traceback e o contexto da
+    # requisição (ContextVar não chega ao thread do listener). Com a fila
+    # cheia, o registro é descartado em vez de bloquear o event loop.
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Sem copy.copy: este é o único handler da hierarquia "app", então
+        # o registro pode ser alterado no lugar
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        context = _request_context.get()
+        if context is not None:
+            record.request_id = context["request_id"]
+            # Lido do scope no momento do log: depois do roteamento já é o
+            # template ("/producers/{producer_id}"), nunca o path com ids
+            record.route = route_template(context["scope"])
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class RequestSampler(logging.Filter):
+    # INFO/DEBUG de uma requisição saem inteiros ou não saem (decisão por
+    # requisição, não por linha); WARNING+ e logs fora de requisições
+    # (startup, CLI) sempre saem
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        context = _request_context.get()
+        return context is None or context["sampled"]
+
+def configure_logging() -> QueueListener:
+    global _listener
+    if _listener is not None:
+        return _listener
+    
+    # Thread e processo de quem loga não vão para o JSON
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    handler, _listener = build_queue_logging(sys.stdout, settings.log_format, settings.log_queue_size)
+    root = logging.getLogger(ROOT_LOGGER)
+    root.addHandler(handler)
+    root.setLevel(settings.log_level)
+    root.propagate = False
+    
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
+
+def build_queue_logging(stream, format: str, queue_size: int) -> Tuple[NonBlockingQueueHandler, QueueListener]:
+    # Quem loga só enfileira; o listener (não iniciado) formata e escreve
+    # no stream em um thread próprio
+    output = logging.StreamHandler(stream)
+    if format == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    handler = NonBlockingQueueHandler(log_queue)
+    handler.addFilter(RequestSampler())
+    return handler, QueueListener(log_queue, output)
+
+def get_logger(name: str) -> logging.Logger:
+    # Só nomeia o logger; o handler e o thread do listener são criados por
+    # configure_logging() no startup da aplicação ou da CLI
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return logging.getLogger(name)
+
+access_logger = logging.getLogger(f"{ROOT_LOGGER}.access")
+
+class RequestLoggingMiddleware:
+    # Middleware ASGI puro: abre o contexto de log da requisição (id vindo
+    # de X-Request-ID ou gerado), devolve o id na resposta e registra uma
+    # linha de acesso com rota, status e duração
+    def __init__(self, app, sample_rate: Optional[float] = None):
+        self.app = app
+        self._sample_rate = settings.log_sample_rate if sample_rate is None else sample_rate
     
-    return logger
\ No newline at end of file
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = dict(scope["headers"]).get(REQUEST_ID_HEADER, b"").decode("latin-1") or uuid.uuid4().hex
+        context = {
+            "request_id": request_id,
+            "scope": scope,
+            "sampled": self._sample_rate >= 1 or random.random() < self._sample_rate,
+        }
+        token = _request_context.set(context)
+        start = time.perf_counter()
+        status = 500
+        
+        async def send_with_request_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (REQUEST_ID_HEADER, request_id.encode("latin-1"))
+                ]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            access_logger.log(
+                logging.WARNING if status >= 500 else logging.INFO,
+                "%s %s %s",
+                scope["method"], route_template(scope), status,
+                extra={"status": status, "duration_ms": round((time.perf_counter() - start) * 1000, 3)}
+            )
+            _request_context.reset(token)
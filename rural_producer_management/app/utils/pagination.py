@@ -0,0 +1,38 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+# Cursor opaco para paginação por (created_at, id)
+
+class InvalidCursorError(ValueError):
+    pass
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Cursor inválido") from exc
+
+async def paginate(
+    repository,
+    limit: int,
+    cursor: Optional[str] = None,
+    *criteria,
+    columns: Optional[List[str]] = None
+) -> Tuple[List, Optional[str]]:
+    # Busca limit + 1 linhas para saber se existe próxima página; as linhas
+    # precisam expor created_at e id (objetos do ORM ou Row)
+    after = decode_cursor(cursor) if cursor else None
+    rows = await repository.get_page(limit + 1, after, *criteria, columns=columns)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
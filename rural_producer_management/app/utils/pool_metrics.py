@@ -0,0 +1,62 @@
+import time
+from typing import Any, Dict
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+class PoolWaitStats:
+    __slots__ = ("acquired", "timeouts", "total_wait", "max_wait")
+    
+    def __init__(self):
+        self.acquired = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def observe(self, seconds: float) -> None:
+        self.acquired += 1
+        self.total_wait += seconds
+        if seconds > self.max_wait:
+            self.max_wait = seconds
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "avg_ms": round(self.total_wait / self.acquired * 1000, 3) if self.acquired else 0.0,
+            "max_ms": round(self.max_wait * 1000, 3),
+        }
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    # Mede o tempo de checkout de cada conexão: espera na fila quando o pool
+    # está esgotado, abertura de conexão nova e o pre-ping. Timeouts são os
+    # erros "QueuePool limit ... reached" após pool_timeout.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+    
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        self.wait_stats.observe(time.perf_counter() - start)
+        return connection
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            # overflow() começa em -size e sobe a cada conexão aberta
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        status["wait"] = wait_stats.as_dict()
+    return status
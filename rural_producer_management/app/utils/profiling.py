@@ -0,0 +1,139 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.utils.metrics import CONTENT_TYPE, MetricsRegistry
+from app.utils.routes import route_template
+from app.utils.serialization import dumps
+
+METRICS_PATH = "/metrics"
+
+class RequestProfile:
+    __slots__ = ("db_time", "queries", "rows", "serialization_time")
+    
+    def __init__(self):
+        self.db_time = 0.0
+        self.queries = 0
+        self.rows = 0
+        self.serialization_time = 0.0
+
+# Perfil da requisição corrente; None fora do middleware, o que faz os
+# hooks abaixo retornarem logo na primeira linha
+_current: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+class ProfiledJSONResponse(JSONResponse):
+    # Resposta padrão da aplicação: serializa com orjson e mede o tempo de
+    # serialização quando há um perfil ativo; sem ele, custa apenas a
+    # leitura do ContextVar
+    def render(self, content: Any) -> bytes:
+        profile = _current.get()
+        if profile is None:
+            return dumps(content)
+        start = time.perf_counter()
+        body = dumps(content)
+        profile.serialization_time += time.perf_counter() - start
+        return body
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Início guardado no contexto da execução: se o comando falha, não sobra
+    # nada na conexão (que volta ao pool e é reaproveitada)
+    if context is not None and _current.get() is not None:
+        context._profiling_start = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current.get()
+    start = getattr(context, "_profiling_start", None)
+    if profile is not None and start is not None:
+        profile.db_time += time.perf_counter() - start
+        profile.queries += 1
+        profile.rows += _returned_rows(cursor)
+
+def _returned_rows(cursor) -> int:
+    # Linhas devolvidas pelo banco, seja a consulta do ORM ou Core (listagens
+    # por colunas, agregações). Drivers síncronos informam rowcount do
+    # SELECT; os adaptadores async (asyncpg, aiosqlite) deixam -1 e já
+    # trazem o resultado inteiro em _rows. Cursores server-side (exportações
+    # em streaming) não são contados.
+    if cursor.description is None:
+        return 0
+    if cursor.rowcount >= 0:
+        return cursor.rowcount
+    return len(getattr(cursor, "_rows", ()))
+
+def install_sqlalchemy_hooks() -> None:
+    # Escuta a classe Engine (e não uma instância) para cobrir também os
+    # engines criados por testes e scripts
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+class ProfilingMiddleware:
+    # Middleware ASGI puro (sem BaseHTTPMiddleware) para não bufferizar
+    # respostas em streaming nem trocar o contexto da requisição
+    def __init__(self, app, metrics: MetricsRegistry):
+        self.app = app
+        labels = ("method", "route")
+        self._requests = metrics.counter("http_requests_total", "Requisições HTTP.", labels + ("status",))
+        self._latency = metrics.histogram("http_request_duration_seconds", "Tempo total da requisição.", labels)
+        self._db_time = metrics.histogram("http_request_db_seconds", "Tempo gasto em consultas SQL.", labels)
+        self._serialization = metrics.histogram(
+            "http_response_serialization_seconds", "Tempo de serialização JSON da resposta.", labels
+        )
+        self._queries = metrics.counter("db_queries_total", "Consultas SQL executadas.", labels)
+        self._rows = metrics.counter("db_rows_loaded_total", "Linhas retornadas pelo banco.", labels)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+        
+        profile = RequestProfile()
+        token = _current.set(profile)
+        start = time.perf_counter()
+        status = 500
+        
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed = time.perf_counter() - start
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"server-timing", server_timing(profile, elapsed).encode("latin-1"))
+                ]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            labels = (scope["method"], route_template(scope))
+            self._requests.inc(labels + (str(status),))
+            self._latency.observe(labels, time.perf_counter() - start)
+            self._db_time.observe(labels, profile.db_time)
+            self._serialization.observe(labels, profile.serialization_time)
+            self._queries.inc(labels, profile.queries)
+            self._rows.inc(labels, profile.rows)
+
+def server_timing(profile: RequestProfile, elapsed: float) -> str:
+    # Durações em milissegundos, como pede a especificação do Server-Timing
+    return ", ".join([
+        f'db;dur={profile.db_time * 1000:.2f};desc="{profile.queries} queries, {profile.rows} rows"',
+        f"serialize;dur={profile.serialization_time * 1000:.2f}",
+        f"total;dur={elapsed * 1000:.2f}",
+    ])
+
+def enable_profiling(app: FastAPI) -> MetricsRegistry:
+    metrics = MetricsRegistry()
+    app.state.metrics = metrics
+    install_sqlalchemy_hooks()
+    app.add_middleware(ProfilingMiddleware, metrics=metrics)
+    
+    @app.get(METRICS_PATH, include_in_schema=False)
+    async def prometheus_metrics(request: Request):
+        return Response(request.app.state.metrics.render(), media_type=CONTENT_TYPE)
+    
+    return metrics
@@ -0,0 +1,26 @@
+from typing import Callable, Dict
+
+# Sem dependências de FastAPI/SQLAlchemy: usado também por app.utils.logger,
+# que não deve carregar o framework ao ser importado
+
+# Endpoint -> template da rota, resolvido uma vez por endpoint
+_route_templates: Dict[Callable, str] = {}
+
+def route_template(scope) -> str:
+    # Template da rota ("/producers/{producer_id}") e não o path, para
+    # manter a cardinalidade de métricas e logs limitada. Só vale depois do
+    # roteamento, que grava a rota (FastAPI) e o endpoint no scope.
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    if endpoint not in _route_templates:
+        for route in scope["app"].routes:
+            if getattr(route, "endpoint", None) is endpoint:
+                _route_templates[endpoint] = route.path
+                break
+        else:
+            _route_templates[endpoint] = "unmatched"
+    return _route_templates[endpoint]
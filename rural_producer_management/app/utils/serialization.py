@@ -0,0 +1,24 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Sequence
+import orjson
+
+# Mesma saída da serialização JSON do pydantic/FastAPI: UUID e datetime em
+# ISO 8601 (UTC como "Z"), Decimal como texto
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Tipo não serializável em JSON: {type(value).__name__}")
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=OPTIONS)
+
+def rows_to_dicts(rows: Sequence) -> List[Dict[str, Any]]:
+    # Linhas do Core (Row) direto para dicts, sem instanciar schemas; a
+    # equivalência com o response_model é garantida pelos testes. As chaves
+    # são lidas uma vez (Row._asdict() por linha é ~4x mais lento).
+    if not rows:
+        return []
+    keys = rows[0]._fields
+    return [dict(zip(keys, row)) for row in rows]
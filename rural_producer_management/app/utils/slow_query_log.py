@@ -0,0 +1,171 @@
+import os
+import re
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from greenlet import getcurrent
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPOSITORIES_DIR = os.path.join(APP_DIR, "repositories") + os.sep
+
+WHITESPACE = re.compile(r"\s+")
+# Listas IN (...) expandidas têm um placeholder por item; colapsá-las faz
+# "IN (?, ?)" e "IN (?, ?, ?)" contarem como a mesma consulta
+PLACEHOLDER = r"(?:\?|\$\d+|%\(\w+\)s|%s|:\w+)"
+EXPANDED_LIST = re.compile(rf"\(\s*{PLACEHOLDER}(?:\s*,\s*{PLACEHOLDER})+\s*\)")
+
+EXPLAIN_PREFIX = {
+    "postgresql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+def normalize_statement(statement: str) -> str:
+    return EXPANDED_LIST.sub("(...)", WHITESPACE.sub(" ", statement).strip())
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    # Só os tipos, nunca os valores (CPF/CNPJ, nomes etc.)
+    if executemany:
+        return f"{len(parameters)} x {parameter_shape(parameters[0]) if parameters else None}"
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+def _frames():
+    # No engine assíncrono o SQL roda em um greenlet separado; a pilha do
+    # repositório que fez a chamada continua no greenlet pai
+    frame = sys._getframe(2)
+    current = getcurrent()
+    while True:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        current = current.parent
+        if current is None:
+            return
+        frame = current.gr_frame
+
+def call_site() -> str:
+    fallback = None
+    for frame in _frames():
+        filename = frame.f_code.co_filename
+        if not filename.startswith(APP_DIR) or filename == __file__:
+            continue
+        instance = frame.f_locals.get("self")
+        owner = f"{type(instance).__name__}." if instance is not None else ""
+        site = f"{owner}{frame.f_code.co_name}:{frame.f_lineno}"
+        if filename.startswith(REPOSITORIES_DIR):
+            return site
+        fallback = fallback or site
+    return fallback or "unknown"
+
+class SlowQueryLog:
+    # Loga consultas acima do limite e, opcionalmente, guarda o plano de
+    # execução da primeira ocorrência de cada consulta normalizada em um
+    # buffer circular lido pelo endpoint de administração
+    def __init__(self, threshold_ms: float, explain: bool = False, buffer_size: int = 100):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self._entries: deque = deque(maxlen=buffer_size)
+        self._explained = set()
+    
+    def install(self, sync_engine: Engine) -> None:
+        if not event.contains(sync_engine, "after_cursor_execute", self._after_cursor_execute):
+            event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+    
+    def entries(self) -> List[Dict]:
+        return list(reversed(self._entries))
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self._explained.clear()
+    
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # No contexto da execução, e não em conn.info: se o comando falha,
+        # after_cursor_execute não roda e o início vai embora com o contexto
+        if context is not None:
+            context._slow_query_start = time.perf_counter()
+    
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_slow_query_start", None)
+        if start is None:
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+        
+        site = call_site()
+        shape = parameter_shape(parameters, executemany)
+        normalized = normalize_statement(statement)
+        logger.warning(
+            "Slow query (%.1f ms) at %s: %s params=%s", duration_ms, site, normalized, shape,
+            extra={"duration_ms": round(duration_ms, 3)}
+        )
+        
+        if not self.explain or normalized in self._explained or not self._explainable(conn, normalized, context, executemany):
+            return
+        self._explained.add(normalized)
+        self._entries.append({
+            "statement": normalized,
+            "parameters": shape,
+            "duration_ms": round(duration_ms, 3),
+            "call_site": site,
+            "plan": self._explain(conn, statement, parameters),
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+        })
+    
+    def _explainable(self, conn, statement: str, context, executemany) -> bool:
+        # Só SELECTs: cursores do servidor (streaming) ainda estão abertos
+        # nesta conexão e ficam de fora
+        return (
+            not executemany
+            and conn.dialect.name in EXPLAIN_PREFIX
+            and statement.upper().startswith(("SELECT", "WITH"))
+            and not (context is not None and context.execution_options.get("stream_results", False))
+        )
+    
+    def _explain(self, conn, statement: str, parameters) -> Optional[str]:
+        # Cursor DBAPI direto: não dispara os eventos do engine de novo.
+        # No PostgreSQL, um SAVEPOINT impede que uma falha no EXPLAIN
+        # aborte a transação da requisição.
+        postgresql = conn.dialect.name == "postgresql"
+        cursor = conn.connection.cursor()
+        try:
+            if postgresql:
+                cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(EXPLAIN_PREFIX[conn.dialect.name] + statement, parameters)
+                plan = "\n".join(str(row[-1]) for row in cursor.fetchall())
+            except Exception as exc:
+                if postgresql:
+                    cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                logger.warning("EXPLAIN failed for slow query: %s", exc)
+                return None
+            if postgresql:
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        finally:
+            cursor.close()
+
+@lru_cache(maxsize=None)
+def shared_slow_query_log() -> Optional[SlowQueryLog]:
+    # Uma instância por processo, criada com o primeiro engine (no startup),
+    # não ao importar o módulo
+    if settings.slow_query_threshold_ms is None:
+        return None
+    return SlowQueryLog(
+        settings.slow_query_threshold_ms,
+        explain=settings.slow_query_explain,
+        buffer_size=settings.slow_query_buffer_size
+    )
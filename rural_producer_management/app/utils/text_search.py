@@ -0,0 +1,68 @@
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+NON_WORD = re.compile(r"[^0-9a-z]+")
+
+# Mesmo padrão de pg_trgm.word_similarity_threshold (operador <%)
+SIMILARITY_THRESHOLD = 0.6
+
+def normalize_name(text: str) -> str:
+    # Equivalente em Python de f_unaccent(lower(name)): "João  SILVA" -> "joao silva"
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return NON_WORD.sub(" ", stripped).strip()
+
+def trigrams(normalized: str) -> Set[str]:
+    # Trigramas no formato do pg_trgm: cada palavra com dois espaços antes
+    # e um depois ("  jo", " joa", ..., "ao ")
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class TrigramIndex:
+    # Índice invertido trigrama -> chaves, usado quando o banco não tem
+    # pg_trgm (SQLite). A pontuação é a fração dos trigramas da busca
+    # presentes no nome, que aproxima o word_similarity do PostgreSQL;
+    # empates são desfeitos pela similaridade do nome inteiro (similarity).
+    def __init__(self):
+        self._postings: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._names: Dict[Hashable, Tuple[str, int]] = {}
+        self.signature: Optional[Tuple] = None
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def rebuild(self, entries: Iterable[Tuple[Hashable, str]], signature: Tuple) -> None:
+        self._postings.clear()
+        self._names.clear()
+        for key, text in entries:
+            normalized = normalize_name(text)
+            grams = trigrams(normalized)
+            self._names[key] = (normalized, len(grams))
+            for gram in grams:
+                self._postings[gram].add(key)
+        self.signature = signature
+    
+    def invalidate(self) -> None:
+        self.signature = None
+    
+    def search(self, query: str, limit: int, threshold: float = SIMILARITY_THRESHOLD) -> List[Tuple[Hashable, float]]:
+        grams = trigrams(normalize_name(query))
+        if not grams:
+            return []
+        hits = Counter()
+        for gram in grams:
+            hits.update(self._postings.get(gram, ()))
+        minimum = threshold * len(grams)
+        ranked = []
+        for key, count in hits.items():
+            if count >= minimum:
+                name, size = self._names[key]
+                similarity = count / (len(grams) + size - count)
+                ranked.append((-count / len(grams), -similarity, name, key))
+        ranked.sort(key=lambda hit: hit[:3])
+        return [(key, -score) for score, _, _, key in ranked[:limit]]
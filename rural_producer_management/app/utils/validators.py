@@ -1,45 +1,112 @@
 import re
+from functools import lru_cache
+from operator import mul
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
-def validate_cpf(cpf: str) -> bool:
-    cpf = re.sub(r'[^0-9]', '', cpf)
-    
+if TYPE_CHECKING:
+    import numpy as np
+
+NON_DIGITS = re.compile(r'[^0-9]')
+
+CPF = "CPF"
+CNPJ = "CNPJ"
+
+# Pesos dos dígitos verificadores, pré-calculados uma única vez e usados
+# tanto na validação escalar quanto na vetorizada
+CPF_WEIGHTS = (tuple(range(10, 1, -1)), tuple(range(11, 1, -1)))
+CNPJ_WEIGHTS = ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+
+# numpy (~90 ms de import) só é carregado pela validação em lote; o boot da
+# API e a validação escalar não dependem dele
+@lru_cache(maxsize=None)
+def _weight_vectors(weights: Tuple[Tuple[int, ...], ...]) -> Tuple["np.ndarray", ...]:
+    import numpy as np
+    return tuple(np.array(vector, dtype=np.int64) for vector in weights)
+
+def normalize_document(document: str) -> str:
+    if document.isascii() and document.isdigit():
+        return document
+    return NON_DIGITS.sub('', document)
+
+def document_key(document: str) -> Optional[Tuple[int, str]]:
+    # Chave canônica (número, tipo): "111.444.777-35" e "11144477735" são o
+    # mesmo documento. O tipo desambigua CPF e CNPJ com o mesmo valor numérico.
+    digits = normalize_document(document)
+    if len(digits) == 11:
+        return int(digits), CPF
+    if len(digits) == 14:
+        return int(digits), CNPJ
+    return None
+
+def _cpf_digits_valid(cpf: str) -> bool:
     if len(cpf) != 11 or cpf == cpf[0] * 11:
         return False
-    
-    # Validação dígitos verificadores
-    for i in range(9, 11):
-        value = sum((int(cpf[num]) * ((i + 1) - num) for num in range(0, i)))
-        digit = ((value * 10) % 11) % 10
-        if digit != int(cpf[i]):
+    digits = [ord(c) - 48 for c in cpf]
+    for i, weights in enumerate(CPF_WEIGHTS):
+        value = sum(map(mul, digits, weights))
+        if (value * 10) % 11 % 10 != digits[9 + i]:
             return False
     return True
 
-def validate_cnpj(cnpj: str) -> bool:
-    cnpj = re.sub(r'[^0-9]', '', cnpj)
-    
+def _cnpj_digits_valid(cnpj: str) -> bool:
     if len(cnpj) != 14:
         return False
-    
-    # CNPJ validation logic
-    weights = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    
-    for i in range(2):
-        sum_digits = sum(int(cnpj[j]) * weights[j] for j in range(len(weights)))
-        digit = 11 - (sum_digits % 11)
-        if digit > 9:
-            digit = 0
-        if digit != int(cnpj[12 + i]):
+    digits = [ord(c) - 48 for c in cnpj]
+    for i, weights in enumerate(CNPJ_WEIGHTS):
+        remainder = sum(map(mul, digits, weights)) % 11
+        if (0 if remainder < 2 else 11 - remainder) != digits[12 + i]:
             return False
-        weights.insert(0, 6)
-    
     return True
 
+def validate_cpf(cpf: str) -> bool:
+    return _cpf_digits_valid(normalize_document(cpf))
+
+def validate_cnpj(cnpj: str) -> bool:
+    return _cnpj_digits_valid(normalize_document(cnpj))
+
 def validate_cpf_cnpj(document: str) -> bool:
-    document = re.sub(r'[^0-9]', '', document)
+    document = normalize_document(document)
     
     if len(document) == 11:
-        return validate_cpf(document)
+        return _cpf_digits_valid(document)
     elif len(document) == 14:
-        return validate_cnpj(document)
+        return _cnpj_digits_valid(document)
+    
+    return False
+
+def _digit_matrix(documents, length: int) -> "np.ndarray":
+    import numpy as np
+    # Documentos de mesmo tamanho viram uma matriz (n, length) de dígitos
+    buffer = "".join(documents).encode("ascii")
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(-1, length).astype(np.int64) - 48
+
+def _cpf_mask(digits: "np.ndarray") -> "np.ndarray":
+    first, second = _weight_vectors(CPF_WEIGHTS)
+    valid = (digits[:, :9] @ first) * 10 % 11 % 10 == digits[:, 9]
+    valid &= (digits[:, :10] @ second) * 10 % 11 % 10 == digits[:, 10]
+    # Sequências repetidas (000.000.000-00) têm dígitos "válidos"
+    valid &= ~(digits == digits[:, :1]).all(axis=1)
+    return valid
+
+def _cnpj_mask(digits: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+    valid = np.ones(len(digits), dtype=bool)
+    for i, weights in enumerate(_weight_vectors(CNPJ_WEIGHTS)):
+        remainder = (digits[:, :12 + i] @ weights) % 11
+        valid &= np.where(remainder < 2, 0, 11 - remainder) == digits[:, 12 + i]
+    return valid
+
+def validate_many(documents: Iterable[str]) -> "np.ndarray":
+    import numpy as np
+    # Equivalente a [validate_cpf_cnpj(d) for d in documents], com uma única
+    # normalização por documento e o cálculo dos dígitos feito por matriz
+    normalized = [normalize_document(document) for document in documents]
+    mask = np.zeros(len(normalized), dtype=bool)
+    lengths = np.fromiter((len(document) for document in normalized), dtype=np.int64, count=len(normalized))
     
-    return False
\ No newline at end of file
+    for length, validate in ((11, _cpf_mask), (14, _cnpj_mask)):
+        positions = np.flatnonzero(lengths == length)
+        if len(positions):
+            digits = _digit_matrix([normalized[i] for i in positions], length)
+            mask[positions] = validate(digits)
+    return mask
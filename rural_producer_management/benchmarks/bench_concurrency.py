@@ -0,0 +1,101 @@
+"""Teste de carga: throughput de um único worker sob requisições concorrentes.
+
+Com a camada de dados assíncrona, requisições concorrentes se sobrepõem
+enquanto aguardam o banco em vez de serializarem no event loop. Depois de
+cada nível é exibido o estado do pool (GET /health/pool): conexões em uso,
+overflow, tempo médio/máximo de checkout e timeouts.
+
+Uso:
+    # Contra um worker rodando (uvicorn app.main:app --workers 1)
+    python -m benchmarks.bench_concurrency --url http://localhost:8000
+
+    # Em processo, com SQLite/aiosqlite; o pool segue DB_POOL_SIZE,
+    # DB_MAX_OVERFLOW, DB_POOL_TIMEOUT etc.
+    python -m benchmarks.bench_concurrency --requests 5000 --concurrency 1 50 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+from sqlalchemy import exc
+
+PRODUCERS = [
+    ("111.444.777-35", "João Silva"),
+    ("11.222.333/0001-81", "Empresa Rural Ltda"),
+    ("529.982.247-25", "Maria Santos"),
+]
+
+async def run_level(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> None:
+    latencies = []
+    errors = 0
+    queue = iter(range(total))
+    
+    async def worker():
+        nonlocal errors
+        for _ in queue:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                response.raise_for_status()
+            except (httpx.HTTPError, exc.TimeoutError):
+                # Em processo, o timeout do pool chega aqui sem virar 500
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    pool = (await client.get("/health/pool")).json()["database_pool"]
+    wait = pool.get("wait", {})
+    print(
+        f"concurrency {concurrency:>4} | {total / elapsed:8.1f} req/s"
+        f" | p50 {statistics.median(latencies) * 1000:7.2f} ms | p99 {p99 * 1000:7.2f} ms"
+        f" | errors {errors} | pool {pool.get('size')}+{pool.get('max_overflow')}"
+        f" checkout avg {wait.get('avg_ms')} ms max {wait.get('max_ms')} ms timeouts {wait.get('timeouts')}"
+    )
+
+async def in_process_client() -> httpx.AsyncClient:
+    os.environ.setdefault(
+        "DATABASE_URL",
+        f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_concurrency.db')}"
+    )
+    from app.main import app
+    from app.database import Base, init_engine
+    
+    # Sem lifespan no transporte ASGI do httpx: o engine é criado aqui
+    async with init_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    client = httpx.AsyncClient(app=app, base_url="http://bench")
+    for cpf_cnpj, name in PRODUCERS:
+        await client.post("/producers/", json={"cpf_cnpj": cpf_cnpj, "name": name})
+    return client
+
+async def main(args: argparse.Namespace) -> None:
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=30)
+    else:
+        client = await in_process_client()
+    
+    try:
+        for concurrency in args.concurrency:
+            await run_level(client, args.path, args.requests, concurrency)
+    finally:
+        await client.aclose()
+        if not args.url:
+            from app.database import dispose_engine
+            await dispose_engine()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", help="URL base de um worker em execução; omitido = em processo")
+    parser.add_argument("--path", default="/producers/")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 100, 500])
+    asyncio.run(main(parser.parse_args()))
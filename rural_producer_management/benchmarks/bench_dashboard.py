@@ -0,0 +1,144 @@
+"""Benchmark do dashboard: agregação em Python vs. agregação no banco vs. read model.
+
+Uso:
+    python -m benchmarks.bench_dashboard [10000 100000 1000000]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.producer import Producer
+from app.models.farm import Farm
+from app.models.culture import Culture
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.culture_repository import CultureRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository
+from app.services.dashboard_service import DashboardService
+
+STATES = ["SP", "MG", "GO", "MT", "MS", "PR", "RS", "BA", "TO", "SC"]
+CULTURES = ["SOJA", "MILHO", "ALGODAO", "CAFE", "CANA"]
+BATCH_SIZE = 50_000
+
+async def seed(session, n_farms: int) -> None:
+    producer_ids = [str(uuid.uuid4()) for _ in range(max(1, n_farms // 10))]
+    await session.execute(insert(Producer), [
+        {"id": pid, "cpf_cnpj": str(i).zfill(11), "document_number": i, "document_type": "CPF", "name": f"Produtor {i}"}
+        for i, pid in enumerate(producer_ids)
+    ])
+    
+    for start in range(0, n_farms, BATCH_SIZE):
+        farms, cultures = [], []
+        for _ in range(start, min(start + BATCH_SIZE, n_farms)):
+            farm_id = str(uuid.uuid4())
+            total = random.randint(100, 5000)
+            arable = random.randint(0, total // 2)
+            farms.append({
+                "id": farm_id,
+                "producer_id": random.choice(producer_ids),
+                "name": "Fazenda",
+                "city": "Cidade",
+                "state": random.choice(STATES),
+                "total_area": total,
+                "arable_area": arable,
+                "vegetation_area": random.randint(0, total - arable),
+            })
+            cultures.append({
+                "id": str(uuid.uuid4()),
+                "farm_id": farm_id,
+                "name": random.choice(CULTURES),
+                "harvest_year": "Safra 2024",
+            })
+        await session.execute(insert(Farm), farms)
+        await session.execute(insert(Culture), cultures)
+    await session.commit()
+
+async def legacy_dashboard(session) -> dict:
+    # Implementação anterior: carrega todas as linhas e soma em Python
+    farms = (await session.execute(select(Farm))).scalars().all()
+    cultures = (await session.execute(select(Culture))).scalars().all()
+    
+    state_distribution = {}
+    for farm in farms:
+        state_distribution[farm.state] = state_distribution.get(farm.state, 0) + 1
+    
+    culture_distribution = {}
+    for culture in cultures:
+        culture_distribution[culture.name] = culture_distribution.get(culture.name, 0) + 1
+    
+    return {
+        "total_farms": len(farms),
+        "total_hectares": sum(float(farm.total_area) for farm in farms),
+        "state_distribution": state_distribution,
+        "culture_distribution": culture_distribution,
+        "land_use": {
+            "arable": sum(float(farm.arable_area) for farm in farms),
+            "vegetation": sum(float(farm.vegetation_area) for farm in farms),
+        },
+    }
+
+async def aggregate_dashboard(farm_repo: FarmRepository, culture_repo: CultureRepository) -> dict:
+    # Agregação SUM/COUNT ... GROUP BY a cada requisição
+    totals = await farm_repo.get_area_totals()
+    return {
+        "total_farms": totals["total_farms"],
+        "total_hectares": totals["total_area"],
+        "state_distribution": await farm_repo.count_by_state(),
+        "culture_distribution": await culture_repo.count_by_name(),
+        "land_use": {"arable": totals["arable_area"], "vegetation": totals["vegetation_area"]},
+    }
+
+async def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+async def run(n_farms: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench_dashboard.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(bind=engine, expire_on_commit=False)()
+    await seed(session, n_farms)
+    
+    farm_repo, culture_repo = FarmRepository(session), CultureRepository(session)
+    service = DashboardService(farm_repo, culture_repo, DashboardStatsRepository(session))
+    await service.rebuild_stats()
+    
+    session.expunge_all()
+    legacy, legacy_time, legacy_mem = await measure(lambda: legacy_dashboard(session))
+    session.expunge_all()
+    aggregate, sql_time, sql_mem = await measure(lambda: aggregate_dashboard(farm_repo, culture_repo))
+    session.expunge_all()
+    current, stats_time, stats_mem = await measure(service.get_dashboard_data)
+    
+    for result in (aggregate, current):
+        assert legacy["total_farms"] == result["total_farms"]
+        assert legacy["state_distribution"] == result["state_distribution"]
+        assert legacy["culture_distribution"] == result["culture_distribution"]
+    
+    print(
+        f"{n_farms:>9} farms | python: {legacy_time:8.3f}s {legacy_mem:8.1f} MB"
+        f" | sql: {sql_time:8.3f}s {sql_mem:6.1f} MB"
+        f" | dashboard_stats: {stats_time:8.4f}s {stats_mem:6.1f} MB"
+    )
+    await session.close()
+    await engine.dispose()
+    os.remove(path)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    for size in sizes:
+        asyncio.run(run(size))
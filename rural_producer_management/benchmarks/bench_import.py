@@ -0,0 +1,93 @@
+"""Benchmark da importação: POST /producers/ linha a linha vs. importação em lote.
+
+Uso:
+    python -m benchmarks.bench_import [N_LINHAS_LOTE] [N_LINHAS_API]
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base, get_db
+from app.main import app
+from app.repositories.producer_repository import ProducerRepository
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.culture_repository import CultureRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository
+from app.services.import_service import ImportService
+
+STATES = ["SP", "MG", "GO", "MT", "PR"]
+
+def make_cpf(seed: int) -> str:
+    digits = [int(d) for d in str(100000000 + seed)[-9:]]
+    for length in (9, 10):
+        value = sum(d * (length + 1 - i) for i, d in enumerate(digits[:length]))
+        digits.append((value * 10) % 11 % 10)
+    return "".join(map(str, digits))
+
+def producer_rows(start: int, n: int):
+    for i in range(start, start + n):
+        yield {"cpf_cnpj": make_cpf(i), "name": f"Produtor {i}"}
+
+async def setup(path: str):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+async def per_row_api(sessionmaker, n: int) -> float:
+    async def override_get_db():
+        async with sessionmaker() as session:
+            yield session
+    app.dependency_overrides[get_db] = override_get_db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for row in producer_rows(0, n):
+            response = await client.post("/producers/", json=row)
+            assert response.status_code == 201, response.text
+        elapsed = time.perf_counter() - start
+    app.dependency_overrides.clear()
+    return elapsed
+
+async def bulk(sessionmaker, n: int) -> float:
+    # O arquivo é gerado antes da medição
+    payload = [json.dumps(row) for row in producer_rows(1_000_000, n)]
+    
+    async def lines():
+        for number, line in enumerate(payload, start=1):
+            yield number, line
+    async with sessionmaker() as session:
+        service = ImportService(
+            ProducerRepository(session),
+            FarmRepository(session),
+            CultureRepository(session),
+            DashboardStatsRepository(session)
+        )
+        start = time.perf_counter()
+        report = await service.import_lines("producers", lines())
+        elapsed = time.perf_counter() - start
+    assert report.inserted["producers"] == n and not report.errors
+    return elapsed
+
+async def run(n_bulk: int, n_api: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench_import.db")
+    engine, sessionmaker = await setup(path)
+    
+    api_time = await per_row_api(sessionmaker, n_api)
+    bulk_time = await bulk(sessionmaker, n_bulk)
+    print(f"API linha a linha: {n_api:>8} linhas em {api_time:8.2f}s = {n_api / api_time:10.0f} linhas/s")
+    print(f"Importação em lote: {n_bulk:>7} linhas em {bulk_time:8.2f}s = {n_bulk / bulk_time:10.0f} linhas/s")
+    
+    await engine.dispose()
+    os.remove(path)
+
+if __name__ == "__main__":
+    n_bulk = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_api = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    asyncio.run(run(n_bulk, n_api))
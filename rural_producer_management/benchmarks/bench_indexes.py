@@ -0,0 +1,134 @@
+"""Benchmark dos índices de FK e de filtro/agrupamento (migração 0004).
+
+Gera N fazendas sintéticas (1 cultura por fazenda, produtores com 10 fazendas
+em média) e mede cada consulta sem os índices novos e depois de criá-los,
+com o plano do SQLite (EXPLAIN QUERY PLAN) de cada caso.
+
+Uso:
+    python -m benchmarks.bench_indexes [100000 1000000]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from sqlalchemy import Index, create_engine, func, insert, select, text
+
+from app.database import Base
+from app.models.producer import Producer
+from app.models.farm import Farm
+from app.models.culture import Culture
+from app.utils.ids import uuid7
+
+STATES = ["SP", "MG", "GO", "MT", "MS", "PR", "RS", "BA", "TO", "SC"]
+CULTURES = ["SOJA", "MILHO", "ALGODAO", "CAFE", "CANA"]
+HARVESTS = [f"Safra {year}" for year in range(2015, 2025)]
+NEW_INDEXES = [
+    "ix_farms_producer_id_state",
+    "ix_farms_state_created_at_id",
+    "ix_cultures_name_harvest_year",
+    "ix_cultures_harvest_farm_id",
+]
+BATCH_SIZE = 50_000
+RUNS = 5
+
+def seed(conn, n_farms: int):
+    producer_ids = [uuid7() for _ in range(max(1, n_farms // 10))]
+    for start in range(0, len(producer_ids), BATCH_SIZE):
+        conn.execute(insert(Producer), [
+            {"id": pid, "cpf_cnpj": str(i).zfill(11), "document_number": i, "document_type": "CPF", "name": "Produtor"}
+            for i, pid in enumerate(producer_ids[start:start + BATCH_SIZE], start)
+        ])
+    farm_ids = []
+    for start in range(0, n_farms, BATCH_SIZE):
+        farms, cultures = [], []
+        for _ in range(start, min(start + BATCH_SIZE, n_farms)):
+            farm_id = uuid7()
+            farm_ids.append(farm_id)
+            farms.append({
+                "id": farm_id,
+                "producer_id": random.choice(producer_ids),
+                "name": "Fazenda",
+                "city": "Cidade",
+                "state": random.choice(STATES),
+                "total_area": 1000,
+                "arable_area": 500,
+                "vegetation_area": 300,
+            })
+            cultures.append({
+                "id": uuid7(),
+                "farm_id": farm_id,
+                "name": random.choice(CULTURES),
+                "harvest_year": random.choice(HARVESTS),
+            })
+        conn.execute(insert(Farm), farms)
+        conn.execute(insert(Culture), cultures)
+    return producer_ids, farm_ids
+
+def queries(producer_id, farm_id):
+    # Caminhos de consulta dos repositórios (e do cascade delete do ORM)
+    return {
+        "fazendas do produtor": select(Farm).where(Farm.producer_id == producer_id),
+        "estados do produtor": select(Farm.state, func.count(Farm.id))
+            .where(Farm.producer_id == producer_id).group_by(Farm.state),
+        "culturas da fazenda": select(Culture).where(Culture.farm_id == farm_id),
+        "fazendas por estado": select(Farm).where(Farm.state == "TO")
+            .order_by(Farm.created_at, Farm.id).limit(50),
+        "contagem por estado": select(Farm.state, func.count(Farm.id)).group_by(Farm.state),
+        "contagem por cultura": select(Culture.name, func.count()).group_by(Culture.name),
+        "cultura + safra": select(func.count(Culture.id))
+            .where(Culture.name == "CAFE", Culture.harvest_year == "Safra 2020"),
+        "fazendas da safra": select(Farm.id).where(Farm.cultures.any(Culture.harvest_year == "Safra 2020"))
+            .order_by(Farm.created_at, Farm.id).limit(50),
+    }
+
+def measure(conn, statements):
+    results = {}
+    for label, statement in statements.items():
+        # O plano do SQLite não depende dos valores, só dos placeholders
+        compiled = statement.compile(conn)
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", (None,) * len(compiled.positiontup)).all()
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            conn.execute(statement).all()
+            timings.append(time.perf_counter() - start)
+        results[label] = (statistics.median(timings), "; ".join(row[-1] for row in plan))
+    return results
+
+def run(n_farms: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench_indexes.db")
+    engine = create_engine(f"sqlite:///{path}")
+    indexes = {index.name: index for table in Base.metadata.sorted_tables for index in table.indexes}
+    Base.metadata.create_all(engine)
+    
+    with engine.begin() as conn:
+        for name in NEW_INDEXES:
+            indexes[name].drop(conn)
+        producer_ids, farm_ids = seed(conn, n_farms)
+        conn.execute(text("ANALYZE"))
+    
+    statements = queries(random.choice(producer_ids), random.choice(farm_ids))
+    with engine.connect() as conn:
+        before = measure(conn, statements)
+    with engine.begin() as conn:
+        for name in NEW_INDEXES:
+            indexes[name].create(conn)
+        conn.execute(text("ANALYZE"))
+    with engine.connect() as conn:
+        after = measure(conn, statements)
+    
+    print(f"\n{n_farms} fazendas")
+    for label in statements:
+        (old, old_plan), (new, new_plan) = before[label], after[label]
+        print(f"  {label:<22} sem: {old * 1000:9.2f} ms | com: {new * 1000:9.2f} ms | {old / new:7.1f}x")
+        print(f"    antes:  {old_plan}\n    depois: {new_plan}")
+    engine.dispose()
+    os.remove(path)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000]
+    for size in sizes:
+        run(size)
@@ -0,0 +1,74 @@
+"""Benchmark das chaves: texto uuid4 (String) vs. UUIDv7 em 16 bytes (UUIDType).
+
+Insere produtores e fazendas (FK indexada) em lotes e mede a taxa de inserção
+e o tamanho de tabelas e índices no SQLite (tabela virtual dbstat).
+
+Uso:
+    python -m benchmarks.bench_keys [200000 1000000]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import Column, ForeignKey, Index, MetaData, String, Table, create_engine, insert
+
+from app.database import UUIDType
+from app.utils.ids import uuid7
+
+BATCH_SIZE = 10_000
+
+def build_tables(metadata: MetaData, id_type):
+    producers = Table(
+        "producers", metadata,
+        Column("id", id_type, primary_key=True),
+        Column("name", String(255), nullable=False),
+    )
+    farms = Table(
+        "farms", metadata,
+        Column("id", id_type, primary_key=True),
+        Column("producer_id", id_type, ForeignKey("producers.id"), nullable=False),
+        Column("name", String(255), nullable=False),
+        Index("ix_farms_producer_id", "producer_id"),
+    )
+    return producers, farms
+
+def run(label: str, id_type, new_id, n: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench_keys.db")
+    engine = create_engine(f"sqlite:///{path}")
+    metadata = MetaData()
+    producers, farms = build_tables(metadata, id_type)
+    metadata.create_all(engine)
+    
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, n, BATCH_SIZE):
+            size = min(BATCH_SIZE, n - offset)
+            producer_ids = [new_id() for _ in range(size)]
+            conn.execute(insert(producers), [{"id": pid, "name": "Produtor"} for pid in producer_ids])
+            conn.execute(insert(farms), [
+                {"id": new_id(), "producer_id": pid, "name": "Fazenda"} for pid in producer_ids
+            ])
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    
+    sizes = dict(sqlite3.connect(path).execute(
+        "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"
+    ).fetchall())
+    mb = lambda name: sizes.get(name, 0) / (1024 * 1024)
+    print(
+        f"{label:<14} {n:>9} linhas | {2 * n / elapsed:10.0f} linhas/s"
+        f" | producers {mb('producers'):7.1f} MB"
+        f" | pk farms {mb('sqlite_autoindex_farms_1'):7.1f} MB"
+        f" | ix_farms_producer_id {mb('ix_farms_producer_id'):7.1f} MB"
+        f" | arquivo {os.path.getsize(path) / (1024 * 1024):7.1f} MB"
+    )
+    os.remove(path)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [200_000, 1_000_000]
+    for size in sizes:
+        run("texto uuid4", String, lambda: str(uuid.uuid4()), size)
+        run("16 bytes v7", UUIDType, uuid7, size)
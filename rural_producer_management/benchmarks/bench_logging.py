@@ -0,0 +1,115 @@
+"""Benchmark do custo de log por requisição no thread de quem loga.
+
+Cada "requisição" gera as linhas de um POST /producers/: duas do service e
+a linha de acesso. Compara:
+- o logger anterior: StreamHandler síncrono e mensagens em f-string;
+- o atual: % preguiçoso, NonBlockingQueueHandler e JSON escrito pelo
+  QueueListener em outro thread, com a requisição dentro e fora da amostra.
+
+Os dois escrevem em um arquivo e em um destino lento (0,2 ms por escrita,
+como um pipe de stdout com o coletor de logs atrasado). Também mede o custo
+de uma chamada INFO com o nível desligado.
+
+Uso:
+    python -m benchmarks.bench_logging [20000]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import uuid
+from types import SimpleNamespace
+
+from app.utils.logger import _request_context, build_queue_logging, configure_logging
+
+SLOW_WRITE_SECONDS = 0.0002
+
+# Scope ASGI já roteado, como o que o middleware deixa no contexto do log
+SCOPE = {"type": "http", "route": SimpleNamespace(path="/producers/")}
+
+class SlowStream:
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        time.sleep(SLOW_WRITE_SECONDS)
+        return self._stream.write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+def legacy_logger(stream) -> logging.Logger:
+    logger = logging.getLogger(f"bench.legacy.{id(stream)}")
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+def legacy_request(logger: logging.Logger, name: str, producer_id: uuid.UUID) -> None:
+    logger.info(f"Creating producer: {name}")
+    logger.info(f"Producer created: {producer_id}")
+    logger.info(f"POST /producers/ 201 duration={1.234}")
+
+def queued_request(logger: logging.Logger, name: str, producer_id: uuid.UUID) -> None:
+    logger.info("Creating producer: %s", name)
+    logger.info("Producer created: %s", producer_id, extra={"producer_id": producer_id})
+    logger.info("%s %s %s", "POST", "/producers/", 201, extra={"status": 201, "duration_ms": 1.234})
+
+def run(label: str, logger: logging.Logger, request, n: int, drain=None, sampled: bool = True) -> None:
+    token = _request_context.set({"request_id": uuid.uuid4().hex, "scope": SCOPE, "sampled": sampled})
+    producer_id = uuid.uuid4()
+    start = time.perf_counter()
+    for _ in range(n):
+        request(logger, "João Silva", producer_id)
+    caller = time.perf_counter() - start
+    _request_context.reset(token)
+    # Tempo até a última linha chegar ao destino (listener esvaziando a fila)
+    if drain is not None:
+        drain()
+    total = time.perf_counter() - start
+    print(f"{label:<38} | caller {caller / n * 1e6:8.1f} µs/req | written after {total:6.2f}s")
+
+def main(n: int) -> None:
+    directory = tempfile.mkdtemp()
+    # O logger anterior roda antes de configure_logging, que desliga a
+    # busca de thread/processo de quem loga
+    for variant in ("legacy", "queued"):
+        if variant == "queued":
+            configure_logging()
+        for sink_name, wrap, count in (("file", lambda s: s, n), ("slow sink", SlowStream, max(n // 20, 100))):
+            path = os.path.join(directory, f"{variant}-{sink_name}.log")
+            with open(path, "w") as target:
+                stream = wrap(target)
+                if variant == "legacy":
+                    run(f"sync f-string ({sink_name})", legacy_logger(stream), legacy_request, count)
+                    continue
+                handler, listener = build_queue_logging(stream, "json", count * 3 + 1)
+                logger = logging.getLogger(f"bench.queued.{sink_name}")
+                logger.addHandler(handler)
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                # Fora da amostra (LOG_SAMPLE_RATE < 1), o filtro descarta as
+                # linhas INFO antes de montar a mensagem
+                for sampled in (True, False):
+                    listener.start()
+                    label = f"queued json{'' if sampled else ', unsampled'} ({sink_name})"
+                    run(label, logger, queued_request, count, drain=listener.stop, sampled=sampled)
+    
+    # Nível desligado: a f-string é montada mesmo assim; o % nem é formatado
+    logger = legacy_logger(sys.stderr)
+    logger.setLevel(logging.WARNING)
+    producer_id = uuid.uuid4()
+    for label, call in (
+        ("disabled f-string", lambda: logger.info(f"Producer created: {producer_id}")),
+        ("disabled lazy %", lambda: logger.info("Producer created: %s", producer_id)),
+    ):
+        start = time.perf_counter()
+        for _ in range(n):
+            call()
+        print(f"{label:<38} | caller {(time.perf_counter() - start) / n * 1e6:8.2f} µs/call")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
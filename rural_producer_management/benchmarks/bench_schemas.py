@@ -0,0 +1,95 @@
+"""Benchmark da validação de FarmCreate: validators estilo v1 vs. v2 nativos.
+
+Valida N payloads com:
+- o schema anterior (@validator, checagem de áreas via `values`), recriado aqui;
+- o FarmCreate atual (field_validator + model_validator), um model por
+  payload, com FarmCreate(**row) e com FarmCreate.model_validate(row);
+- um TypeAdapter(List[FarmCreate]) validando a lista inteira em uma chamada.
+
+Uso:
+    python -m benchmarks.bench_schemas [100000]
+"""
+import random
+import sys
+import time
+import warnings
+from decimal import Decimal
+from typing import List
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.schemas.farm import FarmCreate
+
+STATES = ["SP", "MG", "GO", "MT", "MS", "PR", "RS", "BA", "TO", "SC"]
+RUNS = 3
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from pydantic import validator
+    
+    class LegacyFarmCreate(BaseModel):
+        name: str
+        city: str
+        state: str
+        total_area: Decimal
+        arable_area: Decimal
+        vegetation_area: Decimal
+        producer_id: str
+        
+        @validator('state')
+        def validate_state(cls, v):
+            if len(v) != 2 or not v.isupper():
+                raise ValueError('Estado deve ter 2 caracteres maiúsculos')
+            return v
+        
+        @validator('vegetation_area')
+        def validate_area_sum(cls, v, values):
+            if 'arable_area' in values and 'total_area' in values:
+                if v + values['arable_area'] > values['total_area']:
+                    raise ValueError('Soma das áreas não pode exceder área total')
+            return v
+
+def payloads(n: int) -> List[dict]:
+    rows = []
+    for i in range(n):
+        total = random.randint(100, 5000)
+        arable = random.randint(0, total // 2)
+        rows.append({
+            "producer_id": "0190a0b4-0000-7000-8000-000000000000",
+            "name": f"Fazenda {i}",
+            "city": "Ribeirão Preto",
+            "state": random.choice(STATES),
+            "total_area": str(total),
+            "arable_area": str(arable),
+            "vegetation_area": str(random.randint(0, total - arable)),
+        })
+    return rows
+
+def best_of(fn) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def run(n: int) -> None:
+    rows = payloads(n)
+    adapter = TypeAdapter(List[FarmCreate])
+    assert [farm.model_dump() for farm in adapter.validate_python(rows)] == [LegacyFarmCreate(**row).model_dump() for row in rows]
+    
+    legacy = best_of(lambda: [LegacyFarmCreate(**row) for row in rows])
+    native = best_of(lambda: [FarmCreate(**row) for row in rows])
+    validated = best_of(lambda: [FarmCreate.model_validate(row) for row in rows])
+    batch = best_of(lambda: adapter.validate_python(rows))
+    print(
+        f"{n:>7} payloads | @validator: {legacy:6.3f}s"
+        f" | field/model_validator: {native:6.3f}s ({legacy / native:4.2f}x)"
+        f" | model_validate: {validated:6.3f}s ({legacy / validated:4.2f}x)"
+        f" | TypeAdapter(List): {batch:6.3f}s ({legacy / batch:4.2f}x)"
+    )
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000]
+    for size in sizes:
+        run(size)
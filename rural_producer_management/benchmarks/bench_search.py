@@ -0,0 +1,120 @@
+"""Benchmark de GET /farms/search: latência p50/p95 por combinação de filtros.
+
+Gera N fazendas sintéticas (cidades, áreas e culturas variadas) em SQLite e
+chama FarmService.search diretamente, com e sem facetas.
+
+Uso:
+    python -m benchmarks.bench_search [100000 1000000]
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from decimal import Decimal
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.producer import Producer
+from app.models.farm import Farm
+from app.models.culture import Culture
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.producer_repository import ProducerRepository
+from app.schemas.farm import FarmSearchFilters
+from app.services.farm_service import FarmService
+from app.utils.ids import uuid7
+
+STATES = ["SP", "MG", "GO", "MT", "MS", "PR", "RS", "BA", "TO", "SC"]
+CITIES = [f"{prefix} {i}" for prefix in ("Rio", "Santa", "São", "Campo", "Porto") for i in range(100)]
+CULTURES = ["SOJA", "MILHO", "ALGODAO", "CAFE", "CANA"]
+HARVESTS = [f"Safra {year}" for year in range(2015, 2025)]
+BATCH_SIZE = 50_000
+RUNS = 50
+# Facetas agregam todas as linhas do filtro: menos repetições
+FACET_RUNS = 5
+PAGE_SIZE = 50
+
+def seed(path: str, n_farms: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    producer_ids = [uuid7() for _ in range(max(1, n_farms // 10))]
+    with engine.begin() as conn:
+        for start in range(0, len(producer_ids), BATCH_SIZE):
+            conn.execute(insert(Producer), [
+                {"id": pid, "cpf_cnpj": str(i).zfill(11), "document_number": i, "document_type": "CPF", "name": "Produtor"}
+                for i, pid in enumerate(producer_ids[start:start + BATCH_SIZE], start)
+            ])
+        for start in range(0, n_farms, BATCH_SIZE):
+            farms, cultures = [], []
+            for _ in range(start, min(start + BATCH_SIZE, n_farms)):
+                farm_id = uuid7()
+                total = random.randint(10, 10_000)
+                farms.append({
+                    "id": farm_id,
+                    "producer_id": random.choice(producer_ids),
+                    "name": "Fazenda",
+                    "city": random.choice(CITIES),
+                    "state": random.choice(STATES),
+                    "total_area": total,
+                    "arable_area": random.randint(0, total),
+                    "vegetation_area": 0,
+                })
+                for name in random.sample(CULTURES, random.randint(1, 2)):
+                    cultures.append({"id": uuid7(), "farm_id": farm_id, "name": name, "harvest_year": random.choice(HARVESTS)})
+            conn.execute(insert(Farm), farms)
+            conn.execute(insert(Culture), cultures)
+        conn.execute(text("ANALYZE"))
+    engine.dispose()
+    return producer_ids
+
+def scenarios(producer_ids):
+    # Cada cenário sorteia novos valores a cada execução
+    return {
+        "sem filtro": lambda: FarmSearchFilters(),
+        "estado": lambda: FarmSearchFilters(state=random.choice(STATES)),
+        "estado + cidade": lambda: FarmSearchFilters(state=random.choice(STATES), city=random.choice(CITIES)),
+        "prefixo de cidade": lambda: FarmSearchFilters(city=random.choice(CITIES)[:6]),
+        "faixa de área": lambda: FarmSearchFilters(min_total_area=Decimal(5000), max_total_area=Decimal(6000)),
+        "cultura + safra": lambda: FarmSearchFilters(culture=random.choice(CULTURES), harvest_year=random.choice(HARVESTS)),
+        "produtor": lambda: FarmSearchFilters(producer_id=random.choice(producer_ids)),
+        "estado + cultura + área": lambda: FarmSearchFilters(
+            state=random.choice(STATES), culture=random.choice(CULTURES), min_arable_area=Decimal(2000)
+        ),
+    }
+
+async def measure(factory, make_filters, facets: bool):
+    timings = []
+    for _ in range(FACET_RUNS if facets else RUNS):
+        async with factory() as session:
+            service = FarmService(FarmRepository(session), ProducerRepository(session))
+            filters = make_filters()
+            start = time.perf_counter()
+            page = await service.search(filters, PAGE_SIZE, facets=facets)
+            if page.next_cursor:
+                await service.search(filters, PAGE_SIZE, page.next_cursor)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[max(0, int(len(timings) * 0.95) - 1)]
+
+async def run(n_farms: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench_search.db")
+    producer_ids = seed(path, n_farms)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    
+    print(f"\n{n_farms} fazendas (página 1 + página 2, {PAGE_SIZE} itens; ms)")
+    for label, make_filters in scenarios(producer_ids).items():
+        p50, p95 = await measure(factory, make_filters, facets=False)
+        f50, f95 = await measure(factory, make_filters, facets=True)
+        print(f"  {label:<24} p50 {p50:8.2f} | p95 {p95:8.2f} | com facetas: p50 {f50:8.2f} | p95 {f95:8.2f}")
+    await engine.dispose()
+    os.remove(path)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000]
+    for size in sizes:
+        asyncio.run(run(size))
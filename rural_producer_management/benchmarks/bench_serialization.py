@@ -0,0 +1,114 @@
+"""Benchmark da listagem: from_orm + response_model + json vs. linhas + orjson.
+
+Compara, para uma página de N fazendas, o caminho anterior (objetos do ORM,
+from_orm por linha, revalidação pelo response_model e json da stdlib) com o
+caminho atual (colunas do FarmResponse como Row, dicts e orjson).
+
+Uso:
+    python -m benchmarks.bench_serialization [10000 100000]
+"""
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.producer import Producer
+from app.models.farm import Farm
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.producer_repository import ProducerRepository
+from app.schemas.farm import FarmResponse
+from app.schemas.pagination import Page
+from app.services.farm_service import FarmService
+from app.utils.ids import uuid7
+from app.utils.pagination import paginate
+from app.utils.profiling import ProfiledJSONResponse
+
+STATES = ["SP", "MG", "GO", "MT", "MS", "PR", "RS", "BA", "TO", "SC"]
+BATCH_SIZE = 50_000
+RUNS = 3
+
+async def seed(session, n_farms: int) -> None:
+    producer_ids = [uuid7() for _ in range(max(1, n_farms // 10))]
+    await session.execute(insert(Producer), [
+        {"id": pid, "cpf_cnpj": str(i).zfill(11), "document_number": i, "document_type": "CPF", "name": f"Produtor {i}"}
+        for i, pid in enumerate(producer_ids)
+    ])
+    for start in range(0, n_farms, BATCH_SIZE):
+        farms = []
+        for i in range(start, min(start + BATCH_SIZE, n_farms)):
+            total = Decimal(random.randint(10_000, 500_000)) / 100
+            farms.append({
+                "id": uuid7(),
+                "producer_id": random.choice(producer_ids),
+                "name": f"Fazenda {i}",
+                "city": "Ribeirão Preto",
+                "state": random.choice(STATES),
+                "total_area": total,
+                "arable_area": total / 2,
+                "vegetation_area": total / 4,
+            })
+        await session.execute(insert(Farm), farms)
+    await session.commit()
+
+async def legacy_page(repository: FarmRepository, field, limit: int) -> bytes:
+    # Implementação anterior de FarmService.get_page + serialização do FastAPI
+    farms, next_cursor = await paginate(repository, limit)
+    page = Page[FarmResponse](items=[FarmResponse.from_orm(item) for item in farms], next_cursor=next_cursor)
+    content = await serialize_response(field=field, response_content=page)
+    return JSONResponse(content).body
+
+async def fast_page(service: FarmService, limit: int) -> bytes:
+    return ProfiledJSONResponse(await service.get_page(limit)).body
+
+async def best_of(fn):
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        body = await fn()
+        timings.append(time.perf_counter() - start)
+    return body, min(timings)
+
+async def run(n_farms: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench_serialization.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(bind=engine, expire_on_commit=False)()
+    await seed(session, n_farms)
+    
+    repository = FarmRepository(session)
+    service = FarmService(repository, ProducerRepository(session))
+    field = create_response_field(name="Response_list_farms", type_=Page[FarmResponse])
+    
+    async def legacy():
+        session.expunge_all()
+        return await legacy_page(repository, field, n_farms)
+    
+    legacy_body, legacy_time = await best_of(legacy)
+    fast_body, fast_time = await best_of(lambda: fast_page(service, n_farms))
+    assert json.loads(legacy_body) == json.loads(fast_body)
+    
+    print(
+        f"{n_farms:>7} rows | from_orm + response_model + json: {legacy_time:7.3f}s"
+        f" | rows + orjson: {fast_time:7.3f}s | {legacy_time / fast_time:5.1f}x"
+        f" | {len(fast_body) / (1024 * 1024):6.1f} MB"
+    )
+    await session.close()
+    await engine.dispose()
+    os.remove(path)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for size in sizes:
+        asyncio.run(run(size))
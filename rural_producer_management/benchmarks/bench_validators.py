@@ -0,0 +1,84 @@
+"""Benchmark da validação de CPF/CNPJ: implementação original vs. escalar com
+tabelas pré-calculadas vs. validate_many (NumPy).
+
+Uso:
+    python -m benchmarks.bench_validators [1000000]
+"""
+import random
+import re
+import sys
+import time
+
+from app.utils.validators import CPF_WEIGHTS, CNPJ_WEIGHTS, validate_cpf_cnpj, validate_many
+
+def legacy_validate_cpf_cnpj(document: str) -> bool:
+    # Implementação anterior: re.sub em cada função, sum() com int() por dígito
+    # e a lista de pesos do CNPJ alterada com insert
+    document = re.sub(r'[^0-9]', '', document)
+    if len(document) == 11:
+        cpf = re.sub(r'[^0-9]', '', document)
+        if cpf == cpf[0] * 11:
+            return False
+        for i in range(9, 11):
+            value = sum((int(cpf[num]) * ((i + 1) - num) for num in range(0, i)))
+            if ((value * 10) % 11) % 10 != int(cpf[i]):
+                return False
+        return True
+    if len(document) == 14:
+        cnpj = re.sub(r'[^0-9]', '', document)
+        weights = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+        for i in range(2):
+            sum_digits = sum(int(cnpj[j]) * weights[j] for j in range(len(weights)))
+            digit = 11 - (sum_digits % 11)
+            if digit > 9:
+                digit = 0
+            if digit != int(cnpj[12 + i]):
+                return False
+            weights.insert(0, 6)
+        return True
+    return False
+
+def make_cpf(base: str) -> str:
+    for weights in CPF_WEIGHTS:
+        base += str(sum(int(d) * w for d, w in zip(base, weights)) * 10 % 11 % 10)
+    return base
+
+def make_cnpj(base: str) -> str:
+    for weights in CNPJ_WEIGHTS:
+        remainder = sum(int(d) * w for d, w in zip(base, weights)) % 11
+        base += str(0 if remainder < 2 else 11 - remainder)
+    return base
+
+def make_documents(n: int):
+    # Mistura realista: CPFs e CNPJs formatados e não formatados, ~10% inválidos
+    rng = random.Random(0)
+    documents = []
+    for i in range(n):
+        if rng.random() < 0.7:
+            cpf = make_cpf(str(rng.randrange(10**8, 10**9)))
+            document = f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}" if i % 2 else cpf
+        else:
+            cnpj = make_cnpj(str(rng.randrange(10**11, 10**12)))
+            document = f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}" if i % 2 else cnpj
+        if rng.random() < 0.1:
+            document = document[:-1] + str((int(document[-1]) + 1) % 10)
+        documents.append(document)
+    return documents
+
+def measure(label: str, fn, n: int):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s {n / elapsed:14,.0f} docs/s")
+    return list(result)
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    documents = make_documents(n)
+    
+    legacy = measure("original (escalar)", lambda: [legacy_validate_cpf_cnpj(d) for d in documents], n)
+    scalar = measure("escalar com tabelas", lambda: [validate_cpf_cnpj(d) for d in documents], n)
+    batch = measure("validate_many (NumPy)", lambda: validate_many(documents).tolist(), n)
+    
+    assert legacy == scalar == batch
+    print(f"{sum(batch):,} válidos de {n:,}")
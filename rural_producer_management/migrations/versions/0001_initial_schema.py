@@ -0,0 +1,65 @@
+"""Esquema inicial: producers, farms e cultures
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+Exatamente o esquema que o create_all dos modelos originais gerava, sem
+nada a mais: bancos criados antes do Alembic são marcados com
+"alembic stamp 0001" e recebem o resto pelo "alembic upgrade head".
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database import Timestamp
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "producers",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("cpf_cnpj", sa.String(18), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("created_at", Timestamp, server_default=sa.func.now()),
+        sa.Column("updated_at", Timestamp, server_default=sa.func.now()),
+    )
+    op.create_index("ix_producers_cpf_cnpj", "producers", ["cpf_cnpj"], unique=True)
+
+    op.create_table(
+        "farms",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("producer_id", sa.String(), sa.ForeignKey("producers.id"), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("city", sa.String(100), nullable=False),
+        sa.Column("state", sa.String(2), nullable=False),
+        sa.Column("total_area", sa.Numeric(10, 2), nullable=False),
+        sa.Column("arable_area", sa.Numeric(10, 2), nullable=False),
+        sa.Column("vegetation_area", sa.Numeric(10, 2), nullable=False),
+        sa.Column("created_at", Timestamp, server_default=sa.func.now()),
+        sa.Column("updated_at", Timestamp, server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        "cultures",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("farm_id", sa.String(), sa.ForeignKey("farms.id"), nullable=False),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("harvest_year", sa.String(9), nullable=False),
+        sa.Column("created_at", Timestamp, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cultures")
+    op.drop_table("farms")
+    op.drop_index("ix_producers_cpf_cnpj", table_name="producers")
+    op.drop_table("producers")
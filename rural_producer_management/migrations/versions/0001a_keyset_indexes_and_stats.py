@@ -0,0 +1,73 @@
+"""Índices de paginação, unicidade de culturas e tabela dashboard_stats (com backfill)
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-18 09:30:00
+
+Objetos que o create_all original não criava; separados de 0001 para que
+"alembic stamp 0001" em um banco antigo seja verdadeiro.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001a"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+KEYSET_INDEXES = [
+    ("ix_producers_created_at_id", "producers"),
+    ("ix_farms_created_at_id", "farms"),
+    ("ix_cultures_created_at_id", "cultures"),
+]
+
+
+def upgrade() -> None:
+    for name, table in KEYSET_INDEXES:
+        op.create_index(name, table, ["created_at", "id"])
+
+    # Sem a constraint, bancos antigos podem ter a mesma cultura/safra
+    # repetida na fazenda; fica a de menor id (culturas não têm filhos)
+    op.execute(
+        "DELETE FROM cultures WHERE id NOT IN "
+        "(SELECT MIN(id) FROM cultures GROUP BY farm_id, name, harvest_year)"
+    )
+    # batch: o SQLite não tem ALTER TABLE ... ADD CONSTRAINT
+    with op.batch_alter_table("cultures") as batch:
+        batch.create_unique_constraint("uq_cultures_farm_name_harvest", ["farm_id", "name", "harvest_year"])
+
+    op.create_table(
+        "dashboard_stats",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("key", sa.String(100), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column("total_area", sa.Numeric(14, 2), nullable=False),
+        sa.Column("arable_area", sa.Numeric(14, 2), nullable=False),
+        sa.Column("vegetation_area", sa.Numeric(14, 2), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.UniqueConstraint("kind", "key", name="uq_dashboard_stats_kind_key"),
+    )
+    # Backfill do read model a partir dos dados existentes: sem ele, um banco
+    # atualizado mostraria o dashboard zerado até um rebuild-dashboard-stats
+    op.execute(
+        "INSERT INTO dashboard_stats (kind, key, count, total_area, arable_area, vegetation_area) "
+        "SELECT 'state', state, COUNT(*), SUM(total_area), SUM(arable_area), SUM(vegetation_area) "
+        "FROM farms GROUP BY state"
+    )
+    op.execute(
+        "INSERT INTO dashboard_stats (kind, key, count, total_area, arable_area, vegetation_area) "
+        "SELECT 'culture', name, COUNT(*), 0, 0, 0 FROM cultures GROUP BY name"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("dashboard_stats")
+    with op.batch_alter_table("cultures") as batch:
+        batch.drop_constraint("uq_cultures_farm_name_harvest", type_="unique")
+    for name, table in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,102 @@
+"""Chave canônica do documento do produtor (document_number, document_type)
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-18 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.validators import document_key
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10_000
+
+producers = sa.table(
+    "producers",
+    sa.column("id", sa.String),
+    sa.column("cpf_cnpj", sa.String),
+    sa.column("document_number", sa.BigInteger),
+    sa.column("document_type", sa.String),
+)
+
+
+def _backfill(connection) -> None:
+    if connection.dialect.name == "postgresql":
+        # Um único UPDATE no servidor
+        connection.execute(sa.text("""
+            UPDATE producers SET
+                document_number = CAST(regexp_replace(cpf_cnpj, '[^0-9]', '', 'g') AS BIGINT),
+                document_type = CASE length(regexp_replace(cpf_cnpj, '[^0-9]', '', 'g'))
+                    WHEN 11 THEN 'CPF' WHEN 14 THEN 'CNPJ' END
+            WHERE length(regexp_replace(cpf_cnpj, '[^0-9]', '', 'g')) IN (11, 14)
+        """))
+        return
+
+    # Demais bancos: normalização em Python, em lotes
+    rows = connection.execute(sa.select(producers.c.id, producers.c.cpf_cnpj)).all()
+    updates = []
+    for id, cpf_cnpj in rows:
+        key = document_key(cpf_cnpj)
+        if key:
+            updates.append({"b_id": id, "b_number": key[0], "b_type": key[1]})
+    statement = (
+        producers.update()
+        .where(producers.c.id == sa.bindparam("b_id"))
+        .values(document_number=sa.bindparam("b_number"), document_type=sa.bindparam("b_type"))
+    )
+    for start in range(0, len(updates), BATCH_SIZE):
+        connection.execute(statement, updates[start:start + BATCH_SIZE])
+
+
+def _check(connection) -> None:
+    # Falha com uma mensagem clara em vez de um erro genérico ao criar o índice
+    invalid = connection.execute(
+        sa.select(producers.c.id, producers.c.cpf_cnpj).where(producers.c.document_number.is_(None))
+    ).all()
+    if invalid:
+        raise RuntimeError(f"Produtores com CPF/CNPJ sem 11 ou 14 dígitos: {invalid[:20]}")
+
+    duplicates = connection.execute(
+        sa.select(producers.c.document_number, producers.c.document_type, sa.func.count())
+        .group_by(producers.c.document_number, producers.c.document_type)
+        .having(sa.func.count() > 1)
+    ).all()
+    if duplicates:
+        raise RuntimeError(
+            "CPF/CNPJ duplicados em formatos diferentes; resolva antes de migrar: "
+            f"{duplicates[:20]}"
+        )
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("producers") as batch:
+        batch.add_column(sa.Column("document_number", sa.BigInteger(), nullable=True))
+        batch.add_column(sa.Column("document_type", sa.String(4), nullable=True))
+
+    connection = op.get_bind()
+    _backfill(connection)
+    _check(connection)
+
+    with op.batch_alter_table("producers") as batch:
+        batch.alter_column("document_number", existing_type=sa.BigInteger(), nullable=False)
+        batch.alter_column("document_type", existing_type=sa.String(4), nullable=False)
+        batch.drop_index("ix_producers_cpf_cnpj")
+        batch.create_index("uq_producers_document", ["document_number", "document_type"], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("producers") as batch:
+        batch.drop_index("uq_producers_document")
+        batch.create_index("ix_producers_cpf_cnpj", ["cpf_cnpj"], unique=True)
+        batch.drop_column("document_type")
+        batch.drop_column("document_number")
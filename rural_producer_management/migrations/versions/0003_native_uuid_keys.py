@@ -0,0 +1,101 @@
+"""Chaves primárias e estrangeiras como UUID nativo
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 11:00:00
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.database import UUIDType
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Colunas com ids, na ordem pai -> filho
+ID_COLUMNS = {
+    "producers": ["id"],
+    "farms": ["id", "producer_id"],
+    "cultures": ["id", "farm_id"],
+}
+# Nomes padrão do PostgreSQL para as FKs criadas em 0001
+FOREIGN_KEYS = [
+    ("farms_producer_id_fkey", "farms", "producers", "producer_id"),
+    ("cultures_farm_id_fkey", "cultures", "farms", "farm_id"),
+]
+
+
+def _convert_rows(connection, table: str, column: str, convert) -> None:
+    # SQLite: reescreve cada valor (texto <-> 16 bytes) em Python
+    rows = connection.execute(sa.text(f"SELECT DISTINCT {column} FROM {table}")).scalars().all()
+    statement = sa.text(f"UPDATE {table} SET {column} = :new WHERE {column} = :old")
+    params = [{"old": value, "new": convert(value)} for value in rows if value is not None]
+    if params:
+        connection.execute(statement, params)
+
+
+def _to_bytes(value):
+    if isinstance(value, bytes) and len(value) == 16:
+        return value
+    if isinstance(value, bytes):
+        value = value.decode()
+    return uuid.UUID(value).bytes
+
+
+def _to_text(value):
+    return str(uuid.UUID(bytes=bytes(value))) if isinstance(value, bytes) else value
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        for name, table, _, _ in reversed(FOREIGN_KEYS):
+            op.drop_constraint(name, table, type_="foreignkey")
+        for table, columns in ID_COLUMNS.items():
+            for column in columns:
+                op.alter_column(
+                    table, column,
+                    type_=postgresql.UUID(as_uuid=True),
+                    postgresql_using=f"{column}::uuid"
+                )
+        for name, table, parent, column in FOREIGN_KEYS:
+            op.create_foreign_key(name, table, parent, [column], ["id"])
+        return
+
+    # Demais bancos: converte os valores para 16 bytes e troca o tipo das
+    # colunas recriando a tabela (batch mode)
+    for table, columns in ID_COLUMNS.items():
+        for column in columns:
+            _convert_rows(connection, table, column, _to_bytes)
+        with op.batch_alter_table(table, recreate="always") as batch:
+            for column in columns:
+                batch.alter_column(column, type_=UUIDType(), existing_type=sa.String())
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        for name, table, _, _ in reversed(FOREIGN_KEYS):
+            op.drop_constraint(name, table, type_="foreignkey")
+        for table, columns in ID_COLUMNS.items():
+            for column in columns:
+                op.alter_column(table, column, type_=sa.String(), postgresql_using=f"{column}::text")
+        for name, table, parent, column in FOREIGN_KEYS:
+            op.create_foreign_key(name, table, parent, [column], ["id"])
+        return
+
+    for table, columns in ID_COLUMNS.items():
+        for column in columns:
+            _convert_rows(connection, table, column, _to_text)
+        with op.batch_alter_table(table, recreate="always") as batch:
+            for column in columns:
+                batch.alter_column(column, type_=sa.String(), existing_type=UUIDType())
@@ -0,0 +1,43 @@
+"""Índices das FKs e dos caminhos de filtro/agrupamento
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# cultures.farm_id já é a coluna líder de uq_cultures_farm_name_harvest
+INDEXES = [
+    ("ix_farms_producer_id_state", "farms", ["producer_id", "state"]),
+    ("ix_farms_state_created_at_id", "farms", ["state", "created_at", "id"]),
+    ("ix_cultures_name_harvest_year", "cultures", ["name", "harvest_year"]),
+    ("ix_cultures_harvest_farm_id", "cultures", ["harvest_year", "farm_id"]),
+]
+
+
+def upgrade() -> None:
+    # No PostgreSQL, CREATE INDEX CONCURRENTLY não bloqueia escritas nas
+    # tabelas grandes, mas não pode rodar dentro de uma transação
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,47 @@
+"""Busca de produtores por nome: pg_trgm + unaccent
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# unaccent() é STABLE e não pode ser usada em índice; o wrapper IMMUTABLE
+# fixa o dicionário para que a expressão seja indexável
+F_UNACCENT = """
+CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+"""
+
+
+def upgrade() -> None:
+    # No SQLite a busca usa o índice de trigramas em memória da aplicação
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute(F_UNACCENT)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_producers_name_trgm "
+            "ON producers USING gin (f_unaccent(lower(name)) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_producers_name_trgm")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
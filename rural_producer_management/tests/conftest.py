@@ -1,41 +1,54 @@
 import pytest
 import asyncio
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 from app.main import app
 from app.database import Base, get_db
 from app.config import settings
+from app.dependencies import get_dashboard_cache
+from app.utils.cache import CoalescingCache, InMemoryCache
 
-# Configuração do banco de teste
+# Configuração do banco de teste (SQLite/aiosqlite por padrão)
 TEST_DATABASE_URL = settings.test_database_url
-engine = create_engine(TEST_DATABASE_URL)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: o TestClient roda a aplicação em outro event loop, então cada
+# sessão abre sua própria conexão
+engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+TestingSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+async def _create_schema():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+async def _drop_schema():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+async def override_get_db():
+    async with TestingSessionLocal() as session:
+        yield session
+
+@pytest.fixture(autouse=True)
+def test_database():
+    # Banco limpo e cache vazio a cada teste
+    asyncio.run(_create_schema())
+    cache = CoalescingCache(InMemoryCache(), ttl=60)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_dashboard_cache] = lambda: cache
+    yield
+    app.dependency_overrides.clear()
+    asyncio.run(_drop_schema())
 
 @pytest.fixture
 def db_session():
-    Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
+    return TestingSessionLocal()
 
 @pytest.fixture
-def client(db_session):
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            db_session.close()
-    
-    app.dependency_overrides[get_db] = override_get_db
+def client():
     yield TestClient(app)
-    app.dependency_overrides.clear()
 
 @pytest.fixture
 def event_loop():
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
-    loop.close()
\ No newline at end of file
+    loop.close()
@@ -2,23 +2,59 @@ from app.schemas.producer import ProducerCreate
 from app.schemas.farm import FarmCreate
 from app.schemas.culture import CultureCreate
 
-MOCK_PRODUCER = ProducerCreate(
-    cpf_cnpj="12345678901",
-    name="João Silva"
-)
+MOCK_PRODUCERS = [
+    ProducerCreate(
+        cpf_cnpj="111.444.777-35",
+        name="João Silva"
+    ),
+    ProducerCreate(
+        cpf_cnpj="11.222.333/0001-81",
+        name="Empresa Rural Ltda"
+    ),
+]
 
-MOCK_FARM = FarmCreate(
-    producer_id="test-id",
-    name="Fazenda Esperança",
-    city="Ribeirão Preto",
-    state="SP",
-    total_area=1000.00,
-    arable_area=800.00,
-    vegetation_area=200.00
-)
+MOCK_FARMS = [
+    FarmCreate(
+        producer_id="test-id",
+        name="Fazenda Esperança",
+        city="Ribeirão Preto",
+        state="SP",
+        total_area=1000.00,
+        arable_area=800.00,
+        vegetation_area=200.00
+    ),
+    FarmCreate(
+        producer_id="test-id",
+        name="Fazenda Boa Vista",
+        city="Uberlândia",
+        state="MG",
+        total_area=500.00,
+        arable_area=400.00,
+        vegetation_area=100.00
+    ),
+]
 
-MOCK_CULTURE = CultureCreate(
-    farm_id="test-farm-id",
-    name="Soja",
-    harvest_year="Safra 2024"
-)
\ No newline at end of file
+MOCK_CULTURES = [
+    CultureCreate(
+        farm_id="test-farm-id",
+        name="Soja",
+        harvest_year="Safra 2024"
+    ),
+    CultureCreate(
+        farm_id="test-farm-id",
+        name="Milho",
+        harvest_year="Safra 2024"
+    ),
+]
+
+MOCK_PRODUCER = MOCK_PRODUCERS[0]
+MOCK_FARM = MOCK_FARMS[0]
+MOCK_CULTURE = MOCK_CULTURES[0]
+
+def make_cpf(seed: int) -> str:
+    # Gera um CPF válido (com dígitos verificadores) a partir de um inteiro
+    digits = [int(d) for d in str(100000000 + seed)[-9:]]
+    for length in (9, 10):
+        value = sum(d * (length + 1 - i) for i, d in enumerate(digits[:length]))
+        digits.append((value * 10) % 11 % 10)
+    return "".join(map(str, digits))
@@ -1,14 +1,26 @@
+import csv
+import io
+import json
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from fastapi.testclient import TestClient
-from app.main import app
-from tests.fixtures.mock_data import MOCK_PRODUCERS, MOCK_FARMS, MOCK_CULTURES
+from app.config import settings
+from app.main import app, create_app
+from app.dependencies import get_slow_query_log
+from app.schemas.culture import CultureResponse
+from app.schemas.farm import FarmResponse
+from app.schemas.pagination import Page
+from app.schemas.producer import ProducerResponse
+from app.utils.slow_query_log import SlowQueryLog
+from tests.fixtures.mock_data import MOCK_PRODUCERS, MOCK_FARMS, MOCK_CULTURES, make_cpf
 
 client = TestClient(app)
 
 class TestProducerAPI:
     def test_create_producer_success(self):
         # Arrange
-        producer_data = MOCK_PRODUCERS[0].dict()
+        producer_data = MOCK_PRODUCERS[0].model_dump(mode="json")
         
         # Act
         response = client.post("/producers/", json=producer_data)
@@ -23,7 +35,7 @@ class TestProducerAPI:
     
     def test_create_producer_invalid_cpf(self):
         # Arrange
-        invalid_producer = MOCK_PRODUCERS[0].dict()
+        invalid_producer = MOCK_PRODUCERS[0].model_dump(mode="json")
         invalid_producer["cpf_cnpj"] = "123.456.789-00"  # CPF inválido
         
         # Act
@@ -35,7 +47,7 @@ class TestProducerAPI:
     
     def test_create_producer_duplicate_cpf(self):
         # Arrange
-        producer_data = MOCK_PRODUCERS[0].dict()
+        producer_data = MOCK_PRODUCERS[0].model_dump(mode="json")
         
         # Act - Criar primeiro produtor
         response1 = client.post("/producers/", json=producer_data)
@@ -47,13 +59,50 @@ class TestProducerAPI:
         # Assert
         assert response2.status_code == 400
     
+    def test_create_producer_duplicate_cpf_other_format(self):
+        # Arrange
+        client.post("/producers/", json={"cpf_cnpj": "111.444.777-35", "name": "Formatado"})
+        
+        # Act - Mesmo CPF, só dígitos
+        response = client.post("/producers/", json={"cpf_cnpj": "11144477735", "name": "Sem formatação"})
+        
+        # Assert
+        assert response.status_code == 400
+    
+    @pytest.mark.parametrize("document", ["11222333000181", "11.222.333/0001-81"])
+    def test_get_producer_by_document(self, document):
+        # Arrange
+        created = client.post("/producers/", json=MOCK_PRODUCERS[1].model_dump(mode="json")).json()
+        
+        # Act
+        response = client.get(f"/producers/by-document/{document}")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["id"] == created["id"]
+        assert response.json()["cpf_cnpj"] == MOCK_PRODUCERS[1].cpf_cnpj
+    
+    def test_get_producer_by_document_not_found(self):
+        # Act
+        response = client.get("/producers/by-document/111.444.777-35")
+        
+        # Assert
+        assert response.status_code == 404
+    
+    def test_get_producer_by_document_invalid(self):
+        # Act
+        response = client.get("/producers/by-document/123")
+        
+        # Assert
+        assert response.status_code == 400
+    
     def test_get_producers_empty(self):
         # Act
         response = client.get("/producers/")
         
         # Assert
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {"items": [], "next_cursor": None}
     
     def test_get_producer_by_id_not_found(self):
         # Act
@@ -64,7 +113,7 @@ class TestProducerAPI:
     
     def test_update_producer_success(self):
         # Arrange - Criar produtor primeiro
-        producer_data = MOCK_PRODUCERS[0].dict()
+        producer_data = MOCK_PRODUCERS[0].model_dump(mode="json")
         create_response = client.post("/producers/", json=producer_data)
         producer_id = create_response.json()["id"]
         
@@ -80,7 +129,7 @@ class TestProducerAPI:
     
     def test_delete_producer_success(self):
         # Arrange - Criar produtor primeiro
-        producer_data = MOCK_PRODUCERS[0].dict()
+        producer_data = MOCK_PRODUCERS[0].model_dump(mode="json")
         create_response = client.post("/producers/", json=producer_data)
         producer_id = create_response.json()["id"]
         
@@ -94,16 +143,91 @@ class TestProducerAPI:
         get_response = client.get(f"/producers/{producer_id}")
         assert get_response.status_code == 404
 
+class TestPaginationAPI:
+    def _create_producers(self, seeds):
+        for seed in seeds:
+            response = client.post("/producers/", json={"cpf_cnpj": make_cpf(seed), "name": f"Produtor {seed}"})
+            assert response.status_code == 201
+    
+    def test_cursor_pagination_walks_all_rows(self):
+        # Arrange
+        self._create_producers(range(1, 8))
+        
+        # Act
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get("/producers/", params=params).json()
+            assert len(page["items"]) <= 3
+            seen.extend(item["id"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        
+        # Assert
+        assert len(seen) == 7
+        assert len(set(seen)) == 7
+    
+    def test_cursor_pagination_stable_under_inserts(self):
+        # Arrange
+        self._create_producers(range(1, 5))
+        first_page = client.get("/producers/", params={"limit": 2}).json()
+        
+        # Act - Inserções entre páginas não deslocam a próxima página
+        self._create_producers(range(10, 13))
+        second_page = client.get("/producers/", params={"limit": 2, "cursor": first_page["next_cursor"]}).json()
+        
+        # Assert
+        first_ids = {item["id"] for item in first_page["items"]}
+        assert not first_ids & {item["id"] for item in second_page["items"]}
+        assert len(second_page["items"]) == 2
+    
+    def test_invalid_cursor(self):
+        # Act
+        response = client.get("/producers/", params={"cursor": "not-a-cursor"})
+        
+        # Assert
+        assert response.status_code == 400
+    
+    def test_limit_is_capped(self):
+        # Act
+        response = client.get("/farms/", params={"limit": 100000})
+        
+        # Assert
+        assert response.status_code == 422
+    
+    def test_list_items_match_response_model(self):
+        # Arrange - as listagens serializam linhas sem passar pelo schema
+        producer = client.post("/producers/", json={"cpf_cnpj": make_cpf(1), "name": "Produtor Ç"}).json()
+        farm = client.post("/farms/", json={
+            "producer_id": producer["id"], "name": "Fazenda", "city": "Cidade", "state": "SP",
+            "total_area": "1000.50", "arable_area": 600, "vegetation_area": "0.25",
+        }).json()
+        culture = client.post("/cultures/", json={"farm_id": farm["id"], "name": "SOJA", "harvest_year": "Safra 2024"}).json()
+        
+        # Act / Assert - mesmo JSON dos endpoints validados pelo response_model
+        for path, created, schema in (
+            ("producers", producer, Page[ProducerResponse]),
+            ("farms", farm, Page[FarmResponse]),
+            ("cultures", culture, Page[CultureResponse]),
+        ):
+            page = client.get(f"/{path}/").json()
+            schema.model_validate(page)
+            assert page["items"] == [client.get(f"/{path}/{created['id']}").json()]
+            assert page["next_cursor"] is None
+
 class TestFarmAPI:
     def setup_method(self):
         # Criar produtor para os testes de fazenda
-        producer_data = MOCK_PRODUCERS[0].dict()
+        producer_data = MOCK_PRODUCERS[0].model_dump(mode="json")
         response = client.post("/producers/", json=producer_data)
         self.producer_id = response.json()["id"]
     
     def test_create_farm_success(self):
         # Arrange
-        farm_data = MOCK_FARMS[0].dict()
+        farm_data = MOCK_FARMS[0].model_dump(mode="json")
         farm_data["producer_id"] = self.producer_id
         
         # Act
@@ -117,7 +241,7 @@ class TestFarmAPI:
     
     def test_create_farm_invalid_areas(self):
         # Arrange
-        farm_data = MOCK_FARMS[0].dict()
+        farm_data = MOCK_FARMS[0].model_dump(mode="json")
         farm_data["producer_id"] = self.producer_id
         farm_data["arable_area"] = 900.0
         farm_data["vegetation_area"] = 200.0  # Total > 1000
@@ -130,7 +254,7 @@ class TestFarmAPI:
     
     def test_create_farm_nonexistent_producer(self):
         # Arrange
-        farm_data = MOCK_FARMS[0].dict()
+        farm_data = MOCK_FARMS[0].model_dump(mode="json")
         farm_data["producer_id"] = "non-existent-id"
         
         # Act
@@ -142,18 +266,18 @@ class TestFarmAPI:
 class TestCultureAPI:
     def setup_method(self):
         # Criar produtor e fazenda para os testes de cultura
-        producer_data = MOCK_PRODUCERS[0].dict()
+        producer_data = MOCK_PRODUCERS[0].model_dump(mode="json")
         producer_response = client.post("/producers/", json=producer_data)
         self.producer_id = producer_response.json()["id"]
         
-        farm_data = MOCK_FARMS[0].dict()
+        farm_data = MOCK_FARMS[0].model_dump(mode="json")
         farm_data["producer_id"] = self.producer_id
         farm_response = client.post("/farms/", json=farm_data)
         self.farm_id = farm_response.json()["id"]
     
     def test_create_culture_success(self):
         # Arrange
-        culture_data = MOCK_CULTURES[0].dict()
+        culture_data = MOCK_CULTURES[0].model_dump(mode="json")
         culture_data["farm_id"] = self.farm_id
         
         # Act
@@ -167,7 +291,7 @@ class TestCultureAPI:
     
     def test_create_duplicate_culture(self):
         # Arrange
-        culture_data = MOCK_CULTURES[0].dict()
+        culture_data = MOCK_CULTURES[0].model_dump(mode="json")
         culture_data["farm_id"] = self.farm_id
         
         # Act - Criar primeira cultura
@@ -202,16 +326,16 @@ class TestDashboardAPI:
     
     def test_get_dashboard_with_data(self):
         # Arrange - Criar dados de teste
-        producer_data = MOCK_PRODUCERS[0].dict()
+        producer_data = MOCK_PRODUCERS[0].model_dump(mode="json")
         producer_response = client.post("/producers/", json=producer_data)
         producer_id = producer_response.json()["id"]
         
-        farm_data = MOCK_FARMS[0].dict()
+        farm_data = MOCK_FARMS[0].model_dump(mode="json")
         farm_data["producer_id"] = producer_id
         farm_response = client.post("/farms/", json=farm_data)
         farm_id = farm_response.json()["id"]
         
-        culture_data = MOCK_CULTURES[0].dict()
+        culture_data = MOCK_CULTURES[0].model_dump(mode="json")
         culture_data["farm_id"] = farm_id
         client.post("/cultures/", json=culture_data)
         
@@ -227,6 +351,224 @@ class TestDashboardAPI:
         assert len(data["state_distribution"]) > 0
         assert len(data["culture_distribution"]) > 0
 
+class TestExportAPI:
+    def setup_method(self):
+        # Dois produtores, cada um com uma fazenda (SP e MG) e duas culturas
+        for producer, farm in zip(MOCK_PRODUCERS, MOCK_FARMS):
+            producer_id = client.post("/producers/", json=producer.model_dump(mode="json")).json()["id"]
+            farm_data = farm.model_dump(mode="json")
+            farm_data["producer_id"] = producer_id
+            farm_id = client.post("/farms/", json=farm_data).json()["id"]
+            for culture in MOCK_CULTURES:
+                culture_data = culture.model_dump(mode="json")
+                culture_data["farm_id"] = farm_id
+                client.post("/cultures/", json=culture_data)
+    
+    def _ndjson(self, response):
+        return [json.loads(line) for line in response.text.splitlines()]
+    
+    def test_export_producers_ndjson_nested(self):
+        # Act
+        response = client.get("/export/producers", params={"nested": True})
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = self._ndjson(response)
+        assert len(rows) == 2
+        for row in rows:
+            assert len(row["farms"]) == 1
+            assert {c["name"] for c in row["farms"][0]["cultures"]} == {"Soja", "Milho"}
+    
+    def test_export_producers_matches_api_response(self):
+        # Arrange
+        api_rows = {row["id"]: row for row in client.get("/producers/").json()["items"]}
+        
+        # Act
+        ndjson_rows = self._ndjson(client.get("/export/producers"))
+        csv_rows = list(csv.DictReader(io.StringIO(client.get("/export/producers", params={"format": "csv"}).text)))
+        
+        # Assert - sem colunas internas e com datas em ISO 8601 nos dois formatos
+        for rows in (ndjson_rows, csv_rows):
+            assert len(rows) == 2
+            for row in rows:
+                assert row == api_rows[row["id"]]
+    
+    def test_export_nested_uses_constant_queries(self):
+        # Arrange
+        statements = []
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+        event.listen(Engine, "before_cursor_execute", count)
+        
+        # Act
+        try:
+            response = client.get("/export/producers", params={"nested": True})
+        finally:
+            event.remove(Engine, "before_cursor_execute", count)
+        
+        # Assert - produtores, fazendas e culturas: uma consulta cada
+        assert response.status_code == 200
+        assert len(statements) == 3
+    
+    def test_export_farms_filtered_by_state(self):
+        # Act
+        response = client.get("/export/farms", params={"state": "MG"})
+        
+        # Assert
+        rows = self._ndjson(response)
+        assert [row["state"] for row in rows] == ["MG"]
+        assert "cultures" not in rows[0]
+    
+    def test_export_cultures_csv(self):
+        # Act
+        response = client.get("/export/cultures", params={"format": "csv", "state": "SP"})
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 2
+        assert {row["harvest_year"] for row in rows} == {"Safra 2024"}
+    
+    def test_export_filter_without_matches(self):
+        # Act
+        response = client.get("/export/producers", params={"harvest_year": "Safra 1999"})
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.text == ""
+    
+    def test_export_csv_nested_not_supported(self):
+        # Act
+        response = client.get("/export/producers", params={"format": "csv", "nested": True})
+        
+        # Assert
+        assert response.status_code == 400
+    
+    def test_export_unknown_entity(self):
+        # Act
+        response = client.get("/export/users")
+        
+        # Assert
+        assert response.status_code == 404
+
+class TestImportAPI:
+    def _ndjson(self, rows):
+        return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+    
+    def test_import_producers_nested_ndjson(self):
+        # Arrange
+        farm = MOCK_FARMS[0].model_dump(mode="json", exclude={"producer_id"})
+        farm["cultures"] = [{"name": "Soja", "harvest_year": "Safra 2024"}]
+        body = self._ndjson([
+            {"cpf_cnpj": make_cpf(1), "name": "Produtor 1", "farms": [farm]},
+            {"cpf_cnpj": make_cpf(2), "name": "Produtor 2"},
+            {"cpf_cnpj": "123", "name": "CPF inválido"},
+            {"cpf_cnpj": make_cpf(1), "name": "Duplicado no arquivo"},
+            "{json quebrado",
+        ])
+        
+        # Act
+        response = client.post("/import/producers", content=body)
+        
+        # Assert
+        assert response.status_code == 200
+        report = response.json()
+        assert report["inserted"] == {"producers": 2, "farms": 1, "cultures": 1}
+        assert [error["line"] for error in report["errors"]] == [3, 4, 5]
+        
+        dashboard = client.get("/dashboard/").json()
+        assert dashboard["total_farms"] == 1
+        assert dashboard["culture_distribution"] == {"Soja": 1}
+    
+    def test_import_nested_line_is_atomic(self):
+        # Arrange - Fazenda com áreas inválidas invalida a linha inteira
+        farm = MOCK_FARMS[0].model_dump(mode="json", exclude={"producer_id"})
+        farm["vegetation_area"] = "5000"
+        body = self._ndjson([{"cpf_cnpj": make_cpf(1), "name": "Produtor", "farms": [farm]}])
+        
+        # Act
+        report = client.post("/import/producers", content=body).json()
+        
+        # Assert
+        assert report["inserted"]["producers"] == 0
+        assert report["errors"][0]["line"] == 1
+    
+    def test_import_rejects_culture_repeated_in_same_line(self):
+        # Arrange - a repetição é erro da linha, não do lote
+        farm = MOCK_FARMS[0].model_dump(mode="json", exclude={"producer_id"})
+        farm["cultures"] = [{"name": "Milho", "harvest_year": "Safra 2024"}] * 2
+        body = self._ndjson([
+            {"cpf_cnpj": make_cpf(1), "name": "Produtor", "farms": [farm]},
+            {"cpf_cnpj": make_cpf(2), "name": "Outro produtor"},
+        ])
+        
+        # Act
+        report = client.post("/import/producers", content=body).json()
+        
+        # Assert
+        assert report["inserted"] == {"producers": 1, "farms": 0, "cultures": 0}
+        assert report["errors"] == [{"line": 1, "errors": ["Cultura já cadastrada para a fazenda nesta safra"]}]
+    
+    def test_import_producers_csv_rejects_existing_document(self):
+        # Arrange
+        client.post("/producers/", json=MOCK_PRODUCERS[0].model_dump(mode="json"))
+        body = f"cpf_cnpj,name\n{MOCK_PRODUCERS[0].cpf_cnpj},Repetido\n{make_cpf(3)},\"Silva, João\"\n"
+        
+        # Act
+        report = client.post("/import/producers", params={"format": "csv"}, content=body).json()
+        
+        # Assert
+        assert report["inserted"]["producers"] == 1
+        assert report["errors"] == [{"line": 2, "errors": ["CPF/CNPJ já cadastrado"]}]
+    
+    def test_import_reports_invalid_utf8_per_line(self):
+        # Arrange
+        body = f"cpf_cnpj,name\n{make_cpf(1)},\"Silva,\nJoão\"\n".encode() + b"\xff,\xfe\n"
+        
+        # Act
+        response = client.post("/import/producers", params={"format": "csv"}, content=body)
+        
+        # Assert - o nome com quebra de linha entre aspas é um registro só
+        assert response.status_code == 200
+        report = response.json()
+        assert report["inserted"]["producers"] == 1
+        assert [error["line"] for error in report["errors"]] == [4]
+    
+    def test_import_detects_duplicates_across_formats(self):
+        # Arrange
+        client.post("/producers/", json={"cpf_cnpj": "111.444.777-35", "name": "Formatado"})
+        body = self._ndjson([{"cpf_cnpj": "11144477735", "name": "Sem formatação"}])
+        
+        # Act
+        report = client.post("/import/producers", content=body).json()
+        
+        # Assert
+        assert report["inserted"]["producers"] == 0
+        assert report["errors"][0]["errors"] == ["CPF/CNPJ já cadastrado"]
+    
+    def test_import_farms_requires_existing_producer(self):
+        # Arrange
+        producer_id = client.post("/producers/", json=MOCK_PRODUCERS[0].model_dump(mode="json")).json()["id"]
+        farm = MOCK_FARMS[0].model_dump(mode="json")
+        body = self._ndjson([{**farm, "producer_id": producer_id}, {**farm, "producer_id": "nao-existe"}])
+        
+        # Act
+        report = client.post("/import/farms", content=body).json()
+        
+        # Assert
+        assert report["inserted"]["farms"] == 1
+        assert report["errors"] == [{"line": 2, "errors": ["Produtor não encontrado"]}]
+    
+    def test_import_unknown_entity(self):
+        # Act
+        response = client.post("/import/users", content="{}")
+        
+        # Assert
+        assert response.status_code == 404
+
 class TestAPIValidation:
     def test_invalid_json(self):
         # Act
@@ -264,4 +606,380 @@ class TestAPIErrors:
         response = client.patch("/producers/")  # PATCH not allowed on collection
         
         # Assert
-        assert response.status_code == 405
\ No newline at end of file
+        assert response.status_code == 405
+
+class TestFarmSearchAPI:
+    FARMS = [
+        # (nome, cidade, estado, área total, área agricultável, culturas)
+        ("Santa Rita", "Ribeirão Preto", "SP", 1000, 600, [("SOJA", "Safra 2024"), ("MILHO", "Safra 2023")]),
+        ("Boa Vista", "Ribeirão Bonito", "SP", 300, 100, [("CAFE", "Safra 2024")]),
+        ("Três Marias", "Uberaba", "MG", 2000, 1500, [("SOJA", "Safra 2023")]),
+        ("Sol Nascente", "Rio_Verde", "GO", 5000, 4000, []),
+    ]
+    
+    def _seed(self):
+        producer = client.post("/producers/", json={"cpf_cnpj": make_cpf(1), "name": "Produtor"}).json()
+        other = client.post("/producers/", json={"cpf_cnpj": make_cpf(2), "name": "Outro"}).json()
+        for index, (name, city, state, total, arable, cultures) in enumerate(self.FARMS):
+            farm = client.post("/farms/", json={
+                "producer_id": other["id"] if index == 3 else producer["id"],
+                "name": name, "city": city, "state": state,
+                "total_area": total, "arable_area": arable, "vegetation_area": 0,
+            }).json()
+            for culture, harvest_year in cultures:
+                client.post("/cultures/", json={"farm_id": farm["id"], "name": culture, "harvest_year": harvest_year})
+        return producer, other
+    
+    def _names(self, params):
+        response = client.get("/farms/search", params=params)
+        assert response.status_code == 200
+        return sorted(item["name"] for item in response.json()["items"])
+    
+    def test_filters(self):
+        # Arrange
+        producer, other = self._seed()
+        
+        # Act / Assert
+        assert self._names({"state": "SP"}) == ["Boa Vista", "Santa Rita"]
+        assert self._names({"city": "Ribeirão B"}) == ["Boa Vista"]
+        assert self._names({"city": "Rio_"}) == ["Sol Nascente"]
+        assert self._names({"city": "Ri%"}) == []
+        assert self._names({"min_total_area": 1000, "max_total_area": 2000}) == ["Santa Rita", "Três Marias"]
+        assert self._names({"min_arable_area": 1500}) == ["Sol Nascente", "Três Marias"]
+        assert self._names({"culture": "SOJA"}) == ["Santa Rita", "Três Marias"]
+        assert self._names({"culture": "SOJA", "harvest_year": "Safra 2024"}) == ["Santa Rita"]
+        assert self._names({"culture": "MILHO", "harvest_year": "Safra 2024"}) == []
+        assert self._names({"producer_id": other["id"]}) == ["Sol Nascente"]
+    
+    def test_keyset_pagination_with_filter(self):
+        # Arrange
+        self._seed()
+        
+        # Act
+        first = client.get("/farms/search", params={"max_total_area": 2000, "limit": 2}).json()
+        second = client.get("/farms/search", params={
+            "max_total_area": 2000, "limit": 2, "cursor": first["next_cursor"]
+        }).json()
+        
+        # Assert
+        assert len(first["items"]) == 2 and first["next_cursor"]
+        assert [item["name"] for item in second["items"]] == ["Três Marias"]
+        assert second["next_cursor"] is None
+        assert first["facets"] is None
+    
+    def test_facets_follow_filter(self):
+        # Arrange
+        self._seed()
+        
+        # Act
+        data = client.get("/farms/search", params={"min_total_area": 500, "facets": True}).json()
+        
+        # Assert
+        assert data["facets"]["states"] == {"SP": 1, "MG": 1, "GO": 1}
+        assert data["facets"]["cultures"] == {"SOJA": 2, "MILHO": 1}
+    
+    def test_unfiltered_facets_match_read_model(self):
+        # Arrange
+        self._seed()
+        
+        # Act
+        data = client.get("/farms/search", params={"facets": True}).json()
+        
+        # Assert
+        assert data["facets"]["states"] == {"SP": 2, "MG": 1, "GO": 1}
+        assert data["facets"]["cultures"] == {"SOJA": 2, "MILHO": 1, "CAFE": 1}
+    
+    def test_invalid_filters(self):
+        # Act / Assert
+        assert client.get("/farms/search", params={"producer_id": "abc"}).status_code == 422
+        assert client.get("/farms/search", params={"min_total_area": -1}).status_code == 422
+        assert client.get("/farms/search", params={"cursor": "###"}).status_code == 400
+
+class TestProducerSearchAPI:
+    NAMES = ["João Silva", "Joana Silveira", "Maria José Souza", "JOÃO DA SILVA SAURO", "Pedro Álvares"]
+    
+    def _seed(self):
+        for seed, name in enumerate(self.NAMES, start=1):
+            client.post("/producers/", json={"cpf_cnpj": make_cpf(seed), "name": name})
+    
+    def _search(self, params):
+        response = client.get("/producers/search", params=params)
+        assert response.status_code == 200
+        return response.json()
+    
+    def test_ignores_accents_and_case(self):
+        # Arrange
+        self._seed()
+        
+        # Act
+        results = self._search({"q": "joao silva"})
+        
+        # Assert
+        names = [item["name"] for item in results]
+        assert names[0] == "João Silva"
+        assert "JOÃO DA SILVA SAURO" in names
+        assert "Pedro Álvares" not in names
+        assert results[0]["score"] == 1.0
+        assert all(a["score"] >= b["score"] for a, b in zip(results, results[1:]))
+    
+    def test_tolerates_typos(self):
+        # Arrange
+        self._seed()
+        
+        # Act / Assert
+        assert self._search({"q": "alvarez"})[0]["name"] == "Pedro Álvares"
+    
+    def test_limit_and_no_matches(self):
+        # Arrange
+        self._seed()
+        
+        # Act / Assert
+        assert len(self._search({"q": "silva", "limit": 1})) == 1
+        assert self._search({"q": "xyzw"}) == []
+    
+    def test_index_follows_writes(self):
+        # Arrange
+        self._seed()
+        producer = self._search({"q": "pedro"})[0]
+        
+        # Act
+        client.put(f"/producers/{producer['id']}", json={"cpf_cnpj": producer["cpf_cnpj"], "name": "Paulo Cabral"})
+        
+        # Assert
+        assert self._search({"q": "pedro"}) == []
+        assert self._search({"q": "cabral"})[0]["id"] == producer["id"]
+    
+    def test_invalid_query(self):
+        assert client.get("/producers/search", params={"q": "a"}).status_code == 422
+        assert client.get("/producers/search").status_code == 422
+        assert client.get("/producers/search", params={"q": "joao", "limit": 101}).status_code == 422
+
+class TestProducerDetailAPI:
+    def _create_producer(self, seed, farms=0):
+        producer = client.post("/producers/", json={"cpf_cnpj": make_cpf(seed), "name": f"Produtor {seed}"}).json()
+        for i in range(farms):
+            farm = client.post("/farms/", json={
+                "producer_id": producer["id"], "name": f"Fazenda {i}", "city": "Sorriso", "state": "MT",
+                "total_area": 100, "arable_area": 60, "vegetation_area": 30 + i
+            }).json()
+            for harvest_year in ("Safra 2023", "Safra 2024"):
+                client.post("/cultures/", json={"farm_id": farm["id"], "name": "Soja", "harvest_year": harvest_year})
+        return producer
+    
+    def _get_full(self, producer_id):
+        statements = []
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+        event.listen(Engine, "before_cursor_execute", count)
+        try:
+            response = client.get(f"/producers/{producer_id}/full")
+        finally:
+            event.remove(Engine, "before_cursor_execute", count)
+        return response, statements
+    
+    def test_full_producer_with_farms_cultures_and_totals(self):
+        # Arrange
+        producer = self._create_producer(1, farms=3)
+        
+        # Act
+        response, _ = self._get_full(producer["id"])
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == producer["id"] and data["name"] == "Produtor 1"
+        assert [farm["name"] for farm in data["farms"]] == ["Fazenda 0", "Fazenda 1", "Fazenda 2"]
+        assert all(
+            [c["harvest_year"] for c in farm["cultures"]] == ["Safra 2023", "Safra 2024"] for farm in data["farms"]
+        )
+        totals = data["totals"]
+        assert totals["total_farms"] == 3
+        assert float(totals["total_area"]) == 300
+        assert float(totals["arable_area"]) == 180
+        assert float(totals["vegetation_area"]) == 93
+    
+    def test_uses_two_queries_regardless_of_farm_count(self):
+        # Arrange
+        few = self._create_producer(1, farms=1)
+        many = self._create_producer(2, farms=5)
+        
+        # Act
+        _, few_statements = self._get_full(few["id"])
+        _, many_statements = self._get_full(many["id"])
+        
+        # Assert - produtor + fazendas + totais; culturas
+        assert len(few_statements) == len(many_statements) == 2
+    
+    def test_producer_without_farms_has_zero_totals(self):
+        # Arrange
+        producer = self._create_producer(1)
+        
+        # Act
+        response, _ = self._get_full(producer["id"])
+        
+        # Assert
+        data = response.json()
+        assert data["farms"] == []
+        assert data["totals"]["total_farms"] == 0
+        assert float(data["totals"]["total_area"]) == 0
+    
+    def test_full_producer_not_found(self):
+        # Act
+        missing = client.get("/producers/0190a0b4-0000-7000-8000-000000000000/full")
+        malformed = client.get("/producers/not-a-uuid/full")
+        
+        # Assert
+        assert missing.status_code == malformed.status_code == 404
+
+class TestProducerBulkUpsertAPI:
+    def test_counts_inserted_updated_and_unchanged(self):
+        # Arrange
+        items = [{"cpf_cnpj": make_cpf(i), "name": f"Produtor {i}"} for i in range(3)]
+        first = client.put("/producers/bulk", json=items).json()
+        
+        # Act - reenvio com um nome alterado e um produtor novo
+        items[0]["name"] = "Produtor Renomeado"
+        items.append({"cpf_cnpj": make_cpf(3), "name": "Produtor 3"})
+        second = client.put("/producers/bulk", json=items).json()
+        
+        # Assert
+        assert first == {"inserted": 3, "updated": 0, "unchanged": 0}
+        assert second == {"inserted": 1, "updated": 1, "unchanged": 2}
+        names = {p["name"] for p in client.get("/producers/").json()["items"]}
+        assert names == {"Produtor Renomeado", "Produtor 1", "Produtor 2", "Produtor 3"}
+    
+    def test_resend_is_idempotent(self):
+        # Arrange
+        items = [{"cpf_cnpj": make_cpf(i), "name": f"Produtor {i}"} for i in range(2)]
+        client.put("/producers/bulk", json=items)
+        updated_at = {p["id"]: p["updated_at"] for p in client.get("/producers/").json()["items"]}
+        
+        # Act
+        response = client.put("/producers/bulk", json=items)
+        
+        # Assert - nada regravado
+        assert response.json() == {"inserted": 0, "updated": 0, "unchanged": 2}
+        assert {p["id"]: p["updated_at"] for p in client.get("/producers/").json()["items"]} == updated_at
+    
+    def test_matches_existing_producer_by_document_key(self):
+        # Arrange - cadastrado com máscara, reenviado sem
+        created = client.post("/producers/", json={"cpf_cnpj": "111.444.777-35", "name": "João"}).json()
+        
+        # Act
+        response = client.put("/producers/bulk", json=[
+            {"cpf_cnpj": "11144477735", "name": "João Silva"},
+            {"cpf_cnpj": "111.444.777-35", "name": "João da Silva"},
+        ])
+        
+        # Assert - um documento só; a última ocorrência vence
+        assert response.json() == {"inserted": 0, "updated": 1, "unchanged": 0}
+        assert client.get(f"/producers/{created['id']}").json()["name"] == "João da Silva"
+    
+    def test_invalid_document_rejects_batch(self):
+        # Act
+        response = client.put("/producers/bulk", json=[
+            {"cpf_cnpj": make_cpf(1), "name": "Válido"},
+            {"cpf_cnpj": "123", "name": "Inválido"},
+        ])
+        
+        # Assert
+        assert response.status_code == 422
+        assert client.get("/producers/").json()["items"] == []
+
+class TestProfilingAPI:
+    @pytest.fixture
+    def profiled_client(self):
+        profiled = create_app(profiling=True)
+        # Mesmo banco de teste configurado pelo conftest para o app principal
+        profiled.dependency_overrides = app.dependency_overrides
+        return TestClient(profiled)
+    
+    def test_server_timing_header(self, profiled_client):
+        # Arrange
+        producer = profiled_client.post("/producers/", json=MOCK_PRODUCERS[0].model_dump(mode="json")).json()
+        
+        # Act
+        response = profiled_client.get(f"/producers/{producer['id']}")
+        
+        # Assert
+        timing = response.headers["server-timing"]
+        assert timing.startswith("db;dur=")
+        assert '1 rows"' in timing
+        assert "serialize;dur=" in timing and "total;dur=" in timing
+    
+    def test_server_timing_counts_list_rows(self, profiled_client):
+        # Arrange - listagens vêm de linhas Core, não de objetos do ORM
+        for producer in MOCK_PRODUCERS[:2]:
+            profiled_client.post("/producers/", json=producer.model_dump(mode="json"))
+        
+        # Act
+        response = profiled_client.get("/producers/")
+        
+        # Assert
+        assert len(response.json()["items"]) == 2
+        assert ' 2 rows"' in response.headers["server-timing"]
+    
+    def test_metrics_histograms_per_route_template(self, profiled_client):
+        # Arrange
+        producer = profiled_client.post("/producers/", json=MOCK_PRODUCERS[0].model_dump(mode="json")).json()
+        profiled_client.get(f"/producers/{producer['id']}")
+        
+        # Act
+        response = profiled_client.get("/metrics")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = response.text
+        assert 'http_request_duration_seconds_count{method="GET",route="/producers/{producer_id}"} 1' in body
+        assert 'http_requests_total{method="POST",route="/producers/",status="201"} 1' in body
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/producers/{producer_id}",le="+Inf"} 1' in body
+        assert producer["id"] not in body
+    
+    def test_disabled_by_default(self):
+        # Act
+        response = client.get("/health")
+        
+        # Assert
+        assert "server-timing" not in response.headers
+        assert client.get("/metrics").status_code == 404
+
+class TestSlowQueryAPI:
+    def test_disabled_returns_404(self):
+        # Act
+        response = client.get("/admin/slow-queries")
+        
+        # Assert
+        assert response.status_code == 404
+    
+    def test_lists_captured_plans(self):
+        # Arrange
+        log = SlowQueryLog(threshold_ms=0, explain=True)
+        log._entries.append({"statement": "SELECT farms.state FROM farms", "plan": "SCAN farms"})
+        app.dependency_overrides[get_slow_query_log] = lambda: log
+        
+        # Act
+        response = client.get("/admin/slow-queries")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["threshold_ms"] == 0
+        assert data["entries"][0]["plan"] == "SCAN farms"
+
+
+class TestHealthAPI:
+    def test_health(self):
+        assert client.get("/health").json() == {"status": "healthy"}
+    
+    def test_pool_health_reports_usage(self):
+        # Act
+        response = client.get("/health/pool")
+        
+        # Assert
+        pool = response.json()["database_pool"]
+        assert response.status_code == 200
+        assert {"checked_out", "idle", "overflow", "wait"} <= pool.keys()
+        assert pool["size"] == settings.db_pool_size
+        assert pool["wait"]["timeouts"] == 0
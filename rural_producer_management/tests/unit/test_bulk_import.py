@@ -0,0 +1,75 @@
+import pytest
+from app.utils.bulk_import import RowDecoder, achunked, aiter_lines, csv_records
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+class TestBulkImportParsing:
+    @pytest.mark.asyncio
+    async def test_lines_split_across_chunks(self):
+        # Act
+        lines = await _collect(aiter_lines(_chunks(b'{"a": 1}\n{"b"', b': 2}\r\n', b'{"c": 3}')))
+        
+        # Assert
+        assert lines == [(1, '{"a": 1}'), (2, '{"b": 2}'), (3, '{"c": 3}')]
+    
+    @pytest.mark.asyncio
+    async def test_invalid_utf8_is_a_line_error(self):
+        # Act
+        lines = await _collect(aiter_lines(_chunks(b'{"a": 1}\n\xff\xfe\n{"c": 3}')))
+        
+        # Assert
+        assert lines[0] == (1, '{"a": 1}') and lines[2] == (3, '{"c": 3}')
+        number, error = lines[1]
+        assert number == 2 and isinstance(error, ValueError)
+    
+    @pytest.mark.asyncio
+    async def test_long_line_across_many_chunks(self):
+        # Act
+        lines = await _collect(aiter_lines(_chunks(*[b"x"] * 10_000, b"\nfim")))
+        
+        # Assert
+        assert lines == [(1, "x" * 10_000), (2, "fim")]
+    
+    @pytest.mark.asyncio
+    async def test_csv_records_keep_quoted_newlines(self):
+        # Arrange
+        lines = aiter_lines(_chunks(b'cpf_cnpj,name\n11144477735,"Silva,\nJo\xc3\xa3o ""Z"""\n22233344405,Maria\n'))
+        
+        # Act
+        records = await _collect(csv_records(lines))
+        
+        # Assert - o número é o da primeira linha do registro
+        assert records == [(1, "cpf_cnpj,name"), (2, '11144477735,"Silva,\nJoão ""Z"""'), (4, "22233344405,Maria")]
+        decoder = RowDecoder("csv")
+        decoder.is_header(records[0][1])
+        assert decoder.decode(records[1][1])["name"] == 'Silva,\nJoão "Z"'
+    
+    @pytest.mark.asyncio
+    async def test_achunked(self):
+        # Act
+        chunks = await _collect(achunked(_chunks(*range(5)), 2))
+        
+        # Assert
+        assert chunks == [[0, 1], [2, 3], [4]]
+    
+    def test_csv_decoder(self):
+        # Arrange
+        decoder = RowDecoder("csv")
+        
+        # Act
+        assert decoder.is_header("cpf_cnpj,name")
+        row = decoder.decode('11144477735,"Silva, João"')
+        
+        # Assert
+        assert row == {"cpf_cnpj": "11144477735", "name": "Silva, João"}
+        with pytest.raises(ValueError):
+            decoder.decode("1,2,3")
+    
+    def test_ndjson_decoder_rejects_non_objects(self):
+        with pytest.raises(ValueError):
+            RowDecoder("ndjson").decode("[1, 2]")
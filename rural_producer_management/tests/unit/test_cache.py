@@ -0,0 +1,158 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from app.utils.cache import InMemoryCache, RedisCache, CoalescingCache, DASHBOARD_CACHE_KEY
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+class FakeRedis:
+    # Substituto local do cliente redis.asyncio (sem expiração real)
+    def __init__(self):
+        self.data = {}
+    
+    async def get(self, key):
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+    
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+class TestInMemoryCache:
+    @pytest.mark.asyncio
+    async def test_expires_after_ttl(self):
+        # Arrange
+        clock = FakeClock()
+        cache = InMemoryCache(clock=clock)
+        await cache.set("key", {"value": 1}, ttl=10)
+        
+        # Act / Assert
+        assert await cache.get("key") == {"value": 1}
+        clock.now = 10
+        assert await cache.get("key") is None
+    
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        # Arrange
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", 1, ttl=60)
+        await cache.set("b", 2, ttl=60)
+        await cache.get("a")
+        
+        # Act
+        await cache.set("c", 3, ttl=60)
+        
+        # Assert
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
+
+class TestRedisCache:
+    @pytest.mark.asyncio
+    async def test_roundtrip_with_fake_client(self):
+        # Arrange
+        client = FakeRedis()
+        cache = RedisCache(client)
+        
+        # Act
+        await cache.set("dashboard", {"total_farms": 2}, ttl=60)
+        
+        # Assert
+        assert "rural:dashboard" in client.data
+        assert await cache.get("dashboard") == {"total_farms": 2}
+        await cache.delete("dashboard")
+        assert await cache.get("dashboard") is None
+
+class TestCoalescingCache:
+    @pytest.fixture
+    def cache(self):
+        return CoalescingCache(InMemoryCache(), ttl=60)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_trigger_single_load(self, cache):
+        # Arrange
+        calls = 0
+        
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"total_farms": 1}
+        
+        # Act
+        results = await asyncio.gather(*[
+            cache.get_or_load(DASHBOARD_CACHE_KEY, loader) for _ in range(200)
+        ])
+        
+        # Assert
+        assert calls == 1
+        assert all(result == {"total_farms": 1} for result in results)
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["coalesced"] == 199
+    
+    @pytest.mark.asyncio
+    async def test_hit_after_load_and_reload_after_invalidate(self, cache):
+        # Arrange
+        loader = AsyncMock(return_value={"total_farms": 1})
+        
+        # Act
+        await cache.get_or_load(DASHBOARD_CACHE_KEY, loader)
+        await cache.get_or_load(DASHBOARD_CACHE_KEY, loader)
+        await cache.invalidate(DASHBOARD_CACHE_KEY)
+        await cache.get_or_load(DASHBOARD_CACHE_KEY, loader)
+        
+        # Assert
+        assert loader.await_count == 2
+        assert cache.stats() == {"hits": 1, "misses": 2, "coalesced": 0, "invalidations": 1}
+    
+    @pytest.mark.asyncio
+    async def test_recently_invalidated_expires_with_pin(self):
+        # Arrange
+        clock = FakeClock()
+        cache = CoalescingCache(InMemoryCache(clock=clock), ttl=60, pin_seconds=5)
+        
+        # Act
+        before = await cache.recently_invalidated(DASHBOARD_CACHE_KEY)
+        await cache.invalidate(DASHBOARD_CACHE_KEY)
+        after = await cache.recently_invalidated(DASHBOARD_CACHE_KEY)
+        clock.now = 5
+        expired = await cache.recently_invalidated(DASHBOARD_CACHE_KEY)
+        
+        # Assert
+        assert (before, after, expired) == (False, True, False)
+    
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_discards_result(self, cache):
+        # Arrange
+        async def loader():
+            await cache.invalidate(DASHBOARD_CACHE_KEY)
+            return {"total_farms": 1}
+        
+        # Act
+        result = await cache.get_or_load(DASHBOARD_CACHE_KEY, loader)
+        
+        # Assert
+        assert result == {"total_farms": 1}
+        assert await cache._backend.get(DASHBOARD_CACHE_KEY) is None
+    
+    @pytest.mark.asyncio
+    async def test_loader_error_propagates_to_waiters(self, cache):
+        # Arrange
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+        
+        # Act
+        results = await asyncio.gather(
+            *[cache.get_or_load(DASHBOARD_CACHE_KEY, loader) for _ in range(3)],
+            return_exceptions=True
+        )
+        
+        # Assert
+        assert all(isinstance(result, RuntimeError) for result in results)
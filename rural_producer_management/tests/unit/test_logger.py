@@ -0,0 +1,113 @@
+import json
+import logging
+import queue
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.utils.logger import JsonFormatter, NonBlockingQueueHandler, RequestLoggingMiddleware, RequestSampler
+
+@pytest.fixture
+def captured():
+    # Handler de fila isolado: os registros são lidos direto da fila, sem
+    # o thread do listener
+    log_queue = queue.Queue(maxsize=2)
+    handler = NonBlockingQueueHandler(log_queue)
+    handler.addFilter(RequestSampler())
+    logger = logging.getLogger("app.tests.logger")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    yield logger, handler, log_queue
+    logger.removeHandler(handler)
+
+def drain(log_queue):
+    records = []
+    while not log_queue.empty():
+        records.append(json.loads(JsonFormatter().format(log_queue.get_nowait())))
+    return records
+
+def make_app(logger, sample_rate):
+    app = FastAPI()
+    
+    @app.get("/producers/{producer_id}")
+    async def get_producer(producer_id: str):
+        logger.info("Loading producer: %s", producer_id, extra={"producer_id": producer_id})
+        return {"id": producer_id}
+    
+    app.add_middleware(RequestLoggingMiddleware, sample_rate=sample_rate)
+    return TestClient(app)
+
+class TestStructuredLogging:
+    def test_json_record_with_lazy_args_and_extras(self, captured):
+        # Arrange
+        logger, _, log_queue = captured
+        
+        # Act
+        logger.info("Producer created: %s", "abc", extra={"producer_id": "abc"})
+        
+        # Assert
+        [record] = drain(log_queue)
+        assert record["message"] == "Producer created: abc"
+        assert record["producer_id"] == "abc"
+        assert record["level"] == "INFO" and record["logger"] == "app.tests.logger"
+    
+    def test_disabled_level_skips_formatting(self, captured):
+        # Arrange
+        logger, _, log_queue = captured
+        
+        class Explodes:
+            def __str__(self):
+                raise AssertionError("formatado com o nível desligado")
+        
+        # Act
+        logger.debug("Value: %s", Explodes())
+        
+        # Assert
+        assert log_queue.empty()
+    
+    def test_full_queue_drops_instead_of_blocking(self, captured):
+        # Arrange
+        logger, handler, log_queue = captured
+        
+        # Act
+        for i in range(5):
+            logger.info("Line %d", i)
+        
+        # Assert
+        assert log_queue.qsize() == 2
+        assert handler.dropped == 3
+    
+    def test_request_context_and_access_log(self, captured):
+        # Arrange
+        logger, _, log_queue = captured
+        access = logging.getLogger("app.access")
+        handler = logger.handlers[-1]
+        access.addHandler(handler)
+        access.setLevel(logging.INFO)
+        client = make_app(logger, sample_rate=1.0)
+        
+        # Act
+        try:
+            response = client.get("/producers/p-1", headers={"X-Request-ID": "req-42"})
+        finally:
+            access.removeHandler(handler)
+            access.setLevel(logging.NOTSET)
+        
+        # Assert - o id da requisição acompanha todas as linhas
+        assert response.headers["x-request-id"] == "req-42"
+        service, access_line = drain(log_queue)
+        assert service["request_id"] == access_line["request_id"] == "req-42"
+        assert service["producer_id"] == "p-1"
+        assert service["route"] == access_line["route"] == "/producers/{producer_id}"
+        assert access_line["status"] == 200 and access_line["duration_ms"] >= 0
+    
+    def test_unsampled_request_keeps_only_warnings(self, captured):
+        # Arrange
+        logger, _, log_queue = captured
+        client = make_app(logger, sample_rate=0.0)
+        
+        # Act
+        client.get("/producers/p-1")
+        logger.warning("Outside request")
+        
+        # Assert
+        assert [record["message"] for record in drain(log_queue)] == ["Outside request"]
@@ -0,0 +1,30 @@
+from app.utils.metrics import MetricsRegistry
+
+class TestHistogram:
+    def test_buckets_are_cumulative(self):
+        # Arrange
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latência.", ("route",), buckets=(0.1, 1.0))
+        
+        # Act
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(("/a",), value)
+        
+        # Assert
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 3' in lines
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+        assert 'latency_seconds_sum{route="/a"} 3.65' in lines
+        assert 'latency_seconds_count{route="/a"} 4' in lines
+    
+    def test_label_values_are_escaped(self):
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requisições.", ("route",))
+        
+        # Act
+        counter.inc(('/a"b\\c',))
+        
+        # Assert
+        assert 'requests_total{route="/a\\"b\\\\c"} 1' in registry.render()
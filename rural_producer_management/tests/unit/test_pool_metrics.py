@@ -0,0 +1,67 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.database import engine_options
+from app.utils.pool_metrics import MeteredAsyncQueuePool, pool_status
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MeteredAsyncQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.2
+    )
+    yield engine
+    await engine.dispose()
+
+class TestMeteredPool:
+    @pytest.mark.asyncio
+    async def test_reports_checked_out_and_idle(self, engine):
+        # Act
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            busy = pool_status(engine.sync_engine.pool)
+        idle = pool_status(engine.sync_engine.pool)
+        
+        # Assert
+        assert busy["checked_out"] == 1 and busy["idle"] == 0
+        assert idle["checked_out"] == 0 and idle["idle"] == 1
+        assert idle["size"] == 1 and idle["max_overflow"] == 0
+        assert idle["wait"]["acquired"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_records_wait_for_busy_pool(self, engine):
+        # Arrange
+        async def hold():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await asyncio.sleep(0.05)
+        
+        # Act - a segunda conexão espera a primeira ser devolvida
+        await asyncio.gather(hold(), hold())
+        
+        # Assert
+        wait = pool_status(engine.sync_engine.pool)["wait"]
+        assert wait["acquired"] == 2
+        assert wait["max_ms"] >= 40
+    
+    @pytest.mark.asyncio
+    async def test_counts_timeouts(self, engine):
+        # Act
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+        
+        # Assert
+        assert pool_status(engine.sync_engine.pool)["wait"]["timeouts"] == 1
+
+class TestEngineOptions:
+    def test_sized_pool_except_for_in_memory_sqlite(self):
+        assert engine_options("sqlite+aiosqlite://") == {}
+        assert engine_options("sqlite+aiosqlite:///:memory:") == {}
+        options = engine_options("postgresql+asyncpg://user:password@db/rural_db")
+        assert options["poolclass"] is MeteredAsyncQueuePool
+        assert options["pool_pre_ping"] is True
+        assert {"pool_size", "max_overflow", "pool_timeout", "pool_recycle"} <= options.keys()
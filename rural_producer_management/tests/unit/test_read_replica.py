@@ -0,0 +1,144 @@
+import time
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+from app.database import (
+    Base, PINNED_TO_PRIMARY, PRIMARY_PIN_COOKIE, PrimaryPinMiddleware, make_sessionmaker, use_primary, wants_primary
+)
+from app.models.producer import Producer
+from app.repositories.producer_repository import ProducerRepository
+from app.utils.ids import uuid7
+
+PRODUCER = {"cpf_cnpj": "11144477735", "document_number": 11144477735, "document_type": "CPF", "name": "João Silva"}
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    # Dois arquivos SQLite no papel de primário e réplica; sem replicação,
+    # o que foi gravado só no primário revela de onde cada leitura veio
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    for engine in (primary, replica):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+@pytest_asyncio.fixture
+async def session(engines):
+    async with make_sessionmaker(*engines)() as session:
+        yield session
+
+async def insert_producer(engine, **values) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(insert(Producer), [{**PRODUCER, "id": uuid7(), **values}])
+
+class TestReadReplicaRouting:
+    @pytest.mark.asyncio
+    async def test_reads_go_to_replica(self, engines, session):
+        # Arrange
+        primary, replica = engines
+        await insert_producer(primary, name="Só no primário")
+        await insert_producer(replica, name="Só na réplica")
+        
+        # Act
+        producers = await ProducerRepository(session).get_all()
+        
+        # Assert
+        assert [producer.name for producer in producers] == ["Só na réplica"]
+        assert not session.info.get(PINNED_TO_PRIMARY)
+    
+    @pytest.mark.asyncio
+    async def test_writes_go_to_primary_and_pin_session(self, engines, session):
+        # Arrange
+        primary, replica = engines
+        repository = ProducerRepository(session)
+        
+        # Act
+        producer = await repository.create(dict(PRODUCER))
+        
+        # Assert - a leitura seguinte na mesma sessão enxerga a escrita
+        assert session.info[PINNED_TO_PRIMARY]
+        assert (await repository.get_by_id(producer.id)).name == "João Silva"
+        async with replica.connect() as conn:
+            assert (await conn.execute(select(Producer.id))).all() == []
+    
+    @pytest.mark.asyncio
+    async def test_update_reads_from_primary(self, engines, session):
+        # Arrange - a réplica ainda não recebeu o produtor
+        primary, _ = engines
+        producer_id = uuid7()
+        await insert_producer(primary, id=producer_id)
+        
+        # Act
+        updated = await ProducerRepository(session).update(producer_id, {"name": "Novo Nome"})
+        
+        # Assert
+        assert updated is not None and updated.name == "Novo Nome"
+    
+    @pytest.mark.asyncio
+    async def test_use_primary_routes_reads_to_primary(self, engines, session):
+        # Arrange
+        primary, _ = engines
+        await insert_producer(primary)
+        
+        # Act
+        use_primary(session)
+        producers = await ProducerRepository(session).get_all()
+        
+        # Assert
+        assert len(producers) == 1
+    
+    @pytest.mark.asyncio
+    async def test_without_replica_uses_primary(self, engines):
+        # Arrange
+        primary, _ = engines
+        await insert_producer(primary)
+        
+        # Act
+        async with make_sessionmaker(primary)() as session:
+            producers = await ProducerRepository(session).get_all()
+        
+        # Assert
+        assert len(producers) == 1
+
+def make_request(method: str, cookie: str = "") -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": method, "headers": headers})
+
+class TestPrimaryPin:
+    def test_get_reads_replica_without_cookie(self):
+        assert wants_primary(make_request("GET")) is False
+        assert wants_primary(make_request("POST")) is True
+    
+    def test_cookie_pins_reads_until_it_expires(self):
+        # Arrange
+        now = time.time()
+        
+        # Act / Assert
+        assert wants_primary(make_request("GET", f"{PRIMARY_PIN_COOKIE}={now + 5}")) is True
+        assert wants_primary(make_request("GET", f"{PRIMARY_PIN_COOKIE}={now - 1}")) is False
+        assert wants_primary(make_request("GET", f"{PRIMARY_PIN_COOKIE}=lixo")) is False
+    
+    def test_middleware_sets_cookie_only_after_successful_mutation(self):
+        # Arrange
+        app = FastAPI()
+        app.add_middleware(PrimaryPinMiddleware, pin_seconds=5)
+        app.get("/items")(lambda: [])
+        app.post("/items")(lambda: {})
+        app.delete("/items")(lambda: Response(status_code=409))
+        client = TestClient(app)
+        
+        # Act
+        read = client.get("/items")
+        write = client.post("/items")
+        failed = client.delete("/items")
+        
+        # Assert
+        assert PRIMARY_PIN_COOKIE not in read.cookies
+        assert float(write.cookies[PRIMARY_PIN_COOKIE]) > time.time()
+        assert PRIMARY_PIN_COOKIE not in failed.cookies
@@ -1,13 +1,27 @@
 import pytest
+import pytest_asyncio
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
 from unittest.mock import Mock, AsyncMock, patch
+from asyncpg.exceptions import UniqueViolationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.database import Base, make_sessionmaker
 from app.repositories.producer_repository import ProducerRepository
+from app.repositories.farm_repository import FarmRepository
+from app.repositories.dashboard_stats_repository import DashboardStatsRepository
 from app.models.producer import Producer
+from app.utils.pagination import encode_cursor, decode_cursor, paginate, InvalidCursorError
 from tests.fixtures.mock_data import MOCK_PRODUCERS
 
 class TestProducerRepository:
     @pytest.fixture
     def mock_session(self):
-        return Mock()
+        session = Mock()
+        session.execute = AsyncMock(return_value=Mock())
+        return session
     
     @pytest.fixture
     def repository(self, mock_session):
@@ -16,7 +30,7 @@ class TestProducerRepository:
     @pytest.mark.asyncio
     async def test_create_producer(self, repository, mock_session):
         # Arrange
-        producer_data = MOCK_PRODUCERS[0].dict()
+        producer_data = MOCK_PRODUCERS[0].model_dump()
         mock_producer = Mock(spec=Producer)
         
         with patch.object(Producer, '__init__', return_value=None) as mock_init:
@@ -35,26 +49,158 @@ class TestProducerRepository:
     @pytest.mark.asyncio
     async def test_get_by_id(self, repository, mock_session):
         # Arrange
-        producer_id = "test-id"
+        producer_id = str(uuid4())
         mock_producer = Mock(spec=Producer)
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_producer
+        mock_session.execute.return_value.scalars.return_value.first.return_value = mock_producer
         
         # Act
         result = await repository.get_by_id(producer_id)
         
         # Assert
-        mock_session.query.assert_called_with(Producer)
+        statement = mock_session.execute.call_args[0][0]
+        assert statement.column_descriptions[0]["entity"] is Producer
         assert result == mock_producer
     
+    @pytest.mark.asyncio
+    async def test_get_by_id_malformed(self, repository, mock_session):
+        # Act
+        result = await repository.get_by_id("test-id")
+        
+        # Assert - Nenhuma consulta para um id que não é UUID
+        assert result is None
+        mock_session.execute.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_get_all(self, repository, mock_session):
         # Arrange
         mock_producers = [Mock(spec=Producer), Mock(spec=Producer)]
-        mock_session.query.return_value.all.return_value = mock_producers
+        mock_session.execute.return_value.scalars.return_value.all.return_value = mock_producers
         
         # Act
         result = await repository.get_all()
         
         # Assert
-        mock_session.query.assert_called_with(Producer)
-        assert result == mock_producers
\ No newline at end of file
+        statement = mock_session.execute.call_args[0][0]
+        assert statement.column_descriptions[0]["entity"] is Producer
+        assert result == mock_producers
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_for_update_locks_row(self, repository, mock_session):
+        # Act
+        await repository.get_by_id(uuid4(), for_update=True)
+        
+        # Assert
+        statement = mock_session.execute.call_args[0][0]
+        assert "FOR UPDATE" in str(statement.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_copy_conflict_raises_integrity_error(self, repository, mock_session):
+        # Arrange - COPY na conexão crua do asyncpg falhando por unicidade
+        connection = Mock()
+        connection.dialect.name, connection.dialect.driver = "postgresql", "asyncpg"
+        raw = Mock()
+        raw.driver_connection.copy_records_to_table = AsyncMock(side_effect=UniqueViolationError("duplicate key"))
+        connection.get_raw_connection = AsyncMock(return_value=raw)
+        mock_session.connection = AsyncMock(return_value=connection)
+        
+        # Act / Assert
+        with pytest.raises(IntegrityError) as info:
+            await repository.bulk_insert([{"id": uuid4(), "name": "João Silva"}])
+        assert isinstance(info.value.orig, UniqueViolationError)
+
+class TestFarmRepository:
+    @pytest.fixture
+    def mock_session(self):
+        session = Mock()
+        session.execute = AsyncMock(return_value=Mock())
+        return session
+    
+    @pytest.fixture
+    def repository(self, mock_session):
+        return FarmRepository(mock_session)
+    
+    @pytest.mark.asyncio
+    async def test_get_area_totals(self, repository, mock_session):
+        # Arrange
+        mock_session.execute.return_value.one.return_value = (2, 1500, 1200, 300)
+        
+        # Act
+        result = await repository.get_area_totals()
+        
+        # Assert
+        assert result == {
+            "total_farms": 2,
+            "total_area": 1500.0,
+            "arable_area": 1200.0,
+            "vegetation_area": 300.0
+        }
+    
+    @pytest.mark.asyncio
+    async def test_count_by_state(self, repository, mock_session):
+        # Arrange
+        mock_session.execute.return_value.all.return_value = [("SP", 3), ("MG", 1)]
+        
+        # Act
+        result = await repository.count_by_state()
+        
+        # Assert
+        statement = mock_session.execute.call_args[0][0]
+        assert "GROUP BY farms.state" in str(statement)
+        assert result == {"SP": 3, "MG": 1}
+
+class TestCursorPagination:
+    def test_cursor_roundtrip(self):
+        # Arrange
+        created_at = datetime(2024, 5, 1, 12, 30, 15)
+        
+        # Act
+        id = uuid4()
+        cursor = encode_cursor(created_at, id)
+        
+        # Assert
+        assert decode_cursor(cursor) == (created_at, id)
+    
+    def test_invalid_cursor(self):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("###")
+    
+    @pytest.mark.asyncio
+    async def test_paginate_returns_next_cursor_only_when_more_rows(self):
+        # Arrange
+        rows = [Mock(created_at=datetime(2024, 1, 1), id=UUID(int=i)) for i in range(3)]
+        repository = Mock()
+        repository.get_page = AsyncMock(return_value=rows)
+        
+        # Act
+        page, next_cursor = await paginate(repository, 2)
+        
+        # Assert
+        repository.get_page.assert_called_once_with(3, None, columns=None)
+        assert page == rows[:2]
+        assert decode_cursor(next_cursor) == (datetime(2024, 1, 1), UUID(int=1))
+
+class TestDashboardStatsRepository:
+    @pytest_asyncio.fixture
+    async def session(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with make_sessionmaker(engine)() as session:
+            yield session
+        await engine.dispose()
+    
+    @pytest.mark.asyncio
+    async def test_increment_inserts_then_adds(self, session):
+        # Arrange
+        repository = DashboardStatsRepository(session)
+        
+        # Act
+        await repository.add_state("SP", 1, 100, 60, 40)
+        await repository.add_state("SP", 2, 50, 30, 20)
+        await repository.add_culture("Soja")
+        
+        # Assert
+        assert await repository.get_snapshot() == {
+            ("state", "SP"): (3, Decimal("150"), Decimal("90"), Decimal("60")),
+            ("culture", "Soja"): (1, Decimal("0"), Decimal("0"), Decimal("0")),
+        }
@@ -1,10 +1,26 @@
 import pytest
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
 from unittest.mock import Mock, AsyncMock
 from app.services.producer_service import ProducerService
 from app.services.dashboard_service import DashboardService
 from app.schemas.producer import ProducerCreate, ProducerUpdate
+from app.utils.cache import CoalescingCache, InMemoryCache, DASHBOARD_CACHE_KEY
 from tests.fixtures.mock_data import MOCK_PRODUCERS
 
+def mock_orm_producer(**attrs):
+    # Mock com os atributos lidos por ProducerResponse (from_attributes)
+    producer = Mock()
+    producer.id = UUID(int=1)
+    producer.cpf_cnpj = MOCK_PRODUCERS[0].cpf_cnpj
+    producer.name = MOCK_PRODUCERS[0].name
+    producer.created_at = datetime(2024, 1, 1)
+    producer.updated_at = datetime(2024, 1, 1)
+    for field, value in attrs.items():
+        setattr(producer, field, value)
+    return producer
+
 class TestProducerService:
     @pytest.fixture
     def mock_repository(self):
@@ -18,10 +34,7 @@ class TestProducerService:
     async def test_create_producer(self, service, mock_repository):
         # Arrange
         producer_data = MOCK_PRODUCERS[0]
-        mock_producer = Mock()
-        mock_producer.id = "test-id"
-        mock_producer.name = producer_data.name
-        mock_producer.cpf_cnpj = producer_data.cpf_cnpj
+        mock_producer = mock_orm_producer(name=producer_data.name, cpf_cnpj=producer_data.cpf_cnpj)
         
         mock_repository.create = AsyncMock(return_value=mock_producer)
         
@@ -29,14 +42,14 @@ class TestProducerService:
         result = await service.create(producer_data)
         
         # Assert
-        mock_repository.create.assert_called_once_with(producer_data.dict())
+        mock_repository.create.assert_called_once_with(producer_data.model_dump())
         assert result.name == producer_data.name
         assert result.cpf_cnpj == producer_data.cpf_cnpj
     
     @pytest.mark.asyncio
     async def test_get_all_producers(self, service, mock_repository):
         # Arrange
-        mock_producers = [Mock(id="1", name="Test 1"), Mock(id="2", name="Test 2")]
+        mock_producers = [mock_orm_producer(id=UUID(int=1), name="Test 1"), mock_orm_producer(id=UUID(int=2), name="Test 2")]
         mock_repository.get_all = AsyncMock(return_value=mock_producers)
         
         # Act
@@ -51,8 +64,7 @@ class TestProducerService:
         # Arrange
         producer_id = "test-id"
         update_data = ProducerUpdate(name="Updated Name", cpf_cnpj="111.444.777-35")
-        mock_producer = Mock()
-        mock_producer.name = update_data.name
+        mock_producer = mock_orm_producer(name=update_data.name)
         
         mock_repository.update = AsyncMock(return_value=mock_producer)
         
@@ -60,7 +72,7 @@ class TestProducerService:
         result = await service.update(producer_id, update_data)
         
         # Assert
-        mock_repository.update.assert_called_once_with(producer_id, update_data.dict())
+        mock_repository.update.assert_called_once_with(producer_id, update_data.model_dump())
         assert result.name == update_data.name
     
     @pytest.mark.asyncio
@@ -75,6 +87,49 @@ class TestProducerService:
         # Assert
         mock_repository.delete.assert_called_once_with(producer_id)
         assert result is True
+    
+    @pytest.mark.asyncio
+    async def test_delete_producer_invalidates_dashboard_cache(self, mock_repository):
+        # Arrange
+        cache = Mock()
+        cache.invalidate = AsyncMock()
+        service = ProducerService(mock_repository, cache)
+        mock_repository.delete = AsyncMock(return_value=True)
+        
+        # Act
+        await service.delete("test-id")
+        
+        # Assert
+        cache.invalidate.assert_called_once_with(DASHBOARD_CACHE_KEY)
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_skips_unchanged_rows(self, mock_repository):
+        # Arrange - o primeiro já existe igual, o segundo com outro nome
+        cache = Mock()
+        cache.invalidate = AsyncMock()
+        service = ProducerService(mock_repository, cache)
+        items = [
+            ProducerCreate(cpf_cnpj="111.444.777-35", name="Igual"),
+            ProducerCreate(cpf_cnpj="222.333.444-05", name="Novo Nome"),
+            ProducerCreate(cpf_cnpj="529.982.247-25", name="Novo"),
+        ]
+        mock_repository.current_contents = AsyncMock(side_effect=[
+            {(11144477735, "CPF"): ("111.444.777-35", "Igual"), (22233344405, "CPF"): ("222.333.444-05", "Antigo")},
+            {},
+        ])
+        mock_repository.upsert_many = AsyncMock(side_effect=lambda rows: {
+            (row["document_number"], row["document_type"]) for row in rows
+        })
+        mock_repository.commit = AsyncMock()
+        
+        # Act
+        result = await service.bulk_upsert(items, chunk_size=2)
+        
+        # Assert - dois lotes; a linha igual não é enviada ao upsert
+        sent = [[row["name"] for row in call.args[0]] for call in mock_repository.upsert_many.call_args_list]
+        assert sent == [["Novo Nome"], ["Novo"]]
+        assert result.model_dump() == {"inserted": 1, "updated": 1, "unchanged": 1}
+        cache.invalidate.assert_called_once_with(DASHBOARD_CACHE_KEY)
 
 class TestDashboardService:
     @pytest.fixture
@@ -86,22 +141,53 @@ class TestDashboardService:
         return Mock()
     
     @pytest.fixture
-    def service(self, mock_farm_repo, mock_culture_repo):
-        return DashboardService(mock_farm_repo, mock_culture_repo)
+    def mock_stats_repo(self):
+        return Mock()
+    
+    @pytest.fixture
+    def service(self, mock_farm_repo, mock_culture_repo, mock_stats_repo):
+        return DashboardService(mock_farm_repo, mock_culture_repo, mock_stats_repo)
     
     @pytest.mark.asyncio
-    async def test_get_dashboard_data(self, service, mock_farm_repo, mock_culture_repo):
+    async def test_get_dashboard_data_uses_cache(self, mock_farm_repo, mock_culture_repo, mock_stats_repo):
         # Arrange
-        mock_farms = [
-            Mock(total_area=1000.0, arable_area=800.0, vegetation_area=200.0, state="SP"),
-            Mock(total_area=500.0, arable_area=400.0, vegetation_area=100.0, state="MG")
-        ]
-        mock_cultures = [
-            Mock(name="SOJA"), Mock(name="MILHO"), Mock(name="SOJA")
-        ]
+        cache = CoalescingCache(InMemoryCache(), ttl=60)
+        service = DashboardService(mock_farm_repo, mock_culture_repo, mock_stats_repo, cache)
+        mock_stats_repo.get_all = AsyncMock(return_value=[])
+        
+        # Act
+        await service.get_dashboard_data()
+        await service.get_dashboard_data()
         
-        mock_farm_repo.get_all = AsyncMock(return_value=mock_farms)
-        mock_culture_repo.get_all = AsyncMock(return_value=mock_cultures)
+        # Assert
+        mock_stats_repo.get_all.assert_called_once()
+        assert cache.stats()["hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_reload_after_invalidation_reads_primary(self, mock_farm_repo, mock_culture_repo, mock_stats_repo):
+        # Arrange
+        cache = CoalescingCache(InMemoryCache(), ttl=60, pin_seconds=5)
+        service = DashboardService(mock_farm_repo, mock_culture_repo, mock_stats_repo, cache)
+        mock_stats_repo.get_all = AsyncMock(return_value=[])
+        
+        # Act
+        await service.get_dashboard_data()
+        mock_stats_repo.use_primary.assert_not_called()
+        await cache.invalidate(DASHBOARD_CACHE_KEY)
+        await service.get_dashboard_data()
+        
+        # Assert
+        mock_stats_repo.use_primary.assert_called_once_with()
+    
+    @pytest.mark.asyncio
+    async def test_get_dashboard_data(self, service, mock_stats_repo):
+        # Arrange
+        mock_stats_repo.get_all = AsyncMock(return_value=[
+            Mock(kind="state", key="SP", count=1, total_area=1000.0, arable_area=800.0, vegetation_area=200.0),
+            Mock(kind="state", key="MG", count=1, total_area=500.0, arable_area=400.0, vegetation_area=100.0),
+            Mock(kind="culture", key="SOJA", count=2, total_area=0, arable_area=0, vegetation_area=0),
+            Mock(kind="culture", key="MILHO", count=1, total_area=0, arable_area=0, vegetation_area=0)
+        ])
         
         # Act
         result = await service.get_dashboard_data()
@@ -109,6 +195,59 @@ class TestDashboardService:
         # Assert
         assert result["total_farms"] == 2
         assert result["total_hectares"] == 1500.0
-        assert "state_distribution" in result
-        assert "culture_distribution" in result
-        assert "land_use" in result
\ No newline at end of file
+        assert result["state_distribution"] == {"SP": 1, "MG": 1}
+        assert result["culture_distribution"] == {"SOJA": 2, "MILHO": 1}
+        assert result["land_use"] == {"arable": 1200.0, "vegetation": 300.0}
+    
+    @pytest.mark.asyncio
+    async def test_get_dashboard_data_does_not_scan_tables(self, service, mock_farm_repo, mock_culture_repo, mock_stats_repo):
+        # Arrange
+        mock_stats_repo.get_all = AsyncMock(return_value=[])
+        mock_farm_repo.get_all = AsyncMock()
+        mock_culture_repo.get_all = AsyncMock()
+        mock_farm_repo.get_area_totals = AsyncMock()
+        
+        # Act
+        result = await service.get_dashboard_data()
+        
+        # Assert
+        mock_farm_repo.get_all.assert_not_called()
+        mock_culture_repo.get_all.assert_not_called()
+        mock_farm_repo.get_area_totals.assert_not_called()
+        assert result["total_farms"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_rebuild_stats_detects_drift(self, service, mock_farm_repo, mock_culture_repo, mock_stats_repo):
+        # Arrange
+        mock_farm_repo.aggregate_by_state = AsyncMock(return_value={"SP": (2, 1500, 1200, 300)})
+        mock_culture_repo.count_by_name = AsyncMock(return_value={"SOJA": 1})
+        mock_stats_repo.get_snapshot = AsyncMock(return_value={
+            ("state", "SP"): (1, Decimal("1000"), Decimal("800"), Decimal("200")),
+            ("culture", "SOJA"): (1, Decimal("0"), Decimal("0"), Decimal("0"))
+        })
+        mock_stats_repo.replace_all = AsyncMock()
+        
+        # Act
+        drift = await service.rebuild_stats()
+        
+        # Assert
+        assert len(drift) == 1
+        assert drift[0].startswith("state:SP")
+        mock_stats_repo.replace_all.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_rebuild_stats_check_only(self, service, mock_farm_repo, mock_culture_repo, mock_stats_repo):
+        # Arrange
+        mock_farm_repo.aggregate_by_state = AsyncMock(return_value={"SP": (1, 1000, 800, 200)})
+        mock_culture_repo.count_by_name = AsyncMock(return_value={})
+        mock_stats_repo.get_snapshot = AsyncMock(return_value={
+            ("state", "SP"): (1, Decimal("1000.00"), Decimal("800.00"), Decimal("200.00"))
+        })
+        mock_stats_repo.replace_all = AsyncMock()
+        
+        # Act
+        drift = await service.rebuild_stats(check_only=True)
+        
+        # Assert
+        assert drift == []
+        mock_stats_repo.replace_all.assert_not_called()
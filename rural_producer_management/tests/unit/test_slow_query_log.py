@@ -0,0 +1,103 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app.database import Base
+from app.repositories.farm_repository import FarmRepository
+from app.utils.slow_query_log import SlowQueryLog, normalize_statement, parameter_shape
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine, async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
+
+class TestSlowQueryHelpers:
+    def test_normalize_collapses_in_lists_and_whitespace(self):
+        # Act
+        short = normalize_statement("SELECT id\n  FROM farms WHERE id IN (?, ?)")
+        long = normalize_statement("SELECT id FROM farms WHERE id IN (?, ?, ?, ?)")
+        
+        # Assert
+        assert short == long == "SELECT id FROM farms WHERE id IN (...)"
+    
+    def test_parameter_shape_hides_values(self):
+        # Act
+        shape = parameter_shape({"cpf_cnpj": "111.444.777-35", "limit": 10})
+        many = parameter_shape([("a", 1), ("b", 2)], executemany=True)
+        
+        # Assert
+        assert shape == {"cpf_cnpj": "str", "limit": "int"}
+        assert many == "2 x ['str', 'int']"
+
+class TestSlowQueryLog:
+    @pytest.mark.asyncio
+    async def test_captures_plan_once_with_repository_call_site(self, session_factory):
+        # Arrange
+        engine, factory = session_factory
+        log = SlowQueryLog(threshold_ms=0, explain=True)
+        log.install(engine.sync_engine)
+        
+        # Act
+        async with factory() as session:
+            await FarmRepository(session).count_by_state()
+            await FarmRepository(session).count_by_state()
+        
+        # Assert
+        entries = log.entries()
+        assert len(entries) == 1
+        assert entries[0]["call_site"].startswith("FarmRepository.count_by_state:")
+        assert "farms" in entries[0]["plan"]
+        assert entries[0]["statement"].startswith("SELECT farms.state")
+    
+    @pytest.mark.asyncio
+    async def test_below_threshold_is_ignored(self, session_factory):
+        # Arrange
+        engine, factory = session_factory
+        log = SlowQueryLog(threshold_ms=60_000, explain=True)
+        log.install(engine.sync_engine)
+        
+        # Act
+        async with factory() as session:
+            await FarmRepository(session).count_by_state()
+        
+        # Assert
+        assert log.entries() == []
+    
+    @pytest.mark.asyncio
+    async def test_ring_buffer_keeps_latest(self, session_factory):
+        # Arrange
+        engine, factory = session_factory
+        log = SlowQueryLog(threshold_ms=0, explain=True, buffer_size=1)
+        log.install(engine.sync_engine)
+        
+        # Act
+        async with factory() as session:
+            await FarmRepository(session).count_by_state()
+            await FarmRepository(session).get_area_totals()
+        
+        # Assert
+        entries = log.entries()
+        assert len(entries) == 1
+        assert entries[0]["call_site"].startswith("FarmRepository.get_area_totals:")
+    
+    @pytest.mark.asyncio
+    async def test_failed_statement_leaves_no_timing_behind(self, session_factory):
+        # Arrange
+        engine, factory = session_factory
+        log = SlowQueryLog(threshold_ms=0)
+        log.install(engine.sync_engine)
+        
+        # Act
+        async with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                await conn.execute(text("SELECT * FROM tabela_inexistente"))
+            await conn.execute(text("SELECT 1"))
+            info = dict(conn.sync_connection.info)
+        
+        # Assert - o início da consulta que falhou não fica na conexão
+        assert info == {}
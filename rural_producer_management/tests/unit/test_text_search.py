@@ -0,0 +1,45 @@
+from app.utils.text_search import TrigramIndex, normalize_name, trigrams
+
+class TestNormalizeName:
+    def test_removes_accents_case_and_punctuation(self):
+        assert normalize_name("  João  D'Ávila-SOUZA ") == "joao d avila souza"
+    
+    def test_trigrams_are_padded_per_word(self):
+        assert trigrams("ab cd") == {"  a", " ab", "ab ", "  c", " cd", "cd "}
+
+class TestTrigramIndex:
+    def _index(self):
+        index = TrigramIndex()
+        index.rebuild([(1, "João Silva"), (2, "Joana Silveira"), (3, "Maria Souza")], signature=(3,))
+        return index
+    
+    def test_ranks_exact_words_first(self):
+        # Arrange
+        index = self._index()
+        
+        # Act
+        results = index.search("JOAO silva", limit=10)
+        
+        # Assert
+        assert results[0] == (1, 1.0)
+        assert 3 not in [key for key, _ in results]
+    
+    def test_threshold_and_limit(self):
+        # Arrange
+        index = self._index()
+        
+        # Act / Assert
+        assert [key for key, _ in index.search("silv", limit=1)] == [1]
+        assert index.search("silv", limit=10, threshold=1.0) == []
+        assert index.search("!!", limit=10) == []
+    
+    def test_invalidate_clears_signature(self):
+        # Arrange
+        index = self._index()
+        
+        # Act
+        index.invalidate()
+        
+        # Assert
+        assert index.signature is None
+        assert len(index) == 3
@@ -0,0 +1,117 @@
+import random
+import re
+import pytest
+from pydantic import ValidationError
+from app.models.producer import Producer
+from app.schemas.farm import FarmCreate
+from app.utils.validators import CNPJ, CPF, document_key, validate_cpf, validate_cnpj, validate_cpf_cnpj, validate_many
+from tests.fixtures.mock_data import make_cpf
+
+def legacy_validate_cpf_cnpj(document: str) -> bool:
+    # Implementação original, mantida como referência de equivalência
+    document = re.sub(r'[^0-9]', '', document)
+    if len(document) == 11:
+        if document == document[0] * 11:
+            return False
+        for i in range(9, 11):
+            value = sum((int(document[num]) * ((i + 1) - num) for num in range(0, i)))
+            if ((value * 10) % 11) % 10 != int(document[i]):
+                return False
+        return True
+    if len(document) == 14:
+        weights = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+        for i in range(2):
+            sum_digits = sum(int(document[j]) * weights[j] for j in range(len(weights)))
+            digit = 11 - (sum_digits % 11)
+            if digit > 9:
+                digit = 0
+            if digit != int(document[12 + i]):
+                return False
+            weights.insert(0, 6)
+        return True
+    return False
+
+def random_documents(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.3:
+            documents.append(make_cpf(rng.randrange(10**9)))
+        elif kind < 0.5:
+            base = "".join(rng.choice("0123456789") for _ in range(12))
+            # Metade com dígitos verificadores corretos
+            for weights in ([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]):
+                remainder = sum(int(d) * w for d, w in zip(base, weights)) % 11
+                base += str(0 if remainder < 2 else 11 - remainder)
+            documents.append(base if rng.random() < 0.5 else base[:-1] + str((int(base[-1]) + 1) % 10))
+        elif kind < 0.6:
+            documents.append(rng.choice("0123456789") * rng.choice([11, 14]))
+        elif kind < 0.7:
+            cpf = make_cpf(rng.randrange(10**9))
+            documents.append(f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}")
+        else:
+            length = rng.choice([0, 5, 10, 11, 12, 14, 15])
+            documents.append("".join(rng.choice("0123456789./- a") for _ in range(length)))
+    return documents
+
+class TestValidators:
+    def test_known_documents(self):
+        assert validate_cpf("111.444.777-35")
+        assert not validate_cpf("111.444.777-36")
+        assert not validate_cpf("111.111.111-11")
+        assert validate_cnpj("11.222.333/0001-81")
+        assert not validate_cnpj("11.222.333/0001-82")
+        assert not validate_cpf_cnpj("123")
+    
+    def test_scalar_matches_legacy_implementation(self):
+        for document in random_documents(5000):
+            assert validate_cpf_cnpj(document) == legacy_validate_cpf_cnpj(document), document
+    
+    def test_validate_many_matches_scalar(self):
+        # Arrange
+        documents = random_documents(5000, seed=7)
+        
+        # Act
+        mask = validate_many(documents)
+        
+        # Assert
+        assert mask.tolist() == [validate_cpf_cnpj(document) for document in documents]
+    
+    @pytest.mark.parametrize("documents", [[], ["123"], ["111.444.777-35"], ["11222333000181"]])
+    def test_validate_many_small_inputs(self, documents):
+        assert validate_many(documents).tolist() == [validate_cpf_cnpj(d) for d in documents]
+    
+    def test_document_key(self):
+        assert document_key("111.444.777-35") == document_key("11144477735") == (11144477735, CPF)
+        assert document_key("00.000.000/0001-91") == (191, CNPJ)
+        assert document_key("000.000.001-91") == (191, CPF)
+        assert document_key("123") is None
+    
+    def test_producer_model_rejects_document_without_key(self):
+        with pytest.raises(ValueError, match="CPF/CNPJ inválido"):
+            Producer(cpf_cnpj="123", name="João")
+
+class TestFarmSchema:
+    FARM = {
+        "producer_id": "p", "name": "Fazenda", "city": "Cidade", "state": "SP",
+        "total_area": "100", "arable_area": "60", "vegetation_area": "40",
+    }
+    
+    def test_area_sum_checked_after_all_fields(self):
+        # A checagem entre campos não depende da ordem dos campos
+        farm = FarmCreate(**self.FARM)
+        assert farm.arable_area + farm.vegetation_area == farm.total_area
+        
+        with pytest.raises(ValidationError) as exc:
+            FarmCreate(**{**self.FARM, "arable_area": "61"})
+        
+        assert [error["loc"] for error in exc.value.errors()] == [()]
+        assert "Soma das áreas" in exc.value.errors()[0]["msg"]
+    
+    def test_field_errors_skip_area_sum(self):
+        with pytest.raises(ValidationError) as exc:
+            FarmCreate(**{**self.FARM, "state": "sp", "total_area": "x"})
+        
+        assert {error["loc"] for error in exc.value.errors()} == {("state",), ("total_area",)}
+